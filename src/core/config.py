@@ -2,9 +2,14 @@ import json
 import os
 import sys
 import logging
+import functools
 
+@functools.cache
 def get_app_data_dir():
-    """Return the platform-specific directory for persistent application data."""
+    """Return the platform-specific directory for persistent application data.
+
+    Depends only on the install location, so it is resolved (and created) once.
+    """
     if getattr(sys, 'frozen', False):
         # Running as a PyInstaller bundle (portable mode)
         # On Windows/Linux, sys.executable is the binary itself.
@@ -21,6 +26,23 @@ def get_app_data_dir():
     os.makedirs(path, exist_ok=True)
     return path
 
+@functools.cache
+def get_app_dirs():
+    """Return {name: path} for the user-facing app folders.
+
+    Resolved on first call, after main.py has settled the working directory,
+    and fixed for the rest of the session.
+    """
+    root = os.getcwd()
+    return {
+        "root": root,
+        "videos": os.path.join(root, "video"),
+        "sequences": os.path.join(get_app_data_dir(), "sequences"),
+        "journals": os.path.join(root, "journals"),
+        "captures": os.path.join(root, "captures"),
+        "audio": os.path.join(root, "audio"),
+    }
+
 SETTINGS_FILE = os.path.join(get_app_data_dir(), "settings.json")
 
 DEFAULT_SETTINGS = {
@@ -406,8 +406,9 @@ def handle_play_random_audio(config):
 def handle_kill_black_screen(config):
     """Handle kill_black_screen action - closes the black overlay via signal file.
     
-    The overlay (BlackBoxOverlay) polls for a 'kill_overlay.signal' file
-    every 500ms. We just create the file and the overlay closes itself.
+    The overlay (BlackBoxOverlay) watches for a 'kill_overlay.signal' file
+    (watchdog, raw inotify on Linux, or polling as a last resort). We just
+    create the file and the overlay closes itself.
     No xdotool, no pyautogui, no dialogs, no permissions needed.
     """
     try:
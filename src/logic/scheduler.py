@@ -36,6 +36,17 @@ class AlarmScheduler:
             return self.platform_scheduler.add_alarm(alarm_time, sequence_name, days or [], one_time=one_time)
         return False, "No platform scheduler available"
 
+    def add_alarms(self, specs):
+        """Add several alarms at once. Each spec is (alarm_time, sequence_name, days, one_time).
+        Returns a list of (Success, Message), one per spec."""
+        if not self.platform_scheduler:
+            return [(False, "No platform scheduler available")] * len(specs)
+        specs = [(t, name, days or [], one_time) for t, name, days, one_time in specs]
+        if hasattr(self.platform_scheduler, 'add_alarms'):
+            return self.platform_scheduler.add_alarms(specs)
+        return [self.platform_scheduler.add_alarm(t, name, days, one_time=one_time)
+                for t, name, days, one_time in specs]
+
     def list_alarms(self):
         if self.platform_scheduler:
             return self.platform_scheduler.list_alarms()
@@ -47,6 +58,16 @@ class AlarmScheduler:
             return self.platform_scheduler.remove_alarm(sequence_name, time_str, days_str=days_str)
         return False, "No platform scheduler available"
 
+    def remove_alarms(self, specs):
+        """Remove several alarms at once. Each spec is (sequence_name, time_str, days_str).
+        Returns a list of (Success, Message), one per spec."""
+        if not self.platform_scheduler:
+            return [(False, "No platform scheduler available")] * len(specs)
+        if hasattr(self.platform_scheduler, 'remove_alarms'):
+            return self.platform_scheduler.remove_alarms(specs)
+        return [self.platform_scheduler.remove_alarm(name, time_str, days_str=days_str)
+                for name, time_str, days_str in specs]
+
     def get_debug_info(self):
         """Get debug info from platform scheduler if available."""
         if self.platform_scheduler and hasattr(self.platform_scheduler, 'get_debug_info'):
@@ -153,10 +153,12 @@ def main():
                             deleted = False
 
                             if args.job_id:
-                                plist_file = os.path.join(plist_dir, f"{label_prefix}.{args.job_id}.plist")
-                                if os.path.exists(plist_file):
+                                # Current plists are named <prefix>.<job_id>.<HHMM>.plist,
+                                # older ones <prefix>.<job_id>.plist
+                                for plist_file in glob.glob(
+                                        os.path.join(plist_dir, f"{label_prefix}.{args.job_id}*.plist")):
                                     _sp.run(["launchctl", "unload", plist_file],
-                                            capture_output=True)
+                                            stdout=_sp.DEVNULL, stderr=_sp.DEVNULL)
                                     os.remove(plist_file)
                                     logging.info(f"Deleted launchd plist by job-id: {args.job_id}")
                                     deleted = True
@@ -172,7 +174,7 @@ def main():
                                         if (env.get("PCVA_SEQUENCE") == args.execute_sequence
                                                 and env.get("PCVA_ONE_TIME") == "1"):
                                             _sp.run(["launchctl", "unload", plist_file],
-                                                    capture_output=True)
+                                                    stdout=_sp.DEVNULL, stderr=_sp.DEVNULL)
                                             os.remove(plist_file)
                                             logging.info(f"Deleted launchd plist by sequence name: {plist_file}")
                                             deleted = True
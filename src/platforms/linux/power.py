@@ -1,13 +1,40 @@
 import logging
 import os
+import shutil
+import signal
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.interfaces import PowerManager
 from logic.media_utils import get_clean_env
 
+try:
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    _HAS_JEEPNEY = True
+except ImportError:
+    _HAS_JEEPNEY = False
+
+# DBus inhibit endpoints: method tag -> (object path, bus name, interface, release method)
+_DBUS_TARGETS = {
+    'gnome-dbus': ('/org/gnome/SessionManager',
+                   'org.gnome.SessionManager',
+                   'org.gnome.SessionManager',
+                   'Uninhibit'),
+    'kde-dbus': ('/org/freedesktop/PowerManagement/Inhibit',
+                 'org.kde.Solid.PowerManagement.PolicyAgent',
+                 'org.kde.Solid.PowerManagement.PolicyAgent',
+                 'ReleaseInhibition'),
+    'freedesktop-dbus': ('/org/freedesktop/ScreenSaver',
+                         'org.freedesktop.ScreenSaver',
+                         'org.freedesktop.ScreenSaver',
+                         'UnInhibit'),
+}
+
 class LinuxPowerManager(PowerManager):
     """Linux power manager with multi-strategy sleep inhibition.
-    
+
     Tries multiple methods to maximize compatibility across:
     - X11 (xset)
     - Wayland (DBus)
@@ -15,196 +42,256 @@ class LinuxPowerManager(PowerManager):
     - KDE (PowerManagement DBus)
     - systemd (systemd-inhibit CLI)
     - Any freedesktop.org-compliant DE
-    
+
     See: COMMON_ISSUES.md for known issues with permissions and environments.
     """
+    _caps = None  # Which strategies can work on this machine, probed once per process
+    _systemd_inhibit_path = None
+
     def __init__(self):
-        self.inhibit_proc = None      # For systemd-inhibit subprocess
+        self.inhibit_proc = None      # PID of the systemd-inhibit holder process
         self.inhibit_cookie = None    # For DBus inhibit cookie
         self.bus_connection = None    # Keep DBus connection alive
         self._restored_screensaver = False
         self._inhibit_method = None   # Track which method succeeded
+        self._lock = threading.Lock() # Guards state against late-finishing strategies
+        self._generation = 0          # Bumped on uninhibit so stale strategy results get released
 
     def inhibit_sleep(self, reason: str = "Video Alarm Active") -> bool:
         """
-        Inhibits sleep using multiple methods (tries all, uses first success):
+        Inhibits sleep using multiple methods, all probed concurrently:
         1. systemd-inhibit (CLI) — works on all systemd distros, no GUI needed
         2. xset (X11) — disables DPMS/screensaver on X11
         3. GNOME SessionManager DBus — native GNOME inhibit
         4. KDE PowerManagement DBus — native KDE inhibit
         5. freedesktop ScreenSaver DBus — generic freedesktop fallback
+
+        Returns as soon as the first method succeeds. Only one lock-holding
+        method (systemd-inhibit or a DBus cookie) is kept; any other lock that
+        succeeds later is released again. xset complements whichever lock wins.
         """
+        if LinuxPowerManager._caps is None:
+            LinuxPowerManager._probe_caps()
+        caps = LinuxPowerManager._caps
+
+        strategies = []
+        if caps['systemd']:
+            strategies.append(('systemd-inhibit', self._try_systemd_inhibit))
+        if caps['xset']:
+            strategies.append(('xset', self._try_xset))
+        if caps['dbus']:
+            strategies.append(('gnome-dbus', self._try_gnome_dbus))
+            strategies.append(('kde-dbus', self._try_kde_dbus))
+            strategies.append(('freedesktop-dbus', self._try_fdo_dbus))
+
+        if not strategies:
+            logging.error("No sleep inhibition method available on this system! The system may go to sleep during the alarm.")
+            return False
+
+        generation = self._generation
+
+        pool = ThreadPoolExecutor(max_workers=len(strategies), thread_name_prefix="inhibit")
+        futures = {pool.submit(attempt, reason): method for method, attempt in strategies}
+        pool.shutdown(wait=False)
+
         success = False
-        
-        # Method 1: systemd-inhibit (CLI) — Most robust, works headless too
-        if not success:
-            try:
-                # systemd-inhibit runs a subprocess and holds the inhibit lock
-                # until the subprocess exits. We use 'sleep infinity' to hold it.
-                self.inhibit_proc = subprocess.Popen(
-                    ['systemd-inhibit', '--what=idle:sleep:handle-lid-switch',
-                     f'--why={reason}', '--who=PyCronVideoAlarm',
-                     'sleep', 'infinity'],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=get_clean_env()
-                )
-                logging.info("Inhibited sleep via systemd-inhibit CLI")
-                self._inhibit_method = 'systemd-inhibit'
+        pending = set(futures)
+        for future in as_completed(futures):
+            pending.discard(future)
+            if self._claim(generation, futures[future], future.result()):
                 success = True
-            except FileNotFoundError:
-                logging.debug("systemd-inhibit not found")
-            except Exception as e:
-                logging.debug(f"systemd-inhibit failed: {e}")
-        
-        # Method 2: xset (Disable DPMS and Screensaver) — X11 only
-        if not success or os.environ.get('DISPLAY'):
-            try:
-                display = os.environ.get('DISPLAY')
-                if display:
-                    subprocess.run(['xset', '-dpms'], check=False, capture_output=True, env=get_clean_env())
-                    subprocess.run(['xset', 's', 'off'], check=False, capture_output=True, env=get_clean_env())
-                    logging.info("Disabled DPMS and screensaver via xset")
-                    self._restored_screensaver = True
-                    success = True
-            except FileNotFoundError:
-                logging.debug("xset not found (not X11?)")
-            except Exception as e:
-                logging.warning(f"xset inhibit failed: {e}")
+                break
+
+        # Don't wait for slow strategies — adopt or release them whenever they finish
+        for future in pending:
+            future.add_done_callback(
+                lambda f, method=futures[future]: self._claim(generation, method, f.result()))
 
-        # Method 3: GNOME SessionManager DBus — Works on GNOME/Wayland
-        if not success:
-            try:
-                from jeepney import DBusAddress, new_method_call
-                from jeepney.io.blocking import open_dbus_connection
-                
-                connection = open_dbus_connection(bus='SESSION')
-                
-                # GNOME: org.gnome.SessionManager.Inhibit
-                # flags: 1=Logout, 2=SwitchUser, 4=Suspend, 8=Idle → 4+8=12
-                obj = DBusAddress('/org/gnome/SessionManager',
-                                  bus_name='org.gnome.SessionManager',
-                                  interface='org.gnome.SessionManager')
-                msg = new_method_call(obj, 'Inhibit', 'susu',
-                                      ('PyCronVideoAlarm', 0, reason, 12))
-                reply = connection.send_and_get_reply(msg)
-                self.inhibit_cookie = reply.body[0]
-                self.bus_connection = connection
-                self._inhibit_method = 'gnome-dbus'
-                logging.info("Inhibited sleep via GNOME SessionManager DBus")
-                success = True
-            except ImportError:
-                logging.debug("jeepney not installed, skipping DBus methods")
-            except Exception as e:
-                logging.debug(f"GNOME DBus inhibit failed: {e}")
-        
-        # Method 4: KDE PowerManagement DBus
-        if not success:
-            try:
-                from jeepney import DBusAddress, new_method_call
-                from jeepney.io.blocking import open_dbus_connection
-                
-                connection = open_dbus_connection(bus='SESSION')
-                
-                # KDE: org.freedesktop.PowerManagement.Inhibit
-                obj = DBusAddress('/org/freedesktop/PowerManagement/Inhibit',
-                                  bus_name='org.kde.Solid.PowerManagement.PolicyAgent',
-                                  interface='org.kde.Solid.PowerManagement.PolicyAgent')
-                msg = new_method_call(obj, 'AddInhibition', 'uss',
-                                      (2, 'PyCronVideoAlarm', reason))  # 2 = ChangeScreenSettings
-                reply = connection.send_and_get_reply(msg)
-                self.inhibit_cookie = reply.body[0]
-                self.bus_connection = connection
-                self._inhibit_method = 'kde-dbus'
-                logging.info("Inhibited sleep via KDE PowerManagement DBus")
-                success = True
-            except Exception as e:
-                logging.debug(f"KDE DBus inhibit failed: {e}")
-        
-        # Method 5: freedesktop ScreenSaver DBus — Generic fallback
-        if not success:
-            try:
-                from jeepney import DBusAddress, new_method_call
-                from jeepney.io.blocking import open_dbus_connection
-                
-                connection = open_dbus_connection(bus='SESSION')
-                
-                obj = DBusAddress('/org/freedesktop/ScreenSaver',
-                                  bus_name='org.freedesktop.ScreenSaver',
-                                  interface='org.freedesktop.ScreenSaver')
-                msg = new_method_call(obj, 'Inhibit', 'ss',
-                                      ('PyCronVideoAlarm', reason))
-                reply = connection.send_and_get_reply(msg)
-                self.inhibit_cookie = reply.body[0]
-                self.bus_connection = connection
-                self._inhibit_method = 'freedesktop-dbus'
-                logging.info("Inhibited sleep via freedesktop ScreenSaver DBus")
-                success = True
-            except Exception as e:
-                logging.debug(f"freedesktop ScreenSaver DBus inhibit failed: {e}")
-        
         if not success:
             logging.error("All sleep inhibition methods failed! The system may go to sleep during the alarm.")
-        
+
         return success
 
-    def uninhibit_sleep(self) -> bool:
-        """Release all sleep inhibition locks."""
-        success = True
-        
-        # Release systemd-inhibit subprocess
-        if self.inhibit_proc:
+    @classmethod
+    def _probe_caps(cls):
+        """Detect which inhibit strategies are viable so hopeless ones never fork."""
+        cls._systemd_inhibit_path = shutil.which('systemd-inhibit')
+        cls._caps = {
+            'systemd': bool(cls._systemd_inhibit_path) and os.path.exists('/run/systemd/system'),
+            'xset': bool(os.environ.get('DISPLAY')) and bool(shutil.which('xset')),
+            'dbus': _HAS_JEEPNEY and bool(os.environ.get('DBUS_SESSION_BUS_ADDRESS')),
+        }
+        logging.info("Sleep inhibit capabilities: %s", cls._caps)
+
+    def _claim(self, generation, method, handle) -> bool:
+        """Adopt a successful strategy result, or release it if it lost the race."""
+        if handle is None:
+            return False
+        with self._lock:
+            if generation == self._generation:
+                if method == 'xset':
+                    self._restored_screensaver = True
+                    return True
+                if self._inhibit_method is None:
+                    self._inhibit_method = method
+                    if method == 'systemd-inhibit':
+                        self.inhibit_proc = handle
+                    else:
+                        self.bus_connection, self.inhibit_cookie = handle
+                    return True
+        logging.debug("Releasing redundant %s inhibit", method)
+        self._release(method, handle)
+        return False
+
+    def _try_systemd_inhibit(self, reason):
+        """Method 1: systemd-inhibit (CLI) — Most robust, works headless too."""
+        try:
+            # systemd-inhibit runs a subprocess and holds the inhibit lock
+            # until the subprocess exits. We use 'sleep infinity' to hold it.
+            # posix_spawn skips subprocess.Popen's pipe setup; stdout/stderr go to /dev/null.
+            pid = os.posix_spawn(
+                self._systemd_inhibit_path,
+                ['systemd-inhibit', '--what=idle:sleep:handle-lid-switch',
+                 f'--why={reason}', '--who=PyCronVideoAlarm',
+                 'sleep', 'infinity'],
+                get_clean_env(),
+                file_actions=[(os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                              (os.POSIX_SPAWN_DUP2, 1, 2)]
+            )
+            logging.info("Inhibited sleep via systemd-inhibit CLI")
+            return pid
+        except FileNotFoundError:
+            logging.debug("systemd-inhibit not found")
+        except Exception as e:
+            logging.debug("systemd-inhibit failed: %s", e)
+        return None
+
+    def _try_xset(self, reason):
+        """Method 2: xset (Disable DPMS and Screensaver) — X11 only."""
+        try:
+            subprocess.run(['xset', '-dpms'], check=False, capture_output=True, env=get_clean_env())
+            subprocess.run(['xset', 's', 'off'], check=False, capture_output=True, env=get_clean_env())
+            logging.info("Disabled DPMS and screensaver via xset")
+            return True
+        except FileNotFoundError:
+            logging.debug("xset not found (not X11?)")
+        except Exception as e:
+            logging.warning("xset inhibit failed: %s", e)
+        return None
+
+    def _try_gnome_dbus(self, reason):
+        """Method 3: GNOME SessionManager DBus — Works on GNOME/Wayland."""
+        # flags: 1=Logout, 2=SwitchUser, 4=Suspend, 8=Idle → 4+8=12
+        return self._dbus_inhibit('gnome-dbus', 'Inhibit', 'susu',
+                                  ('PyCronVideoAlarm', 0, reason, 12),
+                                  "GNOME SessionManager")
+
+    def _try_kde_dbus(self, reason):
+        """Method 4: KDE PowerManagement DBus."""
+        return self._dbus_inhibit('kde-dbus', 'AddInhibition', 'uss',
+                                  (2, 'PyCronVideoAlarm', reason),  # 2 = ChangeScreenSettings
+                                  "KDE PowerManagement")
+
+    def _try_fdo_dbus(self, reason):
+        """Method 5: freedesktop ScreenSaver DBus — Generic fallback."""
+        return self._dbus_inhibit('freedesktop-dbus', 'Inhibit', 'ss',
+                                  ('PyCronVideoAlarm', reason),
+                                  "freedesktop ScreenSaver")
+
+    def _dbus_inhibit(self, method, call, signature, args, label):
+        """Send an inhibit call on its own session bus connection.
+
+        Returns (connection, cookie) on success, None on failure.
+        """
+        connection = None
+        try:
+            connection = open_dbus_connection(bus='SESSION')
+            path, bus_name, interface, _ = _DBUS_TARGETS[method]
+            obj = DBusAddress(path, bus_name=bus_name, interface=interface)
+            msg = new_method_call(obj, call, signature, args)
+            reply = connection.send_and_get_reply(msg)
+            logging.info("Inhibited sleep via %s DBus", label)
+            return connection, reply.body[0]
+        except Exception as e:
+            logging.debug("%s DBus inhibit failed: %s", label, e)
+            if connection is not None:
+                try: connection.close()
+                except: pass
+        return None
+
+    def _release(self, method, handle) -> bool:
+        """Undo a single strategy. Returns True on success."""
+        if method == 'systemd-inhibit':
             try:
-                self.inhibit_proc.terminate()
-                self.inhibit_proc.wait(timeout=5)
+                os.kill(handle, signal.SIGTERM)
+                deadline = time.monotonic() + 5
+                while os.waitpid(handle, os.WNOHANG) == (0, 0):
+                    if time.monotonic() > deadline:
+                        raise TimeoutError("systemd-inhibit did not exit after SIGTERM")
+                    time.sleep(0.05)
                 logging.info("Released systemd-inhibit lock")
+            except ChildProcessError:
+                logging.info("Released systemd-inhibit lock (already exited)")
             except Exception as e:
-                logging.error(f"Failed to release systemd-inhibit: {e}")
-                try: self.inhibit_proc.kill()
+                logging.error("Failed to release systemd-inhibit: %s", e)
+                try:
+                    os.kill(handle, signal.SIGKILL)
+                    os.waitpid(handle, 0)
                 except: pass
-                success = False
-            self.inhibit_proc = None
-        
-        # Restore xset DPMS/screensaver
-        if self._restored_screensaver:
+                return False
+            return True
+
+        if method == 'xset':
             try:
                 subprocess.run(['xset', '+dpms'], check=False, capture_output=True, env=get_clean_env())
                 subprocess.run(['xset', 's', 'on'], check=False, capture_output=True, env=get_clean_env())
                 logging.info("Re-enabled DPMS and screensaver via xset")
-                self._restored_screensaver = False
             except Exception as e:
-                logging.error(f"xset restore failed: {e}")
-                success = False
-        
+                logging.error("xset restore failed: %s", e)
+                return False
+            return True
+
         # Release DBus inhibit (GNOME/KDE/freedesktop)
-        if self.inhibit_cookie is not None and self.bus_connection:
-            try:
-                from jeepney import DBusAddress, new_method_call
-                
-                if self._inhibit_method == 'gnome-dbus':
-                    obj = DBusAddress('/org/gnome/SessionManager',
-                                      bus_name='org.gnome.SessionManager',
-                                      interface='org.gnome.SessionManager')
-                    msg = new_method_call(obj, 'Uninhibit', 'u', (self.inhibit_cookie,))
-                elif self._inhibit_method == 'kde-dbus':
-                    obj = DBusAddress('/org/freedesktop/PowerManagement/Inhibit',
-                                      bus_name='org.kde.Solid.PowerManagement.PolicyAgent',
-                                      interface='org.kde.Solid.PowerManagement.PolicyAgent')
-                    msg = new_method_call(obj, 'ReleaseInhibition', 'u', (self.inhibit_cookie,))
-                elif self._inhibit_method == 'freedesktop-dbus':
-                    obj = DBusAddress('/org/freedesktop/ScreenSaver',
-                                      bus_name='org.freedesktop.ScreenSaver',
-                                      interface='org.freedesktop.ScreenSaver')
-                    msg = new_method_call(obj, 'UnInhibit', 'u', (self.inhibit_cookie,))
-                
-                self.bus_connection.send_and_get_reply(msg)
-                logging.info(f"Released {self._inhibit_method} inhibit lock")
-            except Exception as e:
-                logging.error(f"Failed to release DBus inhibit: {e}")
-                success = False
-            
+        connection, cookie = handle
+        try:
+            path, bus_name, interface, release_call = _DBUS_TARGETS[method]
+            obj = DBusAddress(path, bus_name=bus_name, interface=interface)
+            msg = new_method_call(obj, release_call, 'u', (cookie,))
+            connection.send_and_get_reply(msg)
+            logging.info("Released %s inhibit lock", method)
+        except Exception as e:
+            logging.error("Failed to release DBus inhibit: %s", e)
+            return False
+        finally:
+            try: connection.close()
+            except: pass
+        return True
+
+    def uninhibit_sleep(self) -> bool:
+        """Release all sleep inhibition locks."""
+        success = True
+
+        with self._lock:
+            self._generation += 1
+            method = self._inhibit_method
+            if method == 'systemd-inhibit':
+                handle = self.inhibit_proc
+            elif method is not None:
+                handle = (self.bus_connection, self.inhibit_cookie)
+            restore_screensaver = self._restored_screensaver
+
+            self.inhibit_proc = None
             self.inhibit_cookie = None
             self.bus_connection = None
             self._inhibit_method = None
-        
-        return success
+            self._restored_screensaver = False
 
+        # Release systemd-inhibit subprocess or DBus cookie
+        if method is not None and not self._release(method, handle):
+            success = False
 
+        # Restore xset DPMS/screensaver
+        if restore_screensaver and not self._release('xset', True):
+            success = False
+
+        return success
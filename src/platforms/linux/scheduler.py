@@ -1,5 +1,6 @@
 import sys
 import os
+import re
 import logging
 import getpass
 import uuid
@@ -12,16 +13,28 @@ try:
     logging.info("Successfully imported CronTab")
 except ImportError as e:
     HAS_CRONTAB = False
-    logging.warning(f"python-crontab not found: {e}")
+    logging.warning("python-crontab not found: %s", e)
     
     # Detect wrong package installed (common mistake)
     try:
         import crontab
-        logging.warning(f"'crontab' module found at {crontab.__file__} but 'CronTab' class is missing. "
-                       "Install the correct package: pip install python-crontab")
+        logging.warning("'crontab' module found at %s but 'CronTab' class is missing. "
+                        "Install the correct package: pip install python-crontab", crontab.__file__)
     except ImportError:
         logging.warning("Install with: pip install python-crontab")
 
+# add_alarm always writes `--execute-sequence "<name>"`; also accept an unquoted
+# name from hand-edited entries.
+_SEQ_RE = re.compile(r'--execute-sequence\s+(?:"([^"]*)"|(\S+))')
+
+# Launch target for scheduled jobs — constant for the life of the process
+_IS_FROZEN = getattr(sys, 'frozen', False)
+_SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../main.py"))
+
+# Cron day-of-week number -> UI day name
+_DAY_REV_MAP = {"1": "MON", "2": "TUE", "3": "WED", "4": "THU",
+                "5": "FRI", "6": "SAT", "0": "SUN"}
+
 
 class LinuxScheduler:
     """Linux-specific scheduler using crontab.
@@ -44,7 +57,7 @@ class LinuxScheduler:
             user = getpass.getuser()
             uid = os.getuid()
             home = os.environ.get('HOME', 'unknown')
-            logging.info(f"LinuxScheduler init: user='{user}', uid={uid}, home='{home}'")
+            logging.info("LinuxScheduler init: user='%s', uid=%s, home='%s'", user, uid, home)
         except Exception:
             pass
         
@@ -58,12 +71,12 @@ class LinuxScheduler:
             
             # Quick sanity check: iterate to verify we can read
             count = sum(1 for _ in self.cron)
-            logging.info(f"Crontab initialized successfully ({count} existing jobs)")
+            logging.info("Crontab initialized successfully (%d existing jobs)", count)
         except Exception as e:
-            logging.error(f"Failed to access crontab: {e}")
-            logging.error(f"  User: {getpass.getuser()}, UID: {os.getuid()}")
-            logging.error(f"  Check: /etc/cron.allow and /etc/cron.deny")
-            logging.error(f"  Fix: echo {getpass.getuser()} | sudo tee -a /etc/cron.allow")
+            logging.error("Failed to access crontab: %s", e)
+            logging.error("  User: %s, UID: %s", getpass.getuser(), os.getuid())
+            logging.error("  Check: /etc/cron.allow and /etc/cron.deny")
+            logging.error("  Fix: echo %s | sudo tee -a /etc/cron.allow", getpass.getuser())
             self.cron = None
 
     def add_alarm(self, alarm_time, sequence_name: str, days: List[str], one_time: bool = True) -> (bool, str):
@@ -77,38 +90,85 @@ class LinuxScheduler:
         Environment detection (DISPLAY, audio, etc.) is handled by main.py
         at runtime, NOT baked into the cron command.
         """
+        return self.add_alarms([(alarm_time, sequence_name, days, one_time)])[0]
+
+    def add_alarms(self, specs: List[tuple]) -> List[tuple]:
+        """Add several alarms with a single crontab write.
+        
+        Each spec is (alarm_time, sequence_name, days, one_time). Returns one
+        (success, message) tuple per spec, in order. cron.write() rewrites the
+        whole crontab through the `crontab` binary, so batching saves one
+        rewrite + subprocess per extra alarm.
+        """
         # IMPORTANT: use `is None`, NOT `not self.cron`!
         # CronTab implements __len__, so an empty crontab (0 jobs) is falsy.
         # `not self.cron` would return True when crontab is valid but empty!
         if self.cron is None: 
-            return False, "Crontab not available. Check logs for details."
+            return [(False, "Crontab not available. Check logs for details.")] * len(specs)
         
         try:
-            # Build command — inject environment variables to fix headless execution issues in Cron
-            # Cron does not provide a DISPLAY or XDG_RUNTIME_DIR by default, which causes GUI apps (like VLC) to fail.
-            # We hardcode safe defaults here to ensure the alarm can launch visible windows.
-            # This is a "Defense in Depth" strategy: main.py also has runtime checks, but setting it here is cleaner.
-            uid = os.getuid()
-            # Injecting XDG_CURRENT_DESKTOP=KDE helps Qt apps (VLC) pick up the right theme/scaling immediately
-            env_prefix = f"DISPLAY=:0 XDG_RUNTIME_DIR=/run/user/{uid} XDG_CURRENT_DESKTOP=KDE "
+            self._reload()
+        except Exception as e:
+            logging.exception("Add alarm failed: %s", e)
+            return [(False, f"Crontab Error: {str(e)}")] * len(specs)
+        
+        results = []
+        new_jobs = []
+        for alarm_time, sequence_name, days, one_time in specs:
+            try:
+                job, cmd = self._new_job(alarm_time, sequence_name, days, one_time)
+                new_jobs.append((len(results), job, cmd))
+                results.append((True, f"Alarm set for {alarm_time.strftime('%H:%M')} via Cron"))
+            except Exception as e:
+                logging.exception("Add alarm failed: %s", e)
+                results.append((False, f"Crontab Error: {str(e)}"))
+        
+        if not new_jobs:
+            return results
+        
+        try:
+            # Write — same as testcrontab.py: cron.write()
+            self.cron.write()
+        except Exception as e:
+            logging.exception("Add alarm failed: %s", e)
+            # Don't leave unwritten jobs behind for the next write() to pick up
+            for idx, job, _ in new_jobs:
+                self.cron.remove(job)
+                results[idx] = (False, f"Crontab Error: {str(e)}")
+            return results
+        
+        for idx, job, cmd in new_jobs:
+            logging.info("Crontab write successful. %s", results[idx][1])
+            logging.info("Cron command: %s", cmd)
+        return results
 
-            if getattr(sys, 'frozen', False):
-                cmd = f'{env_prefix}"{sys.executable}" --execute-sequence "{sequence_name}"'
-            else:
-                script_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../main.py"))
-                cmd = f'{env_prefix}"{sys.executable}" "{script_path}" --execute-sequence "{sequence_name}"'
-            
-            job_id = str(uuid.uuid4())
-            
-            if one_time:
-                time_str = alarm_time.strftime('%H:%M')
-                cmd += f" --delete-after --job-id {job_id} --scheduled-time {time_str}"
-                comment = f"{self.MARKER}:{job_id}"
-            else:
-                comment = self.MARKER
-            
-            # Create the job — same as testcrontab.py: cron.new(command=...)
-            job = self.cron.new(command=cmd, comment=comment)
+    def _new_job(self, alarm_time, sequence_name: str, days: List[str], one_time: bool):
+        """Create (but don't write) the cron job for one alarm. Returns (job, cmd)."""
+        # Build command — inject environment variables to fix headless execution issues in Cron
+        # Cron does not provide a DISPLAY or XDG_RUNTIME_DIR by default, which causes GUI apps (like VLC) to fail.
+        # We hardcode safe defaults here to ensure the alarm can launch visible windows.
+        # This is a "Defense in Depth" strategy: main.py also has runtime checks, but setting it here is cleaner.
+        uid = os.getuid()
+        # Injecting XDG_CURRENT_DESKTOP=KDE helps Qt apps (VLC) pick up the right theme/scaling immediately
+        env_prefix = f"DISPLAY=:0 XDG_RUNTIME_DIR=/run/user/{uid} XDG_CURRENT_DESKTOP=KDE "
+
+        if _IS_FROZEN:
+            cmd = f'{env_prefix}"{sys.executable}" --execute-sequence "{sequence_name}"'
+        else:
+            cmd = f'{env_prefix}"{sys.executable}" "{_SCRIPT_PATH}" --execute-sequence "{sequence_name}"'
+        
+        job_id = uuid.uuid4().hex
+        
+        if one_time:
+            time_str = alarm_time.strftime('%H:%M')
+            cmd += f" --delete-after --job-id {job_id} --scheduled-time {time_str}"
+            comment = f"{self.MARKER}:{job_id}"
+        else:
+            comment = self.MARKER
+        
+        # Create the job — same as testcrontab.py: cron.new(command=...)
+        job = self.cron.new(command=cmd, comment=comment)
+        try:
             job.minute.on(alarm_time.minute)
             job.hour.on(alarm_time.hour)
             
@@ -122,56 +182,67 @@ class LinuxScheduler:
                 day_map = {"MON":1, "TUE":2, "WED":3, "THU":4, "FRI":5, "SAT":6, "SUN":0}
                 cron_days = [day_map.get(d, 1) for d in days]
                 job.dow.on(*cron_days)
-            
-            # Write — same as testcrontab.py: cron.write()
-            self.cron.write()
-            
-            msg = f"Alarm set for {alarm_time.strftime('%H:%M')} via Cron"
-            logging.info(f"Crontab write successful. {msg}")
-            logging.info(f"Cron command: {cmd}")
-            return True, msg
-            
-        except Exception as e:
-            logging.exception(f"Add alarm failed: {e}")
-            return False, f"Crontab Error: {str(e)}"
+        except Exception:
+            self.cron.remove(job)
+            raise
+        return job, cmd
+
+    def _reload(self):
+        """Re-read the user's crontab before working on it.
+
+        The scheduler is long-lived, while alarms fired with --delete-after
+        (or a hand edit) change the crontab behind its back. Writing a stale
+        copy would resurrect jobs that already removed themselves.
+        """
+        self.cron.read()
+
+    def _our_jobs(self) -> list:
+        """Jobs carrying our marker — the plain one or the UUID-suffixed one."""
+        marker = self.MARKER
+        marker_colon = marker + ":"
+        return [job for job in self.cron
+                if (c := job.comment) and (c == marker or c.startswith(marker_colon))]
 
     def list_alarms(self) -> List[Dict[str, Any]]:
         """List all PyCronVideoAlarm jobs from crontab."""
         if self.cron is None: 
             return []
         
+        try:
+            self._reload()
+        except Exception as e:
+            logging.error("Failed to re-read crontab: %s", e)
+            return []
+        
         alarms = []
-        for job in self.cron:
-            # Handle standard marker and UUID-suffixed marker
-            if job.comment and (job.comment == self.MARKER or job.comment.startswith(self.MARKER + ":")):
-                try:
-                    import shlex
-                    args = shlex.split(job.command)
-                    seq_idx = args.index('--execute-sequence')
-                    sequence = args[seq_idx + 1]
-                    
-                    time_str = f"{job.hour}:{str(job.minute).zfill(2)}"
-                    
-                    # Parse days of week
-                    day_rev_map = {"1":"MON", "2":"TUE", "3":"WED", "4":"THU", 
-                                   "5":"FRI", "6":"SAT", "0":"SUN"}
-                    dow_str = str(job.dow)
-                    if " --delete-after" in job.command:
-                        days = ["Once"]
-                    elif dow_str == "*":
-                        days = ["Daily"]
-                    else:
-                        days = [day_rev_map.get(d.strip(), d) for d in dow_str.split(",")]
-                    
-                    alarms.append({
-                        'time': time_str,
-                        'sequence': sequence,
-                        'days': days,
-                        'enabled': job.is_enabled()
-                    })
-                except Exception as e:
-                    logging.debug(f"Skipping unparseable cron job: {e}")
-                    continue
+        for job in self._our_jobs():
+            try:
+                command = job.command
+                m = _SEQ_RE.search(command)
+                if m is None:
+                    raise ValueError("no --execute-sequence argument")
+                sequence = m.group(1) if m.group(1) is not None else m.group(2)
+                
+                time_str = f"{job.hour}:{str(job.minute).zfill(2)}"
+                
+                # Parse days of week
+                dow_str = str(job.dow)
+                if " --delete-after" in command:
+                    days = ["Once"]
+                elif dow_str == "*":
+                    days = ["Daily"]
+                else:
+                    days = [_DAY_REV_MAP.get(d.strip(), d) for d in dow_str.split(",")]
+                
+                alarms.append({
+                    'time': time_str,
+                    'sequence': sequence,
+                    'days': days,
+                    'enabled': job.is_enabled()
+                })
+            except Exception as e:
+                logging.debug("Skipping unparseable cron job: %s", e)
+                continue
         
         return alarms
 
@@ -180,55 +251,77 @@ class LinuxScheduler:
         
         Matches on time, sequence name, AND days to find the exact job.
         """
+        return self.remove_alarms([(sequence_name, time_str, days_str)])[0]
+
+    def remove_alarms(self, specs: List[tuple]) -> List[tuple]:
+        """Remove several alarms with a single crontab write.
+        
+        Each spec is (sequence_name, time_str, days_str). Returns one
+        (success, message) tuple per spec, in order.
+        """
         if self.cron is None: 
-            return False, "Crontab not available"
+            return [(False, "Crontab not available")] * len(specs)
         
         try:
-            hour, minute = map(int, time_str.split(":"))
-            removed = False
-            
-            # Build a comparable days string from the UI format
-            # UI sends: "Daily", "SUN", "MON, WED", etc.
-            day_rev_map = {"1":"MON", "2":"TUE", "3":"WED", "4":"THU", 
-                           "5":"FRI", "6":"SAT", "0":"SUN"}
-            
-            for job in self.cron:
-                # Check marker prefix (supports both legacy and UUID versions)
-                is_our_job = job.comment and (job.comment == self.MARKER or job.comment.startswith(self.MARKER + ":"))
+            self._reload()
+        except Exception as e:
+            logging.exception("Remove alarm failed: %s", e)
+            return [(False, f"Remove Error: {str(e)}")] * len(specs)
+        
+        results = []
+        removed = False
+        for sequence_name, time_str, days_str in specs:
+            try:
+                job = self._find_job(sequence_name, time_str, days_str)
+            except Exception as e:
+                logging.exception("Remove alarm failed: %s", e)
+                results.append((False, f"Remove Error: {str(e)}"))
+                continue
+            if job is None:
+                results.append((False, f"Alarm '{sequence_name}' at {time_str} not found in crontab."))
+                continue
+            self.cron.remove(job)
+            removed = True
+            logging.info("Removed cron job: %.80s...", job.command)
+            results.append((True, f"Removed alarm: {sequence_name}"))
+        
+        if removed:
+            try:
+                self.cron.write()
+            except Exception as e:
+                logging.exception("Remove alarm failed: %s", e)
+                # Nothing was written; the next call re-reads the crontab anyway
+                results = [(False, f"Remove Error: {str(e)}") if ok else (ok, msg)
+                           for ok, msg in results]
+        return results
+
+    def _find_job(self, sequence_name: str, time_str: str, days_str: str = ""):
+        """First of our jobs matching the UI's time, sequence and days strings, or None."""
+        hour, minute = map(int, time_str.split(":"))
+        
+        # UI sends days as: "Daily", "SUN", "MON, WED", etc.
+        for job in self._our_jobs():
+            command = job.command
+            if (job.hour == hour and job.minute == minute and
+                sequence_name in command):
                 
-                if (is_our_job and 
-                    job.hour == hour and job.minute == minute and
-                    sequence_name in job.command):
-                    
-                    # If days_str provided, also match on days of week
-                    if days_str:
-                        dow_str = str(job.dow)
-                        if " --delete-after" in job.command:
-                            job_days = "Once"
-                        elif dow_str == "*":
-                            job_days = "Daily"
-                        else:
-                            job_days = ", ".join(
-                                day_rev_map.get(d.strip(), d) for d in dow_str.split(",")
-                            )
-                        
-                        if job_days != days_str:
-                            continue  # Not a match — skip this job
+                # If days_str provided, also match on days of week
+                if days_str:
+                    dow_str = str(job.dow)
+                    if " --delete-after" in command:
+                        job_days = "Once"
+                    elif dow_str == "*":
+                        job_days = "Daily"
+                    else:
+                        job_days = ", ".join(
+                            _DAY_REV_MAP.get(d.strip(), d) for d in dow_str.split(",")
+                        )
                     
-                    self.cron.remove(job)
-                    removed = True
-                    logging.info(f"Removed cron job: {job.command[:80]}...")
-                    break  # Only remove ONE matching job
-            
-            if removed:
-                self.cron.write()
-                return True, f"Removed alarm: {sequence_name}"
-            
-            return False, f"Alarm '{sequence_name}' at {time_str} not found in crontab."
-            
-        except Exception as e:
-            logging.exception(f"Remove alarm failed: {e}")
-            return False, f"Remove Error: {str(e)}"
+                    if job_days != days_str:
+                        continue  # Not a match — skip this job
+                
+                return job  # Only remove ONE matching job
+        return None
 
     def get_debug_info(self) -> str:
         """Return debug info about crontab state."""
@@ -245,6 +338,10 @@ class LinuxScheduler:
             info.append(f"Error getting user info: {e}")
         
         if self.cron is not None:
+            try:
+                self._reload()
+            except Exception as e:
+                info.append(f"Error re-reading crontab: {e}")
             info.append(f"\nAll crontab entries:")
             for job in self.cron:
                 marker = " [OURS]" if job.comment == self.MARKER else ""
@@ -42,4 +42,5 @@ def ensure_cron_environment():
             os.environ['DBUS_SESSION_BUS_ADDRESS'] = f'unix:path={dbus_path}'
             
     # Validation Logging
-    logging.info(f"Cron Environment: DISPLAY={os.environ.get('DISPLAY')} XDG_RUNTIME_DIR={os.environ.get('XDG_RUNTIME_DIR')}")
+    logging.info("Cron Environment: DISPLAY=%s XDG_RUNTIME_DIR=%s",
+                 os.environ.get('DISPLAY'), os.environ.get('XDG_RUNTIME_DIR'))
@@ -1,3 +1,5 @@
+import atexit
+import os
 import subprocess
 import logging
 from core.interfaces import PowerManager
@@ -13,10 +15,12 @@ class MacOSPowerManager(PowerManager):
         -i  Prevent system idle sleep
         -m  Prevent disk from sleeping
         -s  Prevent system sleep (AC power)
+        -w  Exit when our process exits, so a crash never leaks the assertion
     """
 
     def __init__(self):
         self._caffeinate_proc = None
+        atexit.register(self._best_effort_kill)
 
     def inhibit_sleep(self, reason: str = "Video Alarm Active") -> bool:
         """Start caffeinate as a background process to block sleep."""
@@ -25,9 +29,10 @@ class MacOSPowerManager(PowerManager):
             return True
         try:
             self._caffeinate_proc = subprocess.Popen(
-                ["caffeinate", "-d", "-i", "-m", "-s"],
+                ["caffeinate", "-d", "-i", "-m", "-s", "-w", str(os.getpid())],
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
             logging.info(f"Sleep inhibited via caffeinate (pid {self._caffeinate_proc.pid})")
             return True
@@ -40,7 +45,8 @@ class MacOSPowerManager(PowerManager):
         if self._caffeinate_proc:
             try:
                 self._caffeinate_proc.terminate()
-                self._caffeinate_proc.wait(timeout=5)
+                # caffeinate exits on SIGTERM right away — no need to poll with a timeout
+                self._caffeinate_proc.wait()
                 logging.info("Released sleep inhibit (caffeinate terminated)")
             except Exception as e:
                 logging.error(f"Failed to terminate caffeinate: {e}")
@@ -52,3 +58,12 @@ class MacOSPowerManager(PowerManager):
             finally:
                 self._caffeinate_proc = None
         return True
+
+    def _best_effort_kill(self):
+        """atexit hook: make sure caffeinate doesn't outlive a normal interpreter exit."""
+        proc = self._caffeinate_proc
+        if proc and proc.poll() is None:
+            try:
+                proc.kill()
+            except Exception:
+                pass
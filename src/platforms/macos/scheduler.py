@@ -4,19 +4,125 @@ import plistlib
 import subprocess
 import logging
 import uuid
-import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import List, Dict, Any
 
 PLIST_DIR = os.path.expanduser("~/Library/LaunchAgents")
+_LOG_DIR = os.path.expanduser("~/Library/Logs")
 LABEL_PREFIX = "com.juke32.pycronvideoalarm"
+_READ_WORKERS = 8
+
+# Launch target for scheduled jobs — constant for the life of the process
+_IS_FROZEN = getattr(sys, 'frozen', False)
+_SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../main.py"))
+
+# Parsed plists keyed by path -> (st_mtime_ns, dict). Plists only change on
+# add/remove, so between those a stat() replaces open+read+parse.
+_PLIST_CACHE: Dict[str, tuple] = {}
+
+# Optional: pyobjc's ServiceManagement wrapper lets us ask launchd for its
+# job table in-process instead of spawning launchctl.
+try:
+    from ServiceManagement import SMCopyAllJobDictionaries, kSMDomainUserLaunchd
+    HAS_SERVICE_MANAGEMENT = True
+except ImportError:
+    HAS_SERVICE_MANAGEMENT = False
 
 
 def _uid() -> str:
     return str(os.getuid())
 
 
-def _plist_path(job_id: str) -> str:
-    return os.path.join(PLIST_DIR, f"{LABEL_PREFIX}.{job_id}.plist")
+def _plist_path(job_id: str, hour: int, minute: int) -> str:
+    # The HHMM suffix lets remove_alarm rule files out by name alone.
+    return os.path.join(PLIST_DIR, f"{LABEL_PREFIX}.{job_id}.{hour:02d}{minute:02d}.plist")
+
+
+def _may_fire_at(plist_file: str, hour: int, minute: int) -> bool:
+    """False only if the filename's HHMM tag proves the plist is for another time.
+
+    Legacy plists named `<prefix>.<job_id>.plist` carry no tag and always pass.
+    """
+    name = os.path.basename(plist_file)[len(LABEL_PREFIX) + 1:-len(".plist")]
+    tag = name.rpartition(".")[2]
+    if len(tag) != 4 or not tag.isdigit() or "." not in name:
+        return True
+    return tag == f"{hour:02d}{minute:02d}"
+
+
+def _alarm_plists() -> List[str]:
+    """Paths of every alarm plist in PLIST_DIR (unsorted).
+
+    os.scandir hands back the entry type with the name, so filtering by
+    prefix/suffix needs no extra stat per file the way glob does.
+    """
+    prefix = LABEL_PREFIX + "."
+    try:
+        with os.scandir(PLIST_DIR) as it:
+            return [e.path for e in it
+                    if e.name.startswith(prefix) and e.name.endswith(".plist")
+                    and e.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
+
+
+def _read_plist(plist_file: str) -> dict:
+    """Parse one alarm plist through the mtime cache. Raises on unreadable files.
+
+    Callers must treat the returned dict as read-only — it is shared via the cache.
+    """
+    try:
+        mtime = os.stat(plist_file).st_mtime_ns
+        cached = _PLIST_CACHE.get(plist_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(plist_file, "rb") as f:
+            plist = plistlib.load(f)
+        _PLIST_CACHE[plist_file] = (mtime, plist)
+        return plist
+    except Exception:
+        _PLIST_CACHE.pop(plist_file, None)
+        raise
+
+
+def _load_plist(plist_file: str):
+    """Like _read_plist, but returns None instead of raising."""
+    try:
+        return _read_plist(plist_file)
+    except Exception as e:
+        logging.debug(f"Skipping {os.path.basename(plist_file)}: {e}")
+        return None
+
+
+def _loaded_labels() -> set:
+    """Return the labels of every job launchd currently has loaded.
+
+    Uses ServiceManagement in-process when pyobjc is available, otherwise
+    one `launchctl list` dump (tab-separated `PID  Status  Label` with a
+    header line) replaces a `launchctl list <label>` spawn per alarm.
+    Loading/unloading stays on launchctl: SMJobSubmit/SMJobRemove are
+    deprecated and don't keep the plist on disk, which remove_alarm relies on.
+    """
+    if HAS_SERVICE_MANAGEMENT:
+        try:
+            jobs = SMCopyAllJobDictionaries(kSMDomainUserLaunchd) or []
+            return {job.get("Label") for job in jobs if job.get("Label")}
+        except Exception as e:
+            logging.debug(f"SMCopyAllJobDictionaries failed, falling back to launchctl: {e}")
+
+    try:
+        r = subprocess.run(["launchctl", "list"],
+                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except Exception as e:
+        logging.debug(f"launchctl list error: {e}")
+        return set()
+    loaded = set()
+    for line in r.stdout.splitlines()[1:]:
+        parts = line.split("\t", 2)
+        if len(parts) == 3:
+            loaded.add(parts[2])
+    return loaded
 
 
 def _launchctl_load(plist_file: str) -> bool:
@@ -31,7 +137,7 @@ def _launchctl_load(plist_file: str) -> bool:
     try:
         result = subprocess.run(
             ["launchctl", "bootstrap", f"gui/{_uid()}", plist_file],
-            capture_output=True, text=True
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
         )
         if result.returncode == 0:
             logging.info(f"launchctl bootstrap succeeded for {os.path.basename(plist_file)}")
@@ -44,7 +150,7 @@ def _launchctl_load(plist_file: str) -> bool:
     try:
         result = subprocess.run(
             ["launchctl", "load", plist_file],
-            capture_output=True, text=True
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
         )
         if result.returncode == 0:
             logging.info(f"launchctl load succeeded (legacy) for {os.path.basename(plist_file)}")
@@ -64,27 +170,18 @@ def _launchctl_load(plist_file: str) -> bool:
 
 def _launchctl_unload(plist_file: str) -> bool:
     """Unload a plist using bootout (modern) or unload (legacy)."""
-    label = None
-    try:
-        with open(plist_file, "rb") as f:
-            plist = plistlib.load(f)
-        label = plist.get("Label", "")
-    except Exception:
-        pass
-
-    # Modern: launchctl bootout gui/<uid> <label>  OR  bootout gui/<uid> <plist>
-    if label:
-        r = subprocess.run(
-            ["launchctl", "bootout", f"gui/{_uid()}", plist_file],
-            capture_output=True, text=True
-        )
-        if r.returncode == 0:
-            return True
+    # Modern: launchctl bootout gui/<uid> <plist>
+    r = subprocess.run(
+        ["launchctl", "bootout", f"gui/{_uid()}", plist_file],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    if r.returncode == 0:
+        return True
 
     # Legacy: launchctl unload <plist>
     r = subprocess.run(
         ["launchctl", "unload", plist_file],
-        capture_output=True, text=True
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
     )
     return r.returncode == 0
 
@@ -108,17 +205,13 @@ class MacOSScheduler:
         logging.info(f"MacOSScheduler ready. plist dir: {PLIST_DIR}")
 
     def _build_cmd(self, sequence_name: str, job_id: str,
-                   one_time: bool, alarm_time) -> List[str]:
-        if getattr(sys, 'frozen', False):
+                   one_time: bool, time_str: str) -> List[str]:
+        if _IS_FROZEN:
             cmd = [sys.executable, "--execute-sequence", sequence_name]
         else:
-            script_path = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "../../main.py")
-            )
-            cmd = [sys.executable, script_path, "--execute-sequence", sequence_name]
+            cmd = [sys.executable, _SCRIPT_PATH, "--execute-sequence", sequence_name]
 
         if one_time:
-            time_str = alarm_time.strftime('%H:%M')
             cmd += ["--delete-after", "--job-id", job_id,
                     "--scheduled-time", time_str]
         return cmd
@@ -146,11 +239,13 @@ class MacOSScheduler:
     def add_alarm(self, alarm_time, sequence_name: str, days: List[str],
                   one_time: bool = True):
         try:
-            job_id = str(uuid.uuid4())
+            job_id = uuid.uuid4().hex
             label = f"{LABEL_PREFIX}.{job_id}"
-            plist_file = _plist_path(job_id)
+            plist_file = _plist_path(job_id, alarm_time.hour, alarm_time.minute)
+            log_file = f"{_LOG_DIR}/PyCronVideoAlarm.{job_id}.log"
+            time_str = alarm_time.strftime('%H:%M')
 
-            cmd = self._build_cmd(sequence_name, job_id, one_time, alarm_time)
+            cmd = self._build_cmd(sequence_name, job_id, one_time, time_str)
             calendar = self._build_calendar_interval(alarm_time, days, one_time)
 
             plist = {
@@ -158,10 +253,8 @@ class MacOSScheduler:
                 "ProgramArguments": cmd,
                 "StartCalendarInterval": calendar,
                 "RunAtLoad": False,
-                "StandardOutPath": os.path.expanduser(
-                    f"~/Library/Logs/PyCronVideoAlarm.{job_id}.log"),
-                "StandardErrorPath": os.path.expanduser(
-                    f"~/Library/Logs/PyCronVideoAlarm.{job_id}.log"),
+                "StandardOutPath": log_file,
+                "StandardErrorPath": log_file,
                 "EnvironmentVariables": {
                     "PCVA_SEQUENCE": sequence_name,
                     "PCVA_ONE_TIME": "1" if one_time else "0",
@@ -170,14 +263,15 @@ class MacOSScheduler:
                 },
             }
 
-            # Always write the plist first
+            # Always write the plist first. Binary plists are smaller and
+            # parse faster; plistlib.load and launchd both auto-detect the format.
             with open(plist_file, "wb") as f:
-                plistlib.dump(plist, f)
+                plistlib.dump(plist, f, fmt=plistlib.FMT_BINARY)
+            _PLIST_CACHE.pop(plist_file, None)
             logging.info(f"Plist written: {plist_file}")
 
             # Load it (failure does NOT delete the plist)
             loaded = _launchctl_load(plist_file)
-            time_str = alarm_time.strftime('%H:%M')
             if loaded:
                 msg = f"Alarm set for {time_str} via launchd"
             else:
@@ -191,11 +285,22 @@ class MacOSScheduler:
 
     def list_alarms(self) -> List[Dict[str, Any]]:
         alarms = []
-        pattern = os.path.join(PLIST_DIR, f"{LABEL_PREFIX}.*.plist")
-        for plist_file in sorted(glob.glob(pattern)):
+        loaded = _loaded_labels()
+        # Filenames are <uuid>.<HHMM>, so sorting them gives no useful order;
+        # the result is ordered by alarm time at the end instead.
+        plist_files = _alarm_plists()
+        # Reads are pure I/O — load them concurrently, but don't start threads
+        # for a single file or spin up more workers than there are files.
+        if len(plist_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(plist_files))) as pool:
+                plists = list(pool.map(_load_plist, plist_files))
+        else:
+            plists = [_load_plist(p) for p in plist_files]
+
+        for plist_file, plist in zip(plist_files, plists):
+            if plist is None:
+                continue
             try:
-                with open(plist_file, "rb") as f:
-                    plist = plistlib.load(f)
                 env = plist.get("EnvironmentVariables", {})
                 sequence = env.get("PCVA_SEQUENCE", "Unknown")
                 one_time = env.get("PCVA_ONE_TIME", "0") == "1"
@@ -206,7 +311,7 @@ class MacOSScheduler:
                     cal = cal[0]
                 hour = cal.get("Hour", 0)
                 minute = cal.get("Minute", 0)
-                time_str = f"{hour}:{str(minute).zfill(2)}"
+                time_str = "%d:%02d" % (hour, minute)
 
                 if one_time:
                     days = ["Once"]
@@ -215,58 +320,102 @@ class MacOSScheduler:
                 else:
                     days = [d.strip() for d in days_raw.split(",") if d.strip()]
 
-                label = plist.get("Label", "")
-                r = subprocess.run(["launchctl", "list", label],
-                                   capture_output=True, text=True)
-                enabled = r.returncode == 0
+                enabled = plist.get("Label", "") in loaded
 
-                alarms.append({
+                alarms.append(((hour, minute), {
                     "time": time_str,
                     "sequence": sequence,
                     "days": days,
                     "enabled": enabled,
-                })
+                }))
             except Exception as e:
                 logging.debug(f"Skipping {os.path.basename(plist_file)}: {e}")
-        return alarms
+        alarms.sort(key=itemgetter(0))
+        return [alarm for _, alarm in alarms]
+
+    @staticmethod
+    def _matches(plist, sequence_name: str, hour: int, minute: int,
+                 days_str: str) -> bool:
+        """True if a parsed alarm plist is the alarm shown in the UI row.
+
+        Never raises: malformed plists are plain non-matches, so the remove
+        loop needs no per-file exception handling.
+        """
+        env = plist.get("EnvironmentVariables")
+        if not isinstance(env, dict) or env.get("PCVA_SEQUENCE") != sequence_name:
+            return False
+
+        cal = plist.get("StartCalendarInterval")
+        if isinstance(cal, list):
+            cal = cal[0] if cal else None
+        if (not isinstance(cal, dict)
+                or cal.get("Hour") != hour or cal.get("Minute") != minute):
+            return False
+
+        if days_str:
+            days_raw = env.get("PCVA_DAYS", "daily")
+            if not isinstance(days_raw, str):
+                return False
+            if days_raw == "daily":
+                job_days = "Daily"
+            elif env.get("PCVA_ONE_TIME") == "1":
+                job_days = "Once"
+            else:
+                job_days = ", ".join(
+                    d.strip() for d in days_raw.split(","))
+            if job_days != days_str:
+                return False
+        return True
+
+    @staticmethod
+    def _remove_plist(plist_file: str) -> bool:
+        """Unregister and delete one alarm plist. Returns True on success."""
+        try:
+            _launchctl_unload(plist_file)
+            os.unlink(plist_file)
+        except OSError as e:
+            logging.debug(f"Failed to remove {os.path.basename(plist_file)}: {e}")
+            return False
+        finally:
+            _PLIST_CACHE.pop(plist_file, None)
+        logging.info(f"Removed alarm plist: {os.path.basename(plist_file)}")
+        return True
 
     def remove_alarm(self, sequence_name: str, time_str: str,
                      days_str: str = ""):
         try:
             hour, minute = map(int, time_str.split(":"))
-            pattern = os.path.join(PLIST_DIR, f"{LABEL_PREFIX}.*.plist")
-            for plist_file in glob.glob(pattern):
-                try:
-                    with open(plist_file, "rb") as f:
-                        plist = plistlib.load(f)
-                    env = plist.get("EnvironmentVariables", {})
-                    if env.get("PCVA_SEQUENCE") != sequence_name:
-                        continue
+            removed = f"Removed alarm: {sequence_name}"
 
-                    cal = plist.get("StartCalendarInterval", {})
-                    if isinstance(cal, list):
-                        cal = cal[0]
-                    if cal.get("Hour") != hour or cal.get("Minute") != minute:
+            # Warm path: plists parsed by an earlier list_alarms need no I/O.
+            # Plists are only ever created or deleted, never edited in place.
+            misses = []
+            for plist_file in _alarm_plists():
+                if not _may_fire_at(plist_file, hour, minute):
+                    continue
+                cached = _PLIST_CACHE.get(plist_file)
+                if cached is None:
+                    misses.append(plist_file)
+                elif self._matches(cached[1], sequence_name, hour, minute, days_str):
+                    if self._remove_plist(plist_file):
+                        return True, removed
+
+            # Cold path: read the rest concurrently, stop at the first match
+            with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+                futures = {pool.submit(_load_plist, f): f for f in misses}
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    plist = future.result()
+                    if plist is None or not self._matches(
+                            plist, sequence_name, hour, minute, days_str):
                         continue
 
-                    if days_str:
-                        days_raw = env.get("PCVA_DAYS", "daily")
-                        if days_raw == "daily":
-                            job_days = "Daily"
-                        elif env.get("PCVA_ONE_TIME") == "1":
-                            job_days = "Once"
-                        else:
-                            job_days = ", ".join(
-                                d.strip() for d in days_raw.split(","))
-                        if job_days != days_str:
-                            continue
-
-                    _launchctl_unload(plist_file)
-                    os.remove(plist_file)
-                    logging.info(f"Removed alarm plist: {os.path.basename(plist_file)}")
-                    return True, f"Removed alarm: {sequence_name}"
-                except Exception:
-                    continue
+                    if self._remove_plist(futures[future]):
+                        # Found it — don't bother reading the rest
+                        for other in futures:
+                            other.cancel()
+                        return True, removed
             return False, f"Alarm '{sequence_name}' at {time_str} not found."
         except Exception as e:
             logging.exception(f"MacOSScheduler remove_alarm failed: {e}")
@@ -278,19 +427,15 @@ class MacOSScheduler:
             f"Plist directory: {PLIST_DIR}",
             f"(Hidden in Finder — Go menu → hold Option → Library)",
         ]
-        pattern = os.path.join(PLIST_DIR, f"{LABEL_PREFIX}.*.plist")
-        plists = sorted(glob.glob(pattern))
+        plists = _alarm_plists()
         lines.append(f"Alarm plists found: {len(plists)}")
+        loaded = _loaded_labels()
         for p in plists:
             try:
-                with open(p, "rb") as f:
-                    data = plistlib.load(f)
+                data = _read_plist(p)
                 env = data.get("EnvironmentVariables", {})
                 seq = env.get("PCVA_SEQUENCE", "?")
-                label = data.get("Label", "")
-                r = subprocess.run(["launchctl", "list", label],
-                                   capture_output=True, text=True)
-                status = "loaded" if r.returncode == 0 else "NOT loaded"
+                status = "loaded" if data.get("Label", "") in loaded else "NOT loaded"
                 lines.append(f"  {os.path.basename(p)} | {seq} | {status}")
             except Exception as e:
                 lines.append(f"  {os.path.basename(p)} [error: {e}]")
@@ -1,13 +1,62 @@
 import ctypes
 import logging
+import subprocess
+import sys
+from ctypes import wintypes
 from core.interfaces import DisplayManager
 
+# Hidden console for the PowerShell fallback — built once, reused per call
+if sys.platform == "win32":
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _CREATE_NO_WINDOW = subprocess.CREATE_NO_WINDOW
+else:
+    _STARTUPINFO = None
+    _CREATE_NO_WINDOW = 0
+
+
+class _PHYSICAL_MONITOR(ctypes.Structure):
+    _fields_ = [("hPhysicalMonitor", wintypes.HANDLE),
+                ("szPhysicalMonitorDescription", ctypes.c_wchar * 128)]
+
+
+# PowerShell exit code meaning "no WmiMonitorBrightnessMethods instance"
+_NO_WMI_PANEL = 3
+
+_MONITORENUMPROC = ctypes.WINFUNCTYPE(
+    wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC,
+    ctypes.POINTER(wintypes.RECT), wintypes.LPARAM
+) if sys.platform == "win32" else None
+
+# DXVA2 Monitor Configuration API, with prototypes so 64-bit handles pass intact
+_dxva2 = None
+if sys.platform == "win32":
+    try:
+        _dxva2 = ctypes.WinDLL("dxva2")
+    except OSError:
+        pass
+if _dxva2 is not None:
+    _LPPHYSICAL_MONITOR = ctypes.POINTER(_PHYSICAL_MONITOR)
+    for _name, _argtypes in (
+        ("GetNumberOfPhysicalMonitorsFromHMONITOR", (wintypes.HMONITOR, wintypes.LPDWORD)),
+        ("GetPhysicalMonitorsFromHMONITOR", (wintypes.HMONITOR, wintypes.DWORD, _LPPHYSICAL_MONITOR)),
+        ("GetMonitorBrightness", (wintypes.HANDLE, wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD)),
+        ("SetMonitorBrightness", (wintypes.HANDLE, wintypes.DWORD)),
+        ("DestroyPhysicalMonitors", (wintypes.DWORD, _LPPHYSICAL_MONITOR)),
+    ):
+        _fn = getattr(_dxva2, _name)
+        _fn.argtypes = _argtypes
+        _fn.restype = wintypes.BOOL
+
+
 class WindowsDisplayManager(DisplayManager):
     def __init__(self):
         self.user32 = ctypes.windll.user32
         self.HWND_BROADCAST = 0xFFFF
         self.WM_SYSCOMMAND = 0x0112
         self.SC_MONITORPOWER = 0xF170
+        # Cleared once WMI reports no brightness-capable panel (desktops)
+        self._has_wmi_brightness = True
         
     def turn_off(self) -> bool:
         """
@@ -40,38 +89,94 @@ class WindowsDisplayManager(DisplayManager):
             logging.error(f"Failed to turn on display on Windows: {e}")
             return False
 
+    def _set_brightness_ddc(self, level: int) -> bool:
+        """
+        Set brightness on external monitors via the DXVA2 Monitor Configuration
+        API (DDC/CI). No process spawn. Returns True if any monitor accepted it.
+        """
+        dxva2 = _dxva2
+        if dxva2 is None:
+            return False
+        hmonitors = []
+
+        def _collect(hmonitor, hdc, rect, data):
+            hmonitors.append(hmonitor)
+            return True
+
+        self.user32.EnumDisplayMonitors(None, None, _MONITORENUMPROC(_collect), 0)
+
+        applied = False
+        for hmonitor in hmonitors:
+            count = wintypes.DWORD()
+            if not dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR(hmonitor, ctypes.byref(count)) or not count.value:
+                continue
+            physical = (_PHYSICAL_MONITOR * count.value)()
+            if not dxva2.GetPhysicalMonitorsFromHMONITOR(hmonitor, count.value, physical):
+                continue
+            try:
+                for monitor in physical:
+                    # DDC ranges are monitor-specific; scale 0-100 into [min, max]
+                    lo, cur, hi = wintypes.DWORD(), wintypes.DWORD(), wintypes.DWORD()
+                    if not dxva2.GetMonitorBrightness(monitor.hPhysicalMonitor, ctypes.byref(lo),
+                                                      ctypes.byref(cur), ctypes.byref(hi)):
+                        continue
+                    value = lo.value + (hi.value - lo.value) * level // 100
+                    if dxva2.SetMonitorBrightness(monitor.hPhysicalMonitor, value):
+                        applied = True
+            finally:
+                dxva2.DestroyPhysicalMonitors(count.value, physical)
+        return applied
+
     def set_brightness(self, level: int) -> bool:
         """
-        Set brightness using PowerShell WMI (WmiMonitorBrightnessMethods).
-        Level should be 0-100.
+        Set brightness via DDC/CI (external monitors) and PowerShell WMI
+        (WmiMonitorBrightnessMethods) for built-in panels. Both run, so a
+        laptop with an external screen gets both dimmed. Level should be 0-100.
         """
         level = max(0, min(100, int(level)))
+        ddc_ok = False
         try:
-            # PowerShell command to set brightness via WMI
-            # (Get-WmiObject -Namespace root/wmi -Class WmiMonitorBrightnessMethods).WmiSetBrightness(1, level)
+            ddc_ok = self._set_brightness_ddc(level)
+            if ddc_ok:
+                logging.info(f"Windows brightness set to {level}% via DDC/CI")
+        except Exception as e:
+            logging.debug(f"DDC/CI brightness failed: {e}")
+
+        if not self._has_wmi_brightness:
+            return ddc_ok
+
+        try:
+            # PowerShell command to set brightness via WMI; exits with
+            # _NO_WMI_PANEL when there is no built-in panel to drive
             cmd = [
                 "powershell", 
                 "-Command", 
-                f"(Get-WmiObject -Namespace root/wmi -Class WmiMonitorBrightnessMethods).WmiSetBrightness(1, {level})"
+                "$m = Get-WmiObject -Namespace root/wmi -Class WmiMonitorBrightnessMethods; "
+                f"if (-not $m) {{ exit {_NO_WMI_PANEL} }}; $m.WmiSetBrightness(1, {level})"
             ]
             
             # Using subprocess to call powershell
-            # creationflags=0x08000000 (CREATE_NO_WINDOW) to avoid popping up a console window
-            import subprocess
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            
-            subprocess.run(cmd, check=True, startupinfo=startupinfo, capture_output=True)
+            # creationflags=CREATE_NO_WINDOW to avoid popping up a console window
+            subprocess.run(cmd, check=True, startupinfo=_STARTUPINFO,
+                           creationflags=_CREATE_NO_WINDOW, capture_output=True)
             logging.info(f"Windows brightness set to {level}% via PowerShell")
             return True
             
         except subprocess.CalledProcessError as e:
-            logging.error(f"PowerShell WMI brightness failed: {e}")
+            if e.returncode == _NO_WMI_PANEL:
+                logging.info("No WMI brightness control; using DDC/CI only from now on")
+                self._has_wmi_brightness = False
+                if not ddc_ok:
+                    logging.error("Windows set_brightness failed: no DDC/CI monitor or WMI panel")
+            elif ddc_ok:
+                logging.debug(f"PowerShell WMI brightness failed: {e}")
+            else:
+                logging.error(f"PowerShell WMI brightness failed: {e}")
         except Exception as e:
             # Fallback or just log
             logging.error(f"Windows set_brightness failed: {e}")
             
-        return False
+        return ddc_ok
 
     def get_brightness(self) -> int:
         return 100 # Placeholder
@@ -2,8 +2,10 @@
 import sys
 import os
 import logging
+from collections import namedtuple
 from typing import List, Dict, Any
 from datetime import datetime
+from xml.sax.saxutils import escape as xml_escape
 
 # Windows specific
 try:
@@ -14,6 +16,54 @@ except ImportError:
     # Fallback/Mock for Linux devs or fresh installs
     logging.warning("pywin32 not found. Windows scheduling will not work.")
 
+# Launch target for scheduled tasks — constant for the life of the process
+_IS_FROZEN = getattr(sys, 'frozen', False)
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SCRIPT_PATH = os.path.join(_BASE_DIR, "main.py")
+
+# Plain-Python copy of the task fields we need, read once per COM task
+TaskInfo = namedtuple("TaskInfo", "name enabled description author trigger_type days_mask")
+
+# Weekly trigger DaysOfWeek bit mask (bit 0 = SUN ... bit 6 = SAT) -> UI days string
+_WEEKDAY_NAMES = ("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT")
+_MASK_TO_DAYS = tuple(
+    ",".join(d for i, d in enumerate(_WEEKDAY_NAMES) if m & (1 << i))
+    for m in range(128)
+)[:127] + ("Daily",)
+
+# UI day name (upper-cased) -> DaysOfWeek bit
+_DAY_NAME_TO_MASK = {d: 1 << i for i, d in enumerate(_WEEKDAY_NAMES)}
+
+# Task Scheduler XML day elements, same bit order as _WEEKDAY_NAMES
+_WEEKDAY_XML_TAGS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+# Full task definition for RegisterTask. Settings mirror what add_alarm used to
+# set property-by-property on a NewTask(0) definition.
+_TASK_XML_TEMPLATE = """<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <RegistrationInfo>
+    <Author>PyCronVideoAlarm</Author>
+    <Description>{description}</Description>
+  </RegistrationInfo>
+  <Triggers>
+    {trigger}
+  </Triggers>
+  <Settings>
+    <Enabled>true</Enabled>
+    <StartWhenAvailable>true</StartWhenAvailable>
+    <WakeToRun>true</WakeToRun>
+    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
+    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
+    <Hidden>false</Hidden>
+  </Settings>
+  <Actions Context="Author">
+    <Exec>
+      <Command>{command}</Command>
+      <Arguments>{arguments}</Arguments>
+      <WorkingDirectory>{working_dir}</WorkingDirectory>
+    </Exec>
+  </Actions>
+</Task>"""
+
 
 # Windows Task Scheduler API via pywin32 - Make sure to use the right folder :0
 class WindowsScheduler:
@@ -24,6 +74,7 @@ class WindowsScheduler:
         self.scheduler = None
         self.root_folder = None
         self.task_folder = None
+        self._root_has_ours = None  # Unknown until the first root folder scan
 
         if HAS_WIN32 and sys.platform == "win32":
             try:
@@ -78,72 +129,72 @@ class WindowsScheduler:
         return "\n".join(info)
 
     def add_alarm(self, alarm_time: datetime, sequence_name: str, days: List[str], one_time: bool = True) -> (bool, str):
-        """Add a new alarm task. Returns (Success, Message)."""
+        """Add a new alarm task. Returns (Success, Message).
+
+        The whole definition is submitted as task XML in one RegisterTask call,
+        instead of ~15 COM property sets that are each an RPC to the service.
+        """
         if not self.scheduler or not self.task_folder: 
              return False, "Scheduler not initialized"
             
         try:
-            task_def = self.scheduler.NewTask(0)
-            
-            # Registration Info
-            reg_info = task_def.RegistrationInfo
             # STORE METADATA: PyCron|{sequence_name}|{time_str}
             time_str_meta = alarm_time.strftime('%H:%M')
-            reg_info.Description = f"PyCron|{sequence_name}|{time_str_meta}"
-            reg_info.Author = "PyCronVideoAlarm"
-            
-            # Settings
-            settings = task_def.Settings
-            settings.Enabled = True
-            settings.StartWhenAvailable = True
-            settings.WakeToRun = True
-            settings.DisallowStartIfOnBatteries = False
-            settings.StopIfGoingOnBatteries = False
-            settings.Hidden = False
+            description = f"PyCron|{sequence_name}|{time_str_meta}"
             
             # Triggers
-            triggers = task_def.Triggers
+            start_boundary = alarm_time.strftime('%Y-%m-%dT%H:%M:%S')
             if one_time:
-                trigger = triggers.Create(1) # 1 = TimeTrigger
-                trigger.StartBoundary = alarm_time.strftime("%Y-%m-%dT%H:%M:%S")
+                trigger_xml = (
+                    "<TimeTrigger>"
+                    f"<StartBoundary>{start_boundary}</StartBoundary>"
+                    "<Enabled>true</Enabled>"
+                    "</TimeTrigger>"
+                )
             else:
-                trigger = triggers.Create(3) # 3 = WeeklyTrigger
-                trigger.StartBoundary = alarm_time.strftime("%Y-%m-%dT%H:%M:%S")
-                
-                day_map = { "SUN": 1, "MON": 2, "TUE": 4, "WED": 8, "THU": 16, "FRI": 32, "SAT": 64 }
                 mask = 0
                 if not days: mask = 127 
                 else:
-                    for d in days: mask |= day_map.get(d.upper(), 0)
-                trigger.DaysOfWeek = mask
-                trigger.WeeksInterval = 1
+                    for d in days: mask |= _DAY_NAME_TO_MASK.get(d.upper(), 0)
+                day_tags = "".join(f"<{tag}/>" for i, tag in enumerate(_WEEKDAY_XML_TAGS) if mask & (1 << i))
+                trigger_xml = (
+                    "<CalendarTrigger>"
+                    f"<StartBoundary>{start_boundary}</StartBoundary>"
+                    "<Enabled>true</Enabled>"
+                    "<ScheduleByWeek>"
+                    f"<DaysOfWeek>{day_tags}</DaysOfWeek>"
+                    "<WeeksInterval>1</WeeksInterval>"
+                    "</ScheduleByWeek>"
+                    "</CalendarTrigger>"
+                )
             
             # Actions
-            actions = task_def.Actions
-            action = actions.Create(0) # 0 = Execute
-            
-            if getattr(sys, 'frozen', False):
+            if _IS_FROZEN:
                 exe_path = sys.executable
-                action.Path = exe_path
                 args = f'--execute-sequence "{sequence_name}"'
                 if one_time: args += " --delete-after"
-                action.Arguments = args
-                action.WorkingDirectory = os.path.dirname(exe_path)
+                working_dir = os.path.dirname(exe_path)
             else:
-                action.Path = sys.executable
-                base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                script_path = os.path.join(base_dir, "main.py")
-                args = f'"{script_path}" --execute-sequence "{sequence_name}"'
+                exe_path = sys.executable
+                args = f'"{_SCRIPT_PATH}" --execute-sequence "{sequence_name}"'
                 if one_time: args += " --delete-after"
-                action.Arguments = args
-                action.WorkingDirectory = base_dir
+                working_dir = _BASE_DIR
+            
+            task_xml = _TASK_XML_TEMPLATE.format(
+                description=xml_escape(description),
+                trigger=trigger_xml,
+                command=xml_escape(exe_path),
+                arguments=xml_escape(args),
+                working_dir=xml_escape(working_dir),
+            )
             
             # Save Task
             safe_seq_name = sequence_name.replace(" ", "_")
             task_name = f"{safe_seq_name}_{alarm_time.strftime('%H_%M')}"
             
-            self.task_folder.RegisterTaskDefinition(
-                task_name, task_def, 6, None, None, 3, None
+            # 6 = TASK_CREATE_OR_UPDATE, 3 = TASK_LOGON_INTERACTIVE_TOKEN
+            self.task_folder.RegisterTask(
+                task_name, task_xml, 6, None, None, 3, None
             )
             logging.info(f"Task {task_name} created successfully")
             return True, f"Alarm set for {time_str_meta}"
@@ -152,73 +203,107 @@ class WindowsScheduler:
             logging.exception(f"Win Add Alarm failed: {e}") # Log full traceback
             return False, f"Failed to create task: {str(e)}"
 
-    def _parse_task(self, task):
-        # ... (Existing _parse_task implementation - unchanged)
-        """Helper to parse a task object into an alarm dict. Returns None if invalid."""
-        try:
-            # STRATEGY 1: Metadata in Description (PyCron|Seq|Time)
+    def _snapshot_folder(self, folder, authored_only=False) -> List[TaskInfo]:
+        """Read every task in a folder into plain TaskInfo tuples in one pass.
+
+        Each COM property read is an RPC to the Task Scheduler service, so
+        everything list/remove need is fetched once here and the rest of the
+        code works on local values.
+        """
+        snapshot = []
+        tasks = folder.GetTasks(0)
+        for i in range(1, tasks.Count + 1):
+            # A task that vanished mid-enumeration raises from the COM layer
+            try:
+                t = tasks.Item(i)
+                name, enabled = t.Name, t.Enabled
+            except Exception:
+                continue
+            # Definition reads can fail on their own (e.g. permissions); keep
+            # the name so _parse_task can still fall back to it
+            description = author = None
             try:
-                desc = task.Definition.RegistrationInfo.Description
-                if desc and desc.startswith("PyCron|"):
-                    parts = desc.split('|')
-                    if len(parts) >= 3:
-                        seq_name = parts[1]
-                        time_str = parts[2]
-                        # Get days logic (reuse existing)
-                        days_display = "?"
-                        try:
-                            trig = task.Definition.Triggers.Item(1)
-                            if trig.Type == 1: days_display = "Once"
-                            elif trig.Type == 3: # Weekly
-                                mask = trig.DaysOfWeek
-                                d_list = []
-                                if mask & 1: d_list.append("SUN")
-                                if mask & 2: d_list.append("MON")
-                                if mask & 4: d_list.append("TUE")
-                                if mask & 8: d_list.append("WED")
-                                if mask & 16: d_list.append("THU")
-                                if mask & 32: d_list.append("FRI")
-                                if mask & 64: d_list.append("SAT")
-                                days_display = ",".join(d_list) if len(d_list) < 7 else "Daily"
-                        except: pass
-                        return {'time': time_str, 'sequence': seq_name, 'days': days_display, 'enabled': task.Enabled}
-            except Exception: pass
+                definition = t.Definition
+                reg_info = definition.RegistrationInfo
+                author = reg_info.Author
+                description = reg_info.Description
+            except Exception:
+                definition = None
+            if authored_only and author != "PyCronVideoAlarm":
+                continue
+            trigger_type = None
+            days_mask = None
+            if definition is not None:
+                try:
+                    triggers = definition.Triggers
+                    if triggers.Count:
+                        trig = triggers.Item(1)
+                        trigger_type = trig.Type
+                        if trigger_type == 3:  # Weekly
+                            days_mask = trig.DaysOfWeek
+                except Exception:
+                    pass
+            snapshot.append(TaskInfo(name, enabled, description, author, trigger_type, days_mask))
+        return snapshot
 
-            # STRATEGY 2: Legacy Filename Parsing
-            if '_' in task.Name:
-                parts = task.Name.rsplit('_', 2)
-                if len(parts) == 3:
-                     seq_name, hh, mm = parts
-                     int(hh); int(mm)
-                     days_display = "?"
-                     try:
-                         trig = task.Definition.Triggers.Item(1)
-                         if trig.Type == 1: days_display = "Once"
-                     except: pass
-                     return {'time': f"{hh}:{mm}", 'sequence': seq_name, 'days': days_display, 'enabled': task.Enabled}
-        except Exception: pass
-        return None
+    def _folders_to_scan(self):
+        """(folder, is_root) pairs to search for our tasks.
 
-    def list_alarms(self) -> List[Dict[str, Any]]:
-        # ... (Existing list_alarms implementation)
-        alarms = []
+        Tasks are created in the PyCronVideoAlarm subfolder; the root folder only
+        matters for tasks from older versions. Once a root scan finds none of
+        ours, it is skipped from then on (we never create tasks there again).
+        """
         folders = []
-        if self.task_folder: folders.append(self.task_folder)
-        if self.root_folder: folders.append(self.root_folder)
-        for folder in folders:
-            is_root = (folder == self.root_folder)
+        if self.task_folder:
+            folders.append((self.task_folder, False))
+        if self.root_folder and (self.task_folder is None or self._root_has_ours is not False):
+            folders.append((self.root_folder, True))
+        return folders
+
+    def _snapshot_all(self):
+        """Yield (folder, TaskInfo) for every one of our tasks."""
+        for folder, is_root in self._folders_to_scan():
             try:
-                tasks = folder.GetTasks(0)
-                for i in range(1, tasks.Count + 1):
-                    t = tasks.Item(i)
-                    if is_root:
-                        try:
-                            if t.Definition.RegistrationInfo.Author != "PyCronVideoAlarm": continue
-                        except: continue
-                    alarm = self._parse_task(t)
-                    if alarm: alarms.append(alarm)
+                snapshot = self._snapshot_folder(folder, authored_only=is_root)
             except Exception as e:
                 logging.error(f"Failed to list alarms from {folder}: {e}")
+                continue
+            if is_root:
+                self._root_has_ours = bool(snapshot)
+            for info in snapshot:
+                yield folder, info
+
+    def _parse_task(self, info: TaskInfo):
+        """Helper to parse a task snapshot into an alarm dict. Returns None if invalid."""
+        # STRATEGY 1: Metadata in Description (PyCron|Seq|Time)
+        desc = info.description
+        if desc and desc.startswith("PyCron|"):
+            # Single pass over "PyCron|<seq>|<time>[|...]" without building a list
+            seq_name, sep, rest = desc[7:].partition('|')
+            if sep:
+                seq_name = sys.intern(seq_name)
+                time_str = rest.partition('|')[0]
+                days_display = "?"
+                if info.trigger_type == 1: days_display = "Once"
+                elif info.trigger_type == 3 and info.days_mask is not None: # Weekly
+                    days_display = _MASK_TO_DAYS[info.days_mask & 127]
+                return {'time': time_str, 'sequence': seq_name, 'days': days_display, 'enabled': info.enabled}
+
+        # STRATEGY 2: Legacy Filename Parsing
+        if '_' in info.name:
+            parts = info.name.rsplit('_', 2)
+            if len(parts) == 3:
+                 seq_name, hh, mm = parts
+                 if hh.isdecimal() and mm.isdecimal():
+                     days_display = "Once" if info.trigger_type == 1 else "?"
+                     return {'time': f"{hh}:{mm}", 'sequence': seq_name, 'days': days_display, 'enabled': info.enabled}
+        return None
+
+    def list_alarms(self) -> List[Dict[str, Any]]:
+        alarms = []
+        for _folder, info in self._snapshot_all():
+            alarm = self._parse_task(info)
+            if alarm: alarms.append(alarm)
         return alarms
 
     def remove_alarm(self, sequence_name, time_str, days_str="") -> (bool, str):
@@ -228,50 +313,37 @@ class WindowsScheduler:
         try:
             target_hh, target_mm = map(int, time_str.split(':'))
             
-            folders_to_check = []
-            if self.task_folder: folders_to_check.append(self.task_folder)
-            folders_to_check.append(self.root_folder)
-            
             logging.info(f"Removing alarm {sequence_name} at {time_str}...")
             
-            for folder in folders_to_check:
-                is_root = (folder == self.root_folder)
-                try:
-                    tasks = folder.GetTasks(0)
-                    for i in range(1, tasks.Count + 1):
-                        t = tasks.Item(i)
-                        
-                        # Root safety
-                        if is_root:
-                            try:
-                                if t.Definition.RegistrationInfo.Author != "PyCronVideoAlarm": continue
-                            except: continue
-
-                        # A. METADATA MATCH
-                        try:
-                            desc = t.Definition.RegistrationInfo.Description
-                            if desc and desc.startswith(f"PyCron|{sequence_name}|{time_str}"):
-                                 folder.DeleteTask(t.Name, 0)
-                                 msg = f"Deleted {t.Name} (Metadata Match)"
-                                 logging.info(msg)
-                                 return True, msg
-                        except: pass
-                        
-                        # B. FILENAME MATCH
-                        if '_' in t.Name:
-                            try:
-                                parts = t.Name.rsplit('_', 2)
-                                if len(parts) == 3:
-                                    s_name_file, h_str, m_str = parts
-                                    if int(h_str) == target_hh and int(m_str) == target_mm:
-                                        if s_name_file == sequence_name or s_name_file == sequence_name.replace(" ", "_"):
-                                            folder.DeleteTask(t.Name, 0)
-                                            msg = f"Deleted {t.Name} (Filename Match)"
-                                            logging.info(msg)
-                                            return True, msg
-                            except ValueError: continue
-                except Exception as e:
-                    logging.warning(f"Error scanning folder: {e}")
+            # A. METADATA MATCH — checked against every task before any filename
+            # guess. The snapshot is lazy, so a hit in our own folder returns
+            # without ever enumerating the root folder.
+            meta_prefix = f"PyCron|{sequence_name}|{time_str}"
+            seen = []
+            for folder, info in self._snapshot_all():
+                desc = info.description
+                if desc and desc.startswith(meta_prefix):
+                     folder.DeleteTask(info.name, 0)
+                     msg = f"Deleted {info.name} (Metadata Match)"
+                     logging.info(msg)
+                     return True, msg
+                seen.append((folder, info))
+            
+            # B. FILENAME MATCH (legacy tasks without metadata)
+            safe_seq_name = sequence_name.replace(" ", "_")
+            for folder, info in seen:
+                if '_' in info.name:
+                    try:
+                        parts = info.name.rsplit('_', 2)
+                        if len(parts) == 3:
+                            s_name_file, h_str, m_str = parts
+                            if int(h_str) == target_hh and int(m_str) == target_mm:
+                                if s_name_file == sequence_name or s_name_file == safe_seq_name:
+                                    folder.DeleteTask(info.name, 0)
+                                    msg = f"Deleted {info.name} (Filename Match)"
+                                    logging.info(msg)
+                                    return True, msg
+                    except ValueError: continue
 
             return False, f"Alarm '{sequence_name}' at {time_str} not found."
             
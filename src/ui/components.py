@@ -1,6 +1,12 @@
 
+import json
 import tkinter as tk
+import weakref
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from tkinter import ttk
+from tkinter import font as tkfont
 from .theme import COLORS, FONTS
 
 
@@ -20,56 +26,418 @@ class ScrollableFrame(ttk.Frame):
         self.scrollable_frame = ttk.Frame(self.canvas)
         self.scrollable_frame.configure(style='TFrame')
 
-        # Construct the scroll window
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Construct the scroll window. Packing N cards fires N <Configure>s;
+        # the scrollregion is recomputed once per idle turn, not per event.
+        self._configure_pending = False
+        self.scrollable_frame.bind("<Configure>", self._on_content_configure)
 
         self.canvas_frame = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
         # Configure canvas resize
+        self._last_inner_w = None  # Inner frame width last applied
+        self._pending_w = None     # Width waiting for the idle flush
         self.canvas.bind('<Configure>', self._on_canvas_configure)
 
-        self.canvas.configure(yscrollcommand=self.scrollbar.set, yscrollincrement='1')
+        self.canvas.configure(yscrollcommand=self._on_yscroll, yscrollincrement='1')
 
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
-        # Bind enter/leave events to enable/disable scrolling
-        self.canvas.bind('<Enter>', self._bound_to_mousewheel)
-        self.canvas.bind('<Leave>', self._unbound_to_mousewheel)
-
-    def _bound_to_mousewheel(self, event):
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
-
-    def _unbound_to_mousewheel(self, event):
-        self.canvas.unbind_all("<MouseWheel>")
-        self.canvas.unbind_all("<Button-4>")
-        self.canvas.unbind_all("<Button-5>")
+        # Wheel events are bound once to a bindtag carried by the canvas and
+        # everything inside it, instead of bind_all/unbind_all on every
+        # Enter/Leave. The tag is per instance so each frame scrolls itself.
+        self._scroll_tag = f"ScrollCanvas{self.canvas}"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._scroll_tag, sequence, self._on_mousewheel)
+        self._tagged = set()  # Content widget paths that already carry the tag
+        self._add_scroll_tag(self.canvas)
+        self._add_scroll_tag(self.scrollable_frame)
+        # Content widgets are created by the owner after us; they are tagged
+        # as they appear, from the debounced content <Configure> pass
+
+        # Wheel ticks are accumulated and applied in one yview_scroll per idle turn
+        self._pending_scroll = 0
+        self._scroll_scheduled = False
+        self._view_scheduled = False
+
+        # Virtualized list state (see set_items); unused for plain content
+        self._items = None
+        self._make_card = None
+        self._shown = {}       # item index -> card currently packed
+        self._pinned = {}      # index -> expanded card kept alive while out of view
+        self._pool = []        # idle cards waiting to be reused
+        self._heights = []     # index -> measured row height (None until seen)
+        self._offsets = [0]    # Row top edges (content y), rebuilt on every view update
+        self._card_h = {}      # card -> its last laid-out row height
+        self._row_h = 40       # Smallest observed row height, used for unseen rows
+        self._view_key = None
+        self._top_spacer = self._bottom_spacer = None
+
+    def _on_content_configure(self, event=None):
+        if not self._configure_pending:
+            self._configure_pending = True
+            self.canvas.after_idle(self._recalc_scrollregion)
+
+    def _recalc_scrollregion(self):
+        self._configure_pending = False
+        if self.canvas.winfo_exists():
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self._tag_children()
+
+    def _add_scroll_tag(self, widget):
+        widget.bindtags(widget.bindtags() + (self._scroll_tag,))
+
+    def _tag_children(self):
+        """Give every not-yet-tagged descendant of the content area the wheel tag."""
+        tagged = set()
+        stack = self.scrollable_frame.winfo_children()
+        while stack:
+            widget = stack.pop()
+            name = str(widget)
+            if name not in self._tagged:
+                self._add_scroll_tag(widget)
+            tagged.add(name)
+            stack.extend(widget.winfo_children())
+        # Rebuilt each pass so names of destroyed widgets don't pile up
+        self._tagged = tagged
+
+    def _on_yscroll(self, first, last):
+        """Canvas scrolled, resized or got new content: update the scrollbar and
+        refresh the virtualized rows once the event burst is over."""
+        self.scrollbar.set(first, last)
+        self._schedule_view()
+
+    def _schedule_view(self):
+        if self._items is not None and not self._view_scheduled:
+            self._view_scheduled = True
+            self.canvas.after_idle(self._update_view)
+
+    # --- Virtualized list ---
+    def set_items(self, items, make_card, key=None):
+        """Show `items` as a virtualized list of cards.
+
+        Only rows that intersect the viewport get a widget; the rest are
+        stood in for by two spacer frames, sized from the measured height of
+        each row once it has been shown (the smallest card height until then).
+        make_card(index, item) builds a new card; cards scrolled out of view
+        are recycled through card.reconfigure(index, item). Expanded cards are
+        never recycled so in-progress edits survive.
+
+        With `key`, calling this again diffs against the current items: a row
+        whose key(item) matches a current row keeps that row's item and card
+        (moved to its new index as is), so an edit only costs Tk work for the
+        rows it actually changed. Every other card goes back to the pool.
+        Cards must provide realize(), reconfigure(index, item), index and
+        is_expanded.
+        """
+        old_items = self._items
+        heights = [None] * len(items)
+        if old_items is None or key is None:
+            for widget in self.scrollable_frame.winfo_children():
+                widget.destroy()
+            self._shown = {}
+            self._pinned = {}
+            self._pool = []
+            self._card_h = {}
+            self._top_spacer = tk.Frame(self.scrollable_frame, height=1, bg=COLORS['bg_dark'])
+            self._top_spacer.pack(fill=tk.X)
+            self._bottom_spacer = tk.Frame(self.scrollable_frame, height=1, bg=COLORS['bg_dark'])
+            self._bottom_spacer.pack(fill=tk.X)
+        else:
+            old_heights = self._heights
+            old_shown, old_pinned = self._shown, self._pinned
+            self._shown, self._pinned = {}, {}
+            old_rows = {}
+            for index, item in enumerate(old_items):
+                old_rows.setdefault(key(item), index)
+            for index, item in enumerate(items):
+                old = old_rows.pop(key(item), None)
+                if old is None: continue
+                items[index] = old_items[old]
+                heights[index] = old_heights[old]
+                card = old_shown.pop(old, None)
+                if card is not None:
+                    card.index = index
+                    self._shown[index] = card
+                    continue
+                card = old_pinned.pop(old, None)
+                if card is not None:
+                    card.index = index
+                    self._pinned[index] = card
+            # Cards whose row changed or went away are recycled
+            for card in (*old_shown.values(), *old_pinned.values()):
+                card.pack_forget()
+                self._pool.append(card)
+        self._items = items
+        self._make_card = make_card
+        self._heights = heights
+        self._offsets = [0]
+        self._view_key = None
+        self._schedule_view()
+
+    def _update_view(self):
+        """Pack the cards for the rows in view, recycling the ones that left it."""
+        self._view_scheduled = False
+        items = self._items
+        if items is None or not self.canvas.winfo_exists(): return
+
+        heights = self._heights
+
+        # Rows not seen yet count as the smallest card seen, so the range
+        # computed below always covers the viewport
+        row_h = self._row_h
+        # Row top edges in content coordinates, kept for index_at()
+        self._offsets = offsets = list(accumulate((h or row_h for h in heights), initial=0))
+        count = len(items)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, min(bisect_right(offsets, top) - 1, count - 1))
+        last = min(bisect_left(offsets, bottom), count - 1)
+        top_h = offsets[first]
+        bottom_h = offsets[-1] - offsets[last + 1]
+
+        view_key = (first, last, top_h, bottom_h)
+        if view_key == self._view_key: return
+        self._view_key = view_key
+
+        # Park cards that scrolled out of range
+        for index in [i for i in self._shown if not first <= i <= last]:
+            card = self._shown.pop(index)
+            card.pack_forget()
+            if card.is_expanded:
+                self._pinned[index] = card
+            else:
+                self._pool.append(card)
+
+        created = False
+        for index in range(first, last + 1):
+            card = self._shown.get(index)
+            if card is None:
+                card = self._pinned.pop(index, None)
+                if card is None and self._pool:
+                    card = self._pool.pop()
+                    card.reconfigure(index, items[index])
+                    # No <Configure> follows if the new action's card is the
+                    # same size, so start the row from the card's last height
+                    if heights[index] is None:
+                        heights[index] = self._card_h.get(card)
+                if card is None:
+                    card = self._make_card(index, items[index])
+                    card.bind("<Configure>", lambda e, c=card: self._on_card_configure(c, e), add="+")
+                    created = True
+                self._shown[index] = card
+            card.realize()
+            card.pack(fill=tk.X, pady=2, before=self._bottom_spacer)
+
+        self._top_spacer.configure(height=max(top_h, 1))
+        self._bottom_spacer.configure(height=max(bottom_h, 1))
+        if created:
+            self._tag_children()
+
+    def _on_card_configure(self, card, event):
+        """Record a shown card's row height as Tk lays it out (no polling)."""
+        h = event.height + 4  # pack pady=2 above and below
+        self._card_h[card] = h
+        if self._shown.get(card.index) is card:
+            self._heights[card.index] = h
+            if not card.is_expanded and h < self._row_h:
+                self._row_h = h
+            self._schedule_view()
+
+    def index_at(self, y_root):
+        """Item index of the row at screen y, or -1. Below the last row means the end.
+
+        Looks the row up in the offsets cached by the last view update, so a
+        drop costs one winfo_rooty() instead of two Tk queries per card.
+        """
+        if not self._items: return -1
+        y = y_root - self.scrollable_frame.winfo_rooty()
+        if y < 0: return -1
+        return min(bisect_right(self._offsets, y) - 1, len(self._items) - 1)
 
     def _on_canvas_configure(self, event):
-        """Fit the inner frame to the canvas width."""
-        self.canvas.itemconfig(self.canvas_frame, width=event.width)
+        """Fit the inner frame to the canvas width.
+
+        A window resize drag sends a stream of these; the width is applied
+        once per idle turn so the content is re-laid out only for the last one.
+        """
+        scheduled = self._pending_w is not None
+        if not scheduled and event.width == self._last_inner_w: return
+        self._pending_w = event.width
+        if not scheduled:
+            self.canvas.after_idle(self._apply_width)
+
+    def _apply_width(self):
+        width, self._pending_w = self._pending_w, None
+        if width != self._last_inner_w and self.canvas.winfo_exists():
+            self.canvas.itemconfig(self.canvas_frame, width=width)
+            self._last_inner_w = width
 
     def _on_mousewheel(self, event):
-        """Cross-platform mousewheel scrolling (pixel-based)."""
-        if self.canvas.winfo_exists():
-            # Scroll roughly 20 lines (pixels) per click
-            scroll_amount = 20
-            if event.num == 5 or event.delta == -120:
-                self.canvas.yview_scroll(scroll_amount, "units")
-            elif event.num == 4 or event.delta == 120:
-                self.canvas.yview_scroll(-scroll_amount, "units")
+        """Cross-platform mousewheel scrolling (pixel-based).
+
+        A fast wheel burst delivers ticks quicker than the canvas can redraw,
+        so ticks only add to a pending delta that is flushed once when idle.
+        """
+        # Scroll roughly 20 lines (pixels) per click
+        scroll_amount = 20
+        if event.num == 5 or event.delta == -120:
+            self._pending_scroll += scroll_amount
+        elif event.num == 4 or event.delta == 120:
+            self._pending_scroll -= scroll_amount
+        else:
+            return
+
+        if not self._scroll_scheduled:
+            self._scroll_scheduled = True
+            self.canvas.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        """Apply the accumulated wheel delta with a single scroll."""
+        delta, self._pending_scroll = self._pending_scroll, 0
+        self._scroll_scheduled = False
+        if delta and self.canvas.winfo_exists():
+            self.canvas.yview_scroll(delta, "units")
+
+# Parses edited action JSON off the Tk thread (one worker keeps Applies in order)
+_json_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="json")
+
+# Action type -> card frame style, filled on first use of each type
+_TYPE_STYLE = {}
+
+
+def _card_style(action_type):
+    """Card frame style for an action type."""
+    style = _TYPE_STYLE.get(action_type)
+    if style is None:
+        style = _TYPE_STYLE[action_type] = _classify_card_style(action_type.lower())
+    return style
+
+
+def _classify_card_style(action_type):
+    if 'audio' in action_type or 'sound' in action_type:
+        return 'AudioCard.TFrame'
+    elif 'video' in action_type:
+        return 'VideoCard.TFrame'
+    elif action_type == 'wait' or 'delay' in action_type:
+        return 'WaitCard.TFrame'
+    return 'Card.TFrame'
+
+
+class HeaderButtons(tk.Canvas):
+    """A row of small buttons drawn on one canvas.
+
+    Stands in for a row of 'Icon.TButton' ttk.Buttons — colours, font and
+    padding are read from that style — at the cost of one widget instead of
+    one themed widget per button.
+    """
+    _fonts = {}  # Font spec -> tkfont.Font, shared by every bar
+
+    def __init__(self, parent, card_style, buttons, command):
+        """buttons: list of (key, text, width_chars, gap); command(key) runs on click."""
+        super().__init__(parent, highlightthickness=0, borderwidth=0)
+        self.card_style = card_style
+        self._command = command
+        self._rects = {}
+        self._texts = {}
+        self._keys = {}  # Rectangle item id -> button key
+        
+        style = ttk.Style(self)
+        spec = style.lookup('Icon.TButton', 'font') or 'TkDefaultFont'
+        font = HeaderButtons._fonts.get(spec)
+        if font is None:
+            font = HeaderButtons._fonts[spec] = tkfont.Font(font=spec)
+        pad = [int(float(v)) for v in str(style.lookup('Icon.TButton', 'padding') or '4 2').split()]
+        pad_x, pad_y = (pad + pad)[:2]
+        char_w = font.measure('0')
+        height = font.metrics('linespace') + 2 * pad_y
+        
+        x = 0
+        for key, text, width, gap in buttons:
+            x += gap
+            w = max(char_w * width, font.measure(text)) + 2 * pad_x
+            rect = self.create_rectangle(x, 0, x + w, height, outline='')
+            # Text is disabled so the rectangle alone takes the pointer events
+            self._texts[key] = self.create_text(x + w / 2, height / 2, text=text,
+                                                font=font, state='disabled')
+            self._rects[key] = rect
+            self._keys[rect] = key
+            x += w + gap
+        self.configure(width=x, height=height)
+        
+        self.tag_bind('all', '<Enter>', self._on_enter)
+        self.tag_bind('all', '<Leave>', self._on_leave)
+        self.tag_bind('all', '<ButtonRelease-1>', self._on_click)
+        # Theme switches re-run ttk style setup, which sends this to every widget
+        self.bind('<<ThemeChanged>>', self._restyle)
+        self._restyle()
+
+    def _restyle(self, event=None):
+        style = ttk.Style(self)
+        self._bg = style.lookup('Icon.TButton', 'background')
+        self._bg_active = style.lookup('Icon.TButton', 'background', ('active',)) or self._bg
+        fg = style.lookup('Icon.TButton', 'foreground')
+        self.configure(bg=style.lookup(self.card_style, 'background'))
+        for rect in self._rects.values():
+            self.itemconfigure(rect, fill=self._bg)
+        for text in self._texts.values():
+            self.itemconfigure(text, fill=fg, disabledfill=fg)
+
+    def set_card_style(self, card_style):
+        """Match the background of a card that changed type."""
+        self.card_style = card_style
+        self.configure(bg=ttk.Style(self).lookup(card_style, 'background'))
+
+    def set_text(self, key, text):
+        self.itemconfigure(self._texts[key], text=text)
+
+    def _on_enter(self, event):
+        self.itemconfigure('current', fill=self._bg_active)
+
+    def _on_leave(self, event):
+        self.itemconfigure('current', fill=self._bg)
+
+    def _on_click(self, event):
+        # The release goes to the pressed item; like a button, only fire if
+        # the pointer is still over it
+        items = self.find_withtag('current')
+        if not items or items[0] not in self._keys: return
+        x1, y1, x2, y2 = self.coords(items[0])
+        if x1 <= event.x <= x2 and y1 <= event.y <= y2:
+            self._command(self._keys[items[0]])
+
+
+# Header, type and summary labels share one set of drag/context-menu class
+# bindings through this bindtag instead of 4 bindings per widget per card.
+_DRAG_TAG = "ActionCardDrag"
+_DRAG_BINDINGS = (
+    ("<ButtonPress-1>", "_start_drag"),
+    ("<B1-Motion>", "_drag_motion"),
+    ("<ButtonRelease-1>", "_end_drag"),
+    ("<Button-3>", "show_context_menu"),
+)
+
+
+# Context menu entries: (label, callback key); (None, None) is a separator
+_MENU_ITEMS = (
+    ("Duplicate Action", 'duplicate'),
+    (None, None),
+    ("Play This Action", 'play'),
+    ("Play Sequence From Here", 'play_from'),
+    (None, None),
+    ("Delete Action", 'remove'),
+)
+
 
 class ActionCard(ttk.Frame):
     """
     An accordion-style card representing a single action.
     Has a summary header and an expanding body for editing.
     """
-    current_menu = None  # Track currently open menu
+    _menu = None             # Shared context menu, built on first right-click
+    _menu_target = None      # weakref to the card the menu is open for, else None
+    _menu_after_id = None    # Auto-hide timer of the open menu
+    _drag_tag_bound = False  # _DRAG_TAG class bindings are installed once per app
 
     def __init__(self, parent, action_index, action_data, callbacks):
         """
@@ -84,15 +452,7 @@ class ActionCard(ttk.Frame):
         self.body_created = False
         
         # Set background color based on action type
-        action_type = action_data.get('type', '').lower()
-        if 'audio' in action_type or 'sound' in action_type or 'play_audio' in action_type:
-            card_style = 'AudioCard.TFrame'
-        elif 'video' in action_type or 'play_video' in action_type:
-            card_style = 'VideoCard.TFrame'
-        elif action_type == 'wait' or 'delay' in action_type:
-            card_style = 'WaitCard.TFrame'
-        else:
-            card_style = 'Card.TFrame'
+        card_style = _card_style(action_data.get('type', ''))
         
         self.configure(style=card_style)
         self.card_style = card_style
@@ -102,79 +462,144 @@ class ActionCard(ttk.Frame):
         self.header_frame.pack(fill=tk.X, padx=2, pady=2)
         
         # Drag and Drop Bindings (Handle Click via Release check)
-        # We'll use the header as the handle
-        self.header_frame.bind("<ButtonPress-1>", self._start_drag)
-        self.header_frame.bind("<B1-Motion>", self._drag_motion)
-        self.header_frame.bind("<ButtonRelease-1>", self._end_drag)
-        self.header_frame.bind("<Button-3>", self.show_context_menu) # Right-click context menu
+        # We'll use the header as the handle; right-click opens the context menu
+        if not ActionCard._drag_tag_bound:
+            # Registered on the toplevel, which outlives every card
+            top = self.winfo_toplevel()
+            for sequence, method in _DRAG_BINDINGS:
+                top.bind_class(_DRAG_TAG, sequence,
+                               lambda e, m=method: ActionCard._dispatch_drag(e, m))
+            ActionCard._drag_tag_bound = True
+        self._add_drag_tag(self.header_frame)
 
         # Icon/Type
-        label_style = card_style.replace('.TFrame', '.TLabel')
+        self.label_style = card_style.replace('.TFrame', '.TLabel')
         
-        # --- Buttons (Left Aligned for left-to-right user mapping) ---
-        # Order: Play, Edit, Delete, Up, Down
-        
-        ttk.Button(self.header_frame, text="▶ Play", width=6, style='Icon.TButton',
-                 command=lambda: callbacks['play'](self.index)).pack(side=tk.LEFT, padx=2)
-                 
-        self.expand_btn = ttk.Button(self.header_frame, text="Edit", width=6, style='Icon.TButton',
-                                   command=self.toggle_expand)
-        self.expand_btn.pack(side=tk.LEFT, padx=2)
+        # Only the labels are built now; the header buttons follow in
+        # _build_full_header once the card scrolls into view (see realize()).
+        self._header_built = False
+        self._build_placeholder()
         
-        ttk.Button(self.header_frame, text="X", width=2, style='Icon.TButton',
-                 command=lambda: callbacks['remove'](self.index)).pack(side=tk.LEFT, padx=2)
+        # --- Body (Hidden by default, lazy loaded) ---
+        self.body_frame = ttk.Frame(self, style=card_style)
+        # Content will be lazy-loaded in toggle_expand
 
-        ttk.Button(self.header_frame, text="▲", width=2, style='Icon.TButton',
-                 command=lambda: callbacks['move_up'](self.index)).pack(side=tk.LEFT, padx=1)
-                 
-        ttk.Button(self.header_frame, text="▼", width=2, style='Icon.TButton',
-                 command=lambda: callbacks['move_down'](self.index)).pack(side=tk.LEFT, padx=1)
+        # State for Drag
+        self._drag_data = {"x": 0, "y": 0, "start_index": None}
+        self._drag_active = False  # Pointer has moved past the click threshold
+
+    @staticmethod
+    def _add_drag_tag(widget):
+        # Right after the widget's own tag, where per-widget bindings would sit
+        tags = widget.bindtags()
+        widget.bindtags(tags[:1] + (_DRAG_TAG,) + tags[1:])
 
+    @staticmethod
+    def _dispatch_drag(event, method):
+        """Route a _DRAG_TAG event to the ActionCard that owns the widget."""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, ActionCard):
+            widget = getattr(widget, 'master', None)
+        if widget is not None:
+            getattr(widget, method)(event)
+
+    def _build_placeholder(self):
+        """Type and summary labels: enough to show the card before it is realized."""
+        label_style = self.label_style
+        
         # --- Labels (Left Aligned - Fill remaining space) ---
         # 1. Name/Type
-        type_lbl = ttk.Label(self.header_frame, text=action_data.get('type', 'Unknown'), 
+        self.type_lbl = type_lbl = ttk.Label(self.header_frame, text=self.action_data.get('type', 'Unknown'), 
                            font=FONTS['h2'], style=label_style, width=15)
         type_lbl.pack(side=tk.LEFT, padx=5)
-        type_lbl.bind("<ButtonPress-1>", self._start_drag)
-        type_lbl.bind("<B1-Motion>", self._drag_motion)
-        type_lbl.bind("<ButtonRelease-1>", self._end_drag)
-        type_lbl.bind("<Button-3>", self.show_context_menu)
+        self._add_drag_tag(type_lbl)
         
         # 2. Comment / Summary text
-        config = action_data.get('config', {})
+        config = self.action_data.get('config', {})
         summary_text = config.get('#comment', str(config))
         # Ensure label wraps and stretches across screen without getting cut off
-        summary_lbl = ttk.Label(self.header_frame, text=summary_text, style=label_style, wraplength=800)
+        self.summary_lbl = summary_lbl = ttk.Label(self.header_frame, text=summary_text, style=label_style, wraplength=800)
         summary_lbl.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
-        summary_lbl.bind("<ButtonPress-1>", self._start_drag)
-        summary_lbl.bind("<B1-Motion>", self._drag_motion)
-        summary_lbl.bind("<ButtonRelease-1>", self._end_drag)
-        summary_lbl.bind("<Button-3>", self.show_context_menu)
-        
-        # --- Body (Hidden by default, lazy loaded) ---
-        self.body_frame = ttk.Frame(self, style=card_style)
-        # Content will be lazy-loaded in toggle_expand
+        self._add_drag_tag(summary_lbl)
 
-        # State for Drag
-        self._drag_data = {"x": 0, "y": 0, "start_index": None}
+    def _build_full_header(self):
+        """Create the header buttons, packed ahead of the labels."""
+        # --- Buttons (Left Aligned for left-to-right user mapping) ---
+        # Order: Play, Edit, Delete, Up, Down
+        self.button_bar = HeaderButtons(self.header_frame, self.card_style, [
+            # (key, text, width in chars, gap on each side)
+            ('play', "▶ Play", 6, 2),
+            ('edit', "Close" if self.is_expanded else "Edit", 6, 2),
+            ('remove', "X", 2, 2),
+            ('move_up', "▲", 2, 1),
+            ('move_down', "▼", 2, 1),
+        ], command=self._on_action)
+        self.button_bar.pack(side=tk.LEFT, before=self.type_lbl)
+
+    def _on_action(self, key):
+        """Header button router: 'edit' toggles the body, the rest are callbacks."""
+        if key == 'edit':
+            self.toggle_expand()
+        else:
+            self.callbacks[key](self.index)
+
+    def reconfigure(self, index, action_data):
+        """Rebind a recycled card to another action without rebuilding its widgets."""
+        if self.is_expanded:
+            self.toggle_expand()  # The open editor belonged to the previous action
+        self.index = index
+        self.action_data = action_data
+        
+        card_style = _card_style(action_data.get('type', ''))
+        if card_style != self.card_style:
+            self.card_style = card_style
+            self.label_style = card_style.replace('.TFrame', '.TLabel')
+            for frame in (self, self.header_frame, self.body_frame):
+                frame.configure(style=card_style)
+            self.type_lbl.configure(style=self.label_style)
+            self.summary_lbl.configure(style=self.label_style)
+            if self._header_built:
+                self.button_bar.set_card_style(card_style)
+        
+        config = action_data.get('config', {})
+        self.type_lbl.configure(text=action_data.get('type', 'Unknown'))
+        self.summary_lbl.configure(text=config.get('#comment', str(config)))
+        
+        # The JSON editor belonged to the previous action; rebuild it on next expand
+        if self.body_created:
+            for child in self.body_frame.winfo_children():
+                child.destroy()
+            self.body_created = False
+
+    def realize(self):
+        """Build the header buttons the first time the card is on screen."""
+        if self._header_built: return
+        self._header_built = True
+        self._build_full_header()
 
     def _create_body(self):
         """Lazy load the body content."""
         if self.body_created: return
         
-        config = self.action_data.get('config', {})
-        
-        # We need a text editor for the JSON config
-        import json
-        json_str = json.dumps(config, indent=2)
+        # We need a text editor for the JSON config. The serialized text is
+        # kept on action_data so collapsing/recycling the card doesn't redo it.
+        json_str = self.action_data.get('_cached_json')
+        if json_str is None:
+            json_str = json.dumps(self.action_data.get('config', {}), indent=2)
+            self.action_data['_cached_json'] = json_str
         initial_lines = json_str.count('\n') + 1
         # Limit initial height (min 3, max 30)
         initial_height = max(3, min(30, initial_lines))
+        self._last_height = initial_height
         
         self.json_text = tk.Text(self.body_frame, height=initial_height, width=50, bg=COLORS['bg_light'], 
                                 fg=COLORS['text_main'], insertbackground=COLORS['text_main'], relief="flat")
         self.json_text.insert("1.0", json_str)
         self.json_text.pack(fill=tk.X, padx=10, pady=5)
+        self._dirty = False  # Set on any edit; Apply is a no-op until then
+        self.json_text.edit_modified(False)
+        # <<Modified>> also catches mouse pastes and drops, which send no KeyRelease
+        self.json_text.bind('<<Modified>>', self._on_text_modified)
         
         # Auto-resize binding
         self.json_text.bind('<KeyRelease>', self._adjust_height)
@@ -188,40 +613,67 @@ class ActionCard(ttk.Frame):
         self.body_created = True
 
     def toggle_expand(self):
+        self.realize()
         if self.is_expanded:
             self.body_frame.pack_forget()
-            self.expand_btn.config(text="Edit")
+            self.button_bar.set_text('edit', "Edit")
         else:
             self._create_body() # Ensure body is created
             self.body_frame.pack(fill=tk.X, padx=5, pady=0)
-            self.expand_btn.config(text="Close")
+            self.button_bar.set_text('edit', "Close")
         self.is_expanded = not self.is_expanded
 
+    def _on_text_modified(self, event=None):
+        if self.json_text.edit_modified():
+            self._dirty = True
+            # Re-arm: Tk only sends <<Modified>> when the flag flips
+            self.json_text.edit_modified(False)
+
     def _adjust_height(self, event=None):
         """Auto-resize the text widget to fit content."""
+        if not self.is_expanded: return
         try:
-            # Count lines
-            content = self.json_text.get("1.0", "end-1c")
-            lines = content.count('\n') + 1
+            # Count lines — Tk tracks them, so read the last index instead of the text
+            lines = int(self.json_text.index("end-1c").split('.')[0])
             # Clamp height
             new_height = max(3, min(30, lines))
             
-            if int(self.json_text.cget('height')) != new_height:
+            # Compare against the height we last set instead of asking Tk
+            if new_height != self._last_height:
                 self.json_text.configure(height=new_height)
+                self._last_height = new_height
         except Exception: 
             pass
 
     def save_changes(self):
-        import json
+        if not self._dirty: return  # Nothing edited since the body was built
+        raw = self.json_text.get("1.0", tk.END).strip()
+        # Parse on the worker so a large config doesn't freeze the UI, then
+        # hand the result back to the Tk thread
+        action_data = self.action_data
+        future = _json_pool.submit(json.loads, raw)
+        future.add_done_callback(
+            lambda f: self._after_safe(lambda: self._apply_parsed(f, action_data)))
+
+    def _after_safe(self, func):
+        try:
+            self.after(0, func)
+        except (RuntimeError, tk.TclError):
+            pass  # Card destroyed (list re-rendered) while parsing
+
+    def _apply_parsed(self, future, action_data):
         from tkinter import messagebox
+        if action_data is not self.action_data: return  # Card was reused meanwhile
         try:
-            raw = self.json_text.get("1.0", tk.END).strip()
-            new_config = json.loads(raw)
-            # Callback to parent to update logic
-            self.callbacks['update'](self.index, new_config)
-            # Flash success?
+            new_config = future.result()
         except json.JSONDecodeError as e:
             messagebox.showerror("Invalid JSON", f"Syntax Error: {e}")
+            return
+        self._dirty = False
+        self.action_data.pop('_cached_json', None)
+        # Callback to parent to update logic
+        self.callbacks['update'](self.index, new_config)
+        # Flash success?
 
     # --- Drag and Drop Logic ---
     def _start_drag(self, event):
@@ -233,17 +685,24 @@ class ActionCard(ttk.Frame):
         self._drag_data["x"] = event.x_root
         self._drag_data["y"] = event.y_root
         self._drag_data["start_index"] = self.index
-        # Visual feedback? Maybe change cursor or relief
-        self.configure(relief="raised", borderwidth=3)
-        self.lift()
+        # Visual feedback waits for real movement (_drag_motion): most presses
+        # are plain clicks and would only cost two redraws.
+        self._drag_active = False
 
     def _drag_motion(self, event):
         """Handle dragging."""
-        pass
+        if self._drag_active or self._drag_data["start_index"] is None: return
+        # Same threshold _end_drag uses to tell a click from a drag
+        if abs(event.x_root - self._drag_data["x"]) >= 5 or abs(event.y_root - self._drag_data["y"]) >= 5:
+            self._drag_active = True
+            self.configure(relief="raised", borderwidth=3)
+            self.lift()
 
     def _end_drag(self, event):
         """End drag and calculate drop position."""
-        self.configure(relief='solid', borderwidth=0)
+        if self._drag_active:
+            self._drag_active = False
+            self.configure(relief='solid', borderwidth=0)
         
         if self._drag_data["start_index"] is None: return
         
@@ -260,27 +719,9 @@ class ActionCard(ttk.Frame):
         # y_root of release
         y_root = event.y_root
         
-        # Iterate over all siblings (ActionCards) in the parent
-        parent = self.master
-        target_index = -1
-        
-        # Find which card we are over
-        for child in parent.winfo_children():
-            if isinstance(child, ActionCard):
-                cx, cy = child.winfo_rootx(), child.winfo_rooty()
-                ch, cw = child.winfo_height(), child.winfo_width()
-                
-                if cy <= y_root <= cy + ch:
-                    target_index = child.index
-                    break
-        
-        # If we dropped below the last one
-        if target_index == -1:
-            # Check if we are below the last one
-            if parent.winfo_children():
-                last_child = parent.winfo_children()[-1]
-                if y_root > last_child.winfo_rooty() + last_child.winfo_height():
-                    target_index = len(parent.winfo_children()) - 1 # Move to end
+        # Ask the list which row we are over (only rows in view have cards)
+        scroller = self._scroller()
+        target_index = scroller.index_at(y_root) if scroller else -1
         
         # Perform move if valid and different
         if target_index != -1 and target_index != self.index:
@@ -290,63 +731,82 @@ class ActionCard(ttk.Frame):
 
         self._drag_data["start_index"] = None
 
+    def _scroller(self):
+        """The ScrollableFrame whose virtual list this card belongs to."""
+        widget = self.master
+        while widget is not None and not isinstance(widget, ScrollableFrame):
+            widget = widget.master
+        return widget
+
     # --- Context Menu ---
+    # One menu is shared by every card. It is built on first use, its
+    # outside-click binding is installed once, and each right-click only
+    # retargets it at the clicked card (held weakly, so a re-render can
+    # free the card while the menu is open).
+    @classmethod
+    def _context_menu(cls, top):
+        menu = cls._menu
+        if menu is None or not menu.winfo_exists():
+            menu = cls._menu = tk.Menu(top, tearoff=0)
+            for label, key in _MENU_ITEMS:
+                if label is None:
+                    menu.add_separator()
+                else:
+                    menu.add_command(label=label, command=lambda k=key: cls._on_menu_item(k))
+            # Covers closing by any route (Escape, native dismissal, unpost)
+            menu.bind("<Unmap>", cls._on_menu_unmap)
+            # Every widget carries its toplevel in its bindtags, so this sees
+            # clicks anywhere in the window without bind_all
+            top.bind("<Button-1>", cls._on_outside_click, add="+")
+        return menu
+
     def show_context_menu(self, event):
         """Show right-click context menu."""
-        # 1. Close any existing menu
-        if ActionCard.current_menu:
-            try:
-                ActionCard.current_menu.unpost()
-            except: pass
-        
-        # 2. Clear any existing global bindings to prevent ghost clicks
-        try:
-             self.winfo_toplevel().unbind_all("<Button-1>")
-        except: pass
+        menu = ActionCard._context_menu(self.winfo_toplevel())
+        ActionCard._close_context_menu()  # Close it if open for another card
+        ActionCard._menu_target = weakref.ref(self)
+        # Auto-hide after 16 seconds (cancelled when the menu closes earlier)
+        ActionCard._menu_after_id = menu.after(16000, ActionCard._close_context_menu)
+        # Use post instead of tk_popup to avoid grabbing focus, allowing the click binding to work
+        menu.post(event.x_root, event.y_root)
 
-        menu = tk.Menu(self, tearoff=0)
-        ActionCard.current_menu = menu
-        
-        def close_menu(e=None):
-            if e:
-                # Check if click is inside the menu
-                try:
-                    mx = menu.winfo_rootx()
-                    my = menu.winfo_rooty()
-                    mw = menu.winfo_width()
-                    mh = menu.winfo_height()
-                    # Add a small buffer just in case
-                    if mx <= e.x_root <= mx + mw and my <= e.y_root <= my + mh:
-                        return # Click is inside menu, let it handle the command
-                except: pass
-
-            menu.unpost()
-            if ActionCard.current_menu == menu:
-                ActionCard.current_menu = None
-            try:
-                self.winfo_toplevel().unbind_all("<Button-1>")
+    @classmethod
+    def _close_context_menu(cls, event=None):
+        """Hide the shared menu and cancel its timer. Safe to call when closed."""
+        if cls._menu_after_id is not None:
+            try: cls._menu.after_cancel(cls._menu_after_id)
+            except: pass
+            cls._menu_after_id = None
+        if cls._menu_target is not None:
+            cls._menu_target = None
+            try: cls._menu.unpost()
             except: pass
 
-        # Helper to ensure menu closes when an item is clicked
-        def command_wrapper(func):
-            def wrapper():
-                func()
-                close_menu()
-            return wrapper
-
-        menu.add_command(label="Duplicate Action", command=command_wrapper(lambda: self.callbacks.get('duplicate', lambda i: None)(self.index)))
-        menu.add_separator()
-        menu.add_command(label="Play This Action", command=command_wrapper(lambda: self.callbacks['play'](self.index)))
-        menu.add_command(label="Play Sequence From Here", command=command_wrapper(lambda: self.callbacks.get('play_from', lambda i: None)(self.index)))
-        menu.add_separator()
-        menu.add_command(label="Delete Action", command=command_wrapper(lambda: self.callbacks['remove'](self.index)))
-        
-        # Auto-hide after 16 seconds
-        self.after(16000, close_menu)
-
-        # Bind global click to close method
-        # Using bind_all on the toplevel to catch clicks anywhere in the app
-        self.winfo_toplevel().bind_all("<Button-1>", close_menu, add="+")
-
-        # Use post instead of tk_popup to avoid grabbing focus, allowing the bind_all to work
-        menu.post(event.x_root, event.y_root)
+    @classmethod
+    def _on_menu_unmap(cls, event):
+        # Reposting for another card unposts then posts; the queued Unmap from
+        # the unpost must not close the menu that is showing again
+        if not cls._menu.winfo_ismapped():
+            cls._close_context_menu()
+
+    @classmethod
+    def _on_outside_click(cls, e):
+        if cls._menu_target is None: return
+        menu = cls._menu
+        # Check if click is inside the menu
+        try:
+            mx = menu.winfo_rootx()
+            my = menu.winfo_rooty()
+            if mx <= e.x_root <= mx + menu.winfo_width() and my <= e.y_root <= my + menu.winfo_height():
+                return # Click is inside menu, let it handle the command
+        except: pass
+        cls._close_context_menu()
+
+    @classmethod
+    def _on_menu_item(cls, key):
+        card = cls._menu_target() if cls._menu_target else None
+        cls._close_context_menu()
+        if card is None or not card.winfo_exists(): return
+        callback = card.callbacks.get(key)
+        if callback:
+            callback(card.index)
@@ -6,24 +6,253 @@ import sys
 import json
 import signal
 import subprocess
+import platform
+import webbrowser
+import shutil
+import functools
+import threading
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Internal Imports
+from core.config import get_config, get_app_data_dir, get_app_dirs
+from core.version import get_build_version, get_archive_name
 from core.factory import get_platform_managers
+from core.logging_utils import (setup_file_logging, remove_file_logging,
+                                get_log_file_path, is_file_logging_enabled)
+from logic.actions import execute_action, get_action_template
+from logic.media_utils import check_media_player_installed
+from logic.scheduler import AlarmScheduler
+from logic.sequence import AlarmSequence
+from . import theme
+from .theme import apply_theme, THEMES
+from .components import ScrollableFrame, ActionCard
 from .overlay import OverlayController
+try:
+    from logic.actions import ACTION_TYPES as _ACTION_TYPES
+except ImportError:
+    _ACTION_TYPES = ("play_video", "open_url")
 # Placeholder imports for logic we still need to port/connect
 # from logic.media import MediaQueue 
 
+@functools.lru_cache(maxsize=4)
+def _load_icon_photo(path, use_pil=False):
+    """Decode an icon image once per process and share the PhotoImage between windows."""
+    if use_pil:
+        from PIL import Image, ImageTk
+        return ImageTk.PhotoImage(Image.open(path))
+    return tk.PhotoImage(file=path)
+
+
+@functools.cache
+def _icon_path():
+    """Return (path, exists) for the window icon PNG; fixed for the life of the process."""
+    if getattr(sys, 'frozen', False):
+        # PyInstaller: bundled data is in sys._MEIPASS
+        png_path = os.path.join(sys._MEIPASS, "alarm_icon7.png")
+    else:
+        base_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+        png_path = os.path.join(base_dir, "icons", "alarm_icon7.png")
+    return png_path, os.path.exists(png_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info():
+    """Platform/build details for the Help tab; none of these change during a session."""
+    try:
+        app_version = get_build_version()
+    except Exception:
+        app_version = "Unknown"
+    try:
+        archive = get_archive_name()
+    except Exception:
+        archive = None
+    return {
+        "app_version": app_version,
+        "archive": archive,
+        "platform": platform.platform(),
+        "release": platform.release(),
+        "python": sys.version.split()[0],
+        "processor": platform.processor(),  # Shells out on some Linux builds
+        "machine": platform.machine(),
+        "cwd": os.getcwd(),
+    }
+
+
+class _ActionRunner:
+    """Reusable daemon worker threads for action playback.
+
+    An action can block for as long as a video plays, so a submit goes to an
+    idle worker when there is one and starts a new thread otherwise. Workers
+    are daemons so closing the window never waits on playback.
+    """
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+
+    def submit(self, fn, *args):
+        with self._lock:
+            if self._idle:
+                self._idle -= 1
+            else:
+                threading.Thread(target=self._work, name="action", daemon=True).start()
+        self._queue.put((fn, args))
+
+    def _work(self):
+        while True:
+            fn, args = self._queue.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                logging.error(f"Action worker failed: {e}")
+            with self._lock:
+                self._idle += 1
+
+
+def _init_alarm_io_thread():
+    """The Windows scheduler talks COM, which must be initialized per thread."""
+    try:
+        import pythoncom
+    except ImportError:
+        return
+    pythoncom.CoInitialize()
+
+
+# All AlarmScheduler work runs here: off the Tk thread, and always on the
+# same thread, so the backend's COM connection / crontab copy is never shared
+_alarm_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alarm-io",
+                               initializer=_init_alarm_io_thread)
+
+
+@functools.cache
+def _read_license() -> str:
+    """Read LICENSE from bundle or project root (once per process)."""
+    candidates = []
+    if getattr(sys, 'frozen', False):
+        candidates.append(os.path.join(os.path.dirname(sys.executable), "LICENSE"))
+        if hasattr(sys, '_MEIPASS'):
+            candidates.append(os.path.join(sys._MEIPASS, "LICENSE"))
+    candidates.append(os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "LICENSE")
+    ))
+    for path in candidates:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+    return "LICENSE file not found."
+
+
+def _is_time_fragment(text):
+    """validatecommand for the time entries: empty, or up to two digits."""
+    return text == "" or (len(text) <= 2 and text.isdigit())
+
+
+def _clone_config(value):
+    """Deep copy of a JSON-shaped action config (dicts/lists of primitives).
+
+    Cheaper than copy.deepcopy: no memo dict, and immutable leaves are shared.
+    """
+    if isinstance(value, dict):
+        return {k: _clone_config(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone_config(v) for v in value]
+    return value
+
+
+# Sleep cycle buttons: (cycles, hours). Cycle hours are exactly 1.5, 3.0, ... 10.5;
+# the fall-asleep offset is added on top of that
+_BASE_CYCLES = ((1, 1.5), (2, 3.0), (3, 4.5), (4, 6.0), (5, 7.5), (6, 9.0), (7, 10.5))
+_DAYS_LIST = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+# Launches a sequence test run: the bundled binary, or main.py from source
+_TEST_CMD_PREFIX = ((sys.executable,) if getattr(sys, 'frozen', False)
+                    else (sys.executable, "src/main.py"))
+
+# Alarm list "Status" column, indexed by the enabled flag
+_STATUS_TEXT = ("Disabled", "Enabled")
+# Party Mode: random video from ./video (relative to the working directory main.py sets)
+_PARTY_CONFIG = {"directory": "video", "file_types": ("mp4", "mkv", "webm", "avi")}
+
+# Help > Overview text
+_OVERVIEW_INSTRUCTIONS = """
+Quickstart Guide
+
+1. Create a Sequence  (SEQUENCES tab)
+   - Click 'New' to start a fresh sequence.
+   - Select an action from the dropdown (e.g. 'play_video') and click '+ Add to End'.
+   - Configure the action — choose a video file, URL, etc.
+   - Click 'Save', then '▶ Test' to verify it works.
+
+2. Set Your Alarm  (ALARMS tab)
+   - Select your saved sequence from the dropdown.
+   - Enter your wake-up time (12h or 24h — set your preference in Settings).
+   - Choose recurring days, or leave blank for a one-time alarm.
+   - Click 'SET ALARM'. The alarm is now registered with your OS scheduler.
+
+3. Important: Power & Session
+   - Your computer must be ON and logged in for alarms to fire.
+   - Linux: keep the app open to prevent the computer from sleeping (Sleep Mode).
+   - Windows: may run a missed alarm at next boot if the PC was off at alarm time.
+
+4. First Time Setup
+   - MPV (Linux) or VLC (Windows) will automatically prompt for installation if not found.
+   - Go to Settings → Install → 'Add to Applications' (Linux) or 'Add to Start Menu' (Windows)
+     to register the app with your launcher and give it the correct icon.
+   - Your build version is shown at the top of the Settings tab.
+""".strip()
+
+
+# Non-ttk widget class -> (option, COLORS key) pairs for theme refreshes.
+# apply_theme sets the same colors as option-database defaults, so widgets
+# created after a theme change need no per-instance configure; the root window
+# is configured by apply_theme itself and is left out here.
+_TEXT_THEME_OPTIONS = (("bg", "bg_light"), ("fg", "text_main"), ("insertbackground", "text_main"))
+_NON_TTK_THEME_OPTIONS = {
+    "Text": _TEXT_THEME_OPTIONS,
+    "Entry": _TEXT_THEME_OPTIONS,
+    "Listbox": (("bg", "bg_light"), ("fg", "text_main"),
+                ("selectbackground", "primary_var"), ("selectforeground", "text_main")),
+    "Canvas": (("bg", "bg_dark"),),
+    "Frame": (("bg", "bg_dark"),),
+    "Toplevel": (("bg", "bg_dark"),),
+}
+
+# Package manager probe order -> mpv install command
+_MPV_INSTALL_CMDS = (
+    ("apt", "sudo apt update && sudo apt install -y mpv"),
+    ("apt-get", "sudo apt-get update && sudo apt-get install -y mpv"),  # Fallback for older Debian/Ubuntu
+    ("dnf", "sudo dnf install -y mpv"),
+    ("pacman", "sudo pacman -S --noconfirm mpv"),
+    ("zypper", "sudo zypper install -y mpv"),
+)
+_TERMINALS = ("x-terminal-emulator", "gnome-terminal", "konsole", "xfce4-terminal", "xterm", "lxterminal")
+
+
+@functools.cache
+def _detect_pkg_manager():
+    """mpv install command for the first package manager on PATH, or None."""
+    return next((cmd for exe, cmd in _MPV_INSTALL_CMDS if shutil.which(exe)), None)
+
+
+@functools.cache
+def _detect_terminal():
+    """First terminal emulator found on PATH, or None."""
+    return next((t for t in _TERMINALS if shutil.which(t)), None)
+
+
 class VideoAlarmMainWindow(tk.Tk):
     def __init__(self):
         super().__init__()
         
         # Apply Modern Theme
-        from core.config import get_config
-        from .theme import apply_theme
-        config = get_config()
-        self.current_theme = config.get("ui", "theme") or "Twilight"
+        self._config = get_config()
+        self.current_theme = self._config.get("ui", "theme") or "Twilight"
         self.style = apply_theme(self, self.current_theme)
+        self._configure_styles()
         
         # State for editing alarms
         self.editing_alarm = None # Stores {"sequence": str, "time": str} when editing
@@ -38,7 +267,16 @@ class VideoAlarmMainWindow(tk.Tk):
             # Don't show messagebox here - window isn't ready yet
             # Error will be shown when user tries to use the feature
         
-        self.overlay_controller = OverlayController(self, on_close=self.on_overlay_closed)
+        self._overlay = None  # OverlayController, created on first use
+        self._scheduler = None  # AlarmScheduler, created on first use
+        self._player_dialog = None  # Missing media player dialog, kept for reuse
+        self._action_runner = _ActionRunner()  # Runs Play/Play-from/Party Mode actions
+        self._seq_dir = get_app_dirs()["sequences"]
+        os.makedirs(self._seq_dir, exist_ok=True)
+        self._temp_seq_dir = os.path.join(self._seq_dir, "temp")  # Test-run copies
+        self._seq_list_cache = None  # (dir mtime, names) from refresh_sequence_list
+        self._valid_sequences = frozenset()  # Same names, for membership tests
+        self._alarm_rows = {}  # Treeview iid -> row values, in display order
         self.keep_awake_enabled = False
         
         self.title("PyCron Video Alarm")
@@ -47,18 +285,13 @@ class VideoAlarmMainWindow(tk.Tk):
         # Set window icon — works with .png, .ico, or both present
         # Supports both development (relative to source) and PyInstaller (sys._MEIPASS)
         try:
-            if getattr(sys, 'frozen', False):
-                # PyInstaller: bundled data is in sys._MEIPASS
-                base_dir = sys._MEIPASS
-                png_path = os.path.join(base_dir, "alarm_icon7.png")
-            else:
-                base_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
-                png_path = os.path.join(base_dir, "icons", "alarm_icon7.png")
-            
-            if os.path.exists(png_path):
-                from PIL import Image, ImageTk
-                img = Image.open(png_path)
-                photo = ImageTk.PhotoImage(img)
+            png_path, png_exists = _icon_path()
+            if png_exists:
+                try:
+                    # Tk 8.6 reads PNG natively — only pull in PIL if it can't
+                    photo = _load_icon_photo(png_path, False)
+                except tk.TclError:
+                    photo = _load_icon_photo(png_path, True)
                 # True flag applies icon to all future dialogs and taskbar
                 self.iconphoto(True, photo)
                 self._icon_ref = photo
@@ -93,34 +326,104 @@ class VideoAlarmMainWindow(tk.Tk):
         self.settings_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.settings_frame, text="SETTINGS")
 
-        # Init Tab Content
+        # Init Tab Content — Alarms and Sequences are built up front (the
+        # Sequences tab holds current_sequence, which --test-alarm needs right
+        # away); Help and Settings are built on first selection (see on_tab_changed)
+        self.current_sequence = None
+        self._render_after_id = None  # Action list re-render queued (_schedule_render)
+        self._cycle_labels_pending = False  # Sleep cycle relabel queued (update_sleep_cycle_buttons)
+        self._time_sync_pending = False  # Time entry sync queued (_on_time_entry_commit)
+        self._time_vcmd = None  # Shared validatecommand of the time entries
+        self._alarm_refresh_pending = False  # Alarm list reload queued (schedule_alarm_refresh)
+        self._tab_initialized = {"help": False, "settings": False}
+        self._settings_wheel_bound = False
+        self._tab_builders = {
+            str(self.help_frame): ("help", self.init_help_tab),
+            str(self.settings_frame): ("settings", self._build_settings_tab),
+        }
         self.init_alarms_tab()
         self.init_main_tab()
-        self.init_help_tab()
-        self.init_settings_tab()
 
-        # Initialize empty sequence
+        # The media player probe touches PATH/subprocesses, so run it off the
+        # Tk thread once the event loop is going
+        self.after(0, self._start_post_init_checks)
+
+        self.protocol("WM_DELETE_WINDOW", self._on_app_close)
+
+    def _on_app_close(self):
+        """Main window closed: tear down the (reused) overlay, then the app."""
+        if self._overlay is not None:
+            try:
+                self._overlay.shutdown()
+            except Exception as e:
+                logging.error(f"Failed to shut down overlay: {e}")
+        self.destroy()
+
+    def _configure_styles(self):
+        """App-specific ttk styles, set once (apply_theme always stays on clam)."""
+        # Larger checkboxes for the alarm days
+        self.style.configure("Big.TCheckbutton", font=("Segoe UI", 11, "bold"))
+
+    def _start_post_init_checks(self):
+        threading.Thread(target=self._post_init_checks, daemon=True).start()
+
+    def _post_init_checks(self):
+        """Worker thread: check for the media player."""
         try:
-            from logic.sequence import AlarmSequence
-            self.current_sequence = AlarmSequence("New Sequence")
-            self.new_sequence() 
+            player_ok = check_media_player_installed()
         except Exception as e:
-            logging.error(f"Failed to init sequence: {e}")
+            logging.error(f"Media player check failed: {e}")
+            player_ok = True
+        
+        try:
+            self.after(0, self._apply_post_init, player_ok)
+        except RuntimeError:
+            pass  # Window closed before the checks finished
 
-        # Ensure Media Player is installed
-        from logic.media_utils import check_media_player_installed
-        if not check_media_player_installed():
+    def _apply_post_init(self, player_ok):
+        """Back on the Tk thread: report a missing player."""
+        if not player_ok:
             self.after(1000, self.show_missing_player_error)
 
+    @property
+    def overlay_controller(self):
+        """Black box overlay controller, built the first time an overlay is needed."""
+        if self._overlay is None:
+            self._overlay = OverlayController(self, on_close=self.on_overlay_closed)
+        return self._overlay
+
+    @property
+    def scheduler(self):
+        """Shared AlarmScheduler, connected to the platform backend on first use.
+
+        Only touch it from the alarm-io worker (see _run_scheduler).
+        """
+        if self._scheduler is None:
+            self._scheduler = AlarmScheduler()
+        return self._scheduler
+
+    def _run_scheduler(self, fn, on_done):
+        """Run fn(scheduler) on the alarm-io worker, then on_done(future) on the Tk thread."""
+        def deliver(future):
+            try:
+                self.after(0, on_done, future)
+            except (RuntimeError, tk.TclError):
+                pass  # Window closed while the worker ran
+        _alarm_io.submit(lambda: fn(self.scheduler)).add_done_callback(deliver)
+
     def show_missing_player_error(self):
-        import platform
-        import shutil
-        import subprocess
-        import webbrowser
+        # Reuse the dialog if it was built before and only hidden
+        dialog = self._player_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            return
         
-        system = platform.system()
+        is_windows = sys.platform == "win32"
         
         dialog = tk.Toplevel(self)
+        self._player_dialog = dialog
         dialog.title("Media Player Required")
         dialog.geometry("600x320")
         dialog.resizable(False, False)
@@ -134,13 +437,13 @@ class VideoAlarmMainWindow(tk.Tk):
         dialog.geometry(f"+{x}+{y}")
         
         # Apply theme colors
-        from .theme import COLORS
+        COLORS = theme.COLORS
         dialog.configure(bg=COLORS.get('bg_dark', '#1e1e2e'))
         
         content_frame = ttk.Frame(dialog, padding="20 20 20 20")
         content_frame.pack(fill=tk.BOTH, expand=True)
 
-        player_name = "VLC Media Player" if system == "Windows" else "MPV Media Player"
+        player_name = "VLC Media Player" if is_windows else "MPV Media Player"
 
         warn_label = ttk.Label(
             content_frame, 
@@ -163,25 +466,13 @@ class VideoAlarmMainWindow(tk.Tk):
         btn_frame = ttk.Frame(content_frame)
         btn_frame.pack(fill=tk.X, expand=True, side=tk.BOTTOM)
 
-        system = platform.system()
-
         def auto_install_linux():
-            if shutil.which("apt"):
-                cmd = "sudo apt update && sudo apt install -y mpv"
-            elif shutil.which("apt-get"):  # Fallback for older Debian/Ubuntu
-                cmd = "sudo apt-get update && sudo apt-get install -y mpv"
-            elif shutil.which("dnf"):
-                cmd = "sudo dnf install -y mpv"
-            elif shutil.which("pacman"):
-                cmd = "sudo pacman -S --noconfirm mpv"
-            elif shutil.which("zypper"):
-                cmd = "sudo zypper install -y mpv"
-            else:
+            cmd = _detect_pkg_manager()
+            if cmd is None:
                 messagebox.showerror("Error", "Could not detect a supported package manager. Please install mpv manually.", parent=dialog)
                 return
 
-            terminals = ["x-terminal-emulator", "gnome-terminal", "konsole", "xfce4-terminal", "xterm", "lxterminal"]
-            term_exe = next((t for t in terminals if shutil.which(t)), None)
+            term_exe = _detect_terminal()
             
             if term_exe:
                 try:
@@ -208,17 +499,22 @@ class VideoAlarmMainWindow(tk.Tk):
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to run winget install: {e}\n\nPlease install manually.", parent=dialog)
 
-        if system == "Linux":
+        if sys.platform.startswith("linux"):
             ttk.Button(btn_frame, text="Auto Install MPV (Terminal)", command=auto_install_linux).pack(side=tk.LEFT, padx=5)
             ttk.Button(btn_frame, text="Download from mpv.io", command=lambda: webbrowser.open("https://mpv.io/installation/")).pack(side=tk.LEFT, padx=5)
-        elif system == "Windows":
+        elif is_windows:
             ttk.Button(btn_frame, text="Install VLC via Winget", command=auto_install_windows).pack(side=tk.LEFT, padx=5)
             ttk.Button(btn_frame, text="Download from videolan.org", command=lambda: webbrowser.open("https://www.videolan.org/vlc/")).pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        def close():
+            dialog.grab_release()
+            dialog.withdraw()
 
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        ttk.Button(btn_frame, text="Close", command=close).pack(side=tk.RIGHT, padx=5)
 
-    def init_settings_tab(self):
+
+    def _build_settings_tab(self):
         """Initialize the Settings tab."""
         # Create a canvas and scrollbar for the settings tab
         self.settings_canvas = tk.Canvas(self.settings_frame, borderwidth=0, highlightthickness=0)
@@ -226,43 +522,24 @@ class VideoAlarmMainWindow(tk.Tk):
         
         settings_container = ttk.Frame(self.settings_canvas, padding=20)
         
-        # Configure the canvas
-        settings_container.bind(
-            "<Configure>",
-            lambda e: self.settings_canvas.configure(
-                scrollregion=self.settings_canvas.bbox("all")
-            )
-        )
+        # Configure the canvas — resizes are coalesced into one layout pass
+        self._settings_layout_after = None
+        self._settings_width = None
+        settings_container.bind("<Configure>", self._schedule_settings_layout)
         
-        self.settings_canvas.create_window((0, 0), window=settings_container, anchor="nw", width=self.settings_frame.winfo_width())
+        self._settings_window = self.settings_canvas.create_window((0, 0), window=settings_container, anchor="nw", width=self.settings_frame.winfo_width())
         self.settings_canvas.configure(yscrollcommand=self.settings_scrollbar.set)
         
         # Update canvas window width on resize
-        self.settings_canvas.bind(
-            "<Configure>",
-            lambda e: self.settings_canvas.itemconfig(
-                "all", width=e.width
-            )
-        )
+        self.settings_canvas.bind("<Configure>", self._on_settings_canvas_configure)
         
         self.settings_canvas.pack(side="left", fill="both", expand=True)
         self.settings_scrollbar.pack(side="right", fill="y")
         
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            # For Windows/Linux
-            if event.num == 4 or event.delta > 0:
-                self.settings_canvas.yview_scroll(-1, "units")
-            elif event.num == 5 or event.delta < 0:
-                self.settings_canvas.yview_scroll(1, "units")
-                
-        self.settings_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        self.settings_canvas.bind_all("<Button-4>", _on_mousewheel)
-        self.settings_canvas.bind_all("<Button-5>", _on_mousewheel)
+        # Mouse wheel scrolling is bound by on_tab_changed while this tab is showing
 
         # Version display
         try:
-            from core.version import get_build_version
             ver = get_build_version()
         except Exception:
             ver = "Unknown"
@@ -275,12 +552,10 @@ class VideoAlarmMainWindow(tk.Tk):
         
         ttk.Label(theme_frame, text="Theme:").pack(side=tk.LEFT, padx=5)
         
-        from .theme import THEMES
         theme_names = list(THEMES.keys())
         
         # Get current theme from config
-        from core.config import get_config
-        config = get_config()
+        config = self._config
         current_theme = config.get("ui", "theme") or "Twilight"
         
         self.theme_var = tk.StringVar(value=current_theme)
@@ -311,8 +586,6 @@ class VideoAlarmMainWindow(tk.Tk):
         toggle_row.pack(fill=tk.X, pady=5)
         
         self.file_logging_var = tk.BooleanVar()
-        from core.config import get_config
-        config = get_config()
         self.file_logging_var.set(config.get("logging", "file_logging_enabled") or False)
         
         ttk.Button(toggle_row, text="Open Logs Folder", command=self.open_logs_folder).pack(side=tk.LEFT, padx=(0, 10))
@@ -355,26 +628,12 @@ class VideoAlarmMainWindow(tk.Tk):
         offset_spin.pack(side=tk.LEFT, padx=10)
         ttk.Label(sleep_offset_row, text="minutes  (time added before each sleep cycle button)", font=("Segoe UI", 10)).pack(side=tk.LEFT, padx=5)
 
-        def save_sleep_offset():
-            try:
-                val = int(self.sleep_offset_var.get())
-                val = max(-120, min(120, val))
-                self.sleep_offset_var.set(val)
-                config.set("alarms", "sleep_offset_minutes", val)
-                config.save()
-                # Refresh the info label on the Alarms tab if it exists
-                if hasattr(self, 'sleep_cycle_info_label'):
-                    self.sleep_cycle_info_label.config(
-                        text=self._sleep_cycle_info_text()
-                    )
-                # Refresh the buttons as well
-                if hasattr(self, 'update_sleep_cycle_buttons'):
-                    self.update_sleep_cycle_buttons()
-                logging.info(f"Sleep cycle offset saved: {val} min")
-            except (ValueError, TypeError):
-                pass
+        # Edits save themselves after a short pause; Save flushes immediately
+        self._offset_save_after = None
+        self._offset_refresh_pending = False
+        self.sleep_offset_var.trace_add("write", self._on_offset_changed)
 
-        ttk.Button(sleep_offset_row, text="Save", command=save_sleep_offset).pack(side=tk.LEFT, padx=10)
+        ttk.Button(sleep_offset_row, text="Save", command=self._save_sleep_offset).pack(side=tk.LEFT, padx=10)
 
         # System Test Controls
 
@@ -424,115 +683,136 @@ class VideoAlarmMainWindow(tk.Tk):
         ttk.Label(support_frame, text="If this app helped you wake up on time, consider supporting the project:").pack(anchor=tk.W, pady=(0, 5))
         ttk.Button(support_frame, text="🍕 Support on Ko-fi", command=self.open_kofi).pack(anchor=tk.W)
 
+    def _on_offset_changed(self, *args):
+        """Debounce sleep-offset edits so holding a spinbox arrow writes settings once."""
+        if self._offset_save_after is not None:
+            self.after_cancel(self._offset_save_after)
+        self._offset_save_after = self.after(500, self._save_sleep_offset)
+
+    def _save_sleep_offset(self):
+        if self._offset_save_after is not None:
+            self.after_cancel(self._offset_save_after)
+            self._offset_save_after = None
+        try:
+            val = int(self.sleep_offset_var.get())
+        except (ValueError, TypeError, tk.TclError):
+            return  # Partial/invalid text in the spinbox — wait for the next edit
+        
+        clamped = max(-120, min(120, val))
+        if clamped != val:
+            self.sleep_offset_var.set(clamped)
+        if clamped == self._config.get("alarms", "sleep_offset_minutes"):
+            return
+        self._config.set("alarms", "sleep_offset_minutes", clamped)
+        self._config.save()
+        logging.info(f"Sleep cycle offset saved: {clamped} min")
+        
+        # Refresh the Alarms tab once, however many saves land before idle
+        if not self._offset_refresh_pending:
+            self._offset_refresh_pending = True
+            self.after_idle(self._refresh_sleep_cycle_info)
+
+    def _refresh_sleep_cycle_info(self):
+        self._offset_refresh_pending = False
+        # Refresh the info label on the Alarms tab if it exists
+        if hasattr(self, 'sleep_cycle_info_label'):
+            self.sleep_cycle_info_label.config(text=self._sleep_cycle_info_text())
+        # Refresh the buttons as well
+        self.update_sleep_cycle_buttons()
+
+    def _on_settings_canvas_configure(self, event):
+        self._settings_width = event.width
+        self._schedule_settings_layout()
+
+    def _schedule_settings_layout(self, event=None):
+        """Throttle Settings resize work to one pass per 50ms of Configure events."""
+        if self._settings_layout_after is not None:
+            self.after_cancel(self._settings_layout_after)
+        self._settings_layout_after = self.after(50, self._apply_settings_layout)
+
+    def _apply_settings_layout(self):
+        self._settings_layout_after = None
+        canvas = self.settings_canvas
+        if self._settings_width is not None:
+            canvas.itemconfigure(self._settings_window, width=self._settings_width)
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+    def _on_settings_mousewheel(self, event):
+        # For Windows/Linux
+        if event.num == 4 or event.delta > 0:
+            self.settings_canvas.yview_scroll(-1, "units")
+        elif event.num == 5 or event.delta < 0:
+            self.settings_canvas.yview_scroll(1, "units")
+
+    def _set_settings_wheel(self, active):
+        """Route the mouse wheel to the Settings canvas only while that tab is selected."""
+        if active == self._settings_wheel_bound:
+            return
+        self._settings_wheel_bound = active
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            if active:
+                self.bind_all(sequence, self._on_settings_mousewheel)
+            else:
+                self.unbind_all(sequence)
+
     def open_kofi(self):
         """Open the Ko-fi support page in the default web browser."""
-        import webbrowser
         webbrowser.open("https://ko-fi.com/juke32")
 
-    def _read_license(self) -> str:
-        """Read LICENSE from bundle or project root."""
-        candidates = []
-        if getattr(sys, 'frozen', False):
-            candidates.append(os.path.join(os.path.dirname(sys.executable), "LICENSE"))
-            if hasattr(sys, '_MEIPASS'):
-                candidates.append(os.path.join(sys._MEIPASS, "LICENSE"))
-        candidates.append(os.path.normpath(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "LICENSE")
-        ))
-        for path in candidates:
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    return f.read()
-            except FileNotFoundError:
-                continue
-        return "LICENSE file not found."
-
     def change_theme(self, event=None):
         """Apply selected theme."""
         selected_theme = self.theme_var.get()
-        from .theme import apply_theme, COLORS
         apply_theme(self, selected_theme)
         
         # Force refresh of non-ttk widgets (Text, Listbox, etc.)
         self.refresh_non_ttk_widgets(self)
         
         # Save to config
-        from core.config import get_config
-        config = get_config()
+        config = self._config
         config.set("ui", "theme", selected_theme)
         config.save()
         
     def refresh_non_ttk_widgets(self, widget):
-        """Recursively refresh non-ttk widgets that don't auto-update with style."""
-        from .theme import COLORS
+        """Refresh non-ttk widgets under `widget` that don't auto-update with style."""
+        COLORS = theme.COLORS
         
-        try:
-            # Handle ScrolledText (which contains a Text widget)
-            if isinstance(widget, scrolledtext.ScrolledText):
-                widget.configure(bg=COLORS['bg_light'], fg=COLORS['text_main'], insertbackground=COLORS['text_main'])
-                
-            # Handle standard Tk widgets
-            elif isinstance(widget, tk.Text):
-                widget.configure(bg=COLORS['bg_light'], fg=COLORS['text_main'], insertbackground=COLORS['text_main'])
-            elif isinstance(widget, tk.Listbox):
-                widget.configure(bg=COLORS['bg_light'], fg=COLORS['text_main'], selectbackground=COLORS['primary_var'], selectforeground=COLORS['text_main'])
-            elif isinstance(widget, tk.Entry) and not isinstance(widget, ttk.Entry):
-                widget.configure(bg=COLORS['bg_light'], fg=COLORS['text_main'], insertbackground=COLORS['text_main'])
-            elif isinstance(widget, tk.Canvas):
-                widget.configure(bg=COLORS['bg_dark'])
-            elif isinstance(widget, tk.Frame):
-                widget.configure(bg=COLORS['bg_dark'])
-            elif isinstance(widget, (tk.Tk, tk.Toplevel)):
-                widget.configure(bg=COLORS['bg_dark'])
-                
-            # Recursively update children
-            for child in widget.winfo_children():
-                self.refresh_non_ttk_widgets(child)
-        except Exception as e:
-            # Ignore errors for widgets that might depend on system theme or are destroyed
-            pass
+        # Resolve the colors once per refresh: winfo_class() -> configure kwargs
+        options = {cls: {opt: COLORS[key] for opt, key in opts}
+                   for cls, opts in _NON_TTK_THEME_OPTIONS.items()}
+        
+        # Iterative walk — ScrolledText is a Text inside a Frame, so both are covered
+        pending = deque((widget,))
+        while pending:
+            w = pending.popleft()
+            try:
+                kw = options.get(w.winfo_class())
+                if kw:
+                    w.configure(**kw)
+                pending.extend(w.winfo_children())
+            except Exception:
+                # Ignore errors for widgets that might depend on system theme or are destroyed
+                pass
 
     def change_time_format(self):
         """Handle 12h/24h/Both format change."""
         new_format = self.time_format_var.get()
-        from core.config import get_config
-        config = get_config()
+        config = self._config
         config.set("ui", "time_format", new_format)
         config.save()
         
-        # Refresh Alarms UI components if they exist
-        if hasattr(self, 'ampm_container') and hasattr(self, 'mil_container'):
-            # Clear separators or other ephemeral widgets in container
-            for child in self.time_input_container.winfo_children():
-                child.pack_forget()
-
-            if new_format == "12h":
-                self.ampm_container.pack(side=tk.LEFT, padx=10)
-                # Ensure 24h is hidden
-                self.mil_container.pack_forget()
-            elif new_format == "24h":
-                self.mil_label.config(text="Hour:", font=('Arial', 12))
-                self.mil_container.pack(side=tk.LEFT, padx=10)
-                # Ensure 12h is hidden
-                self.ampm_container.pack_forget()
-                for widget in (self.military_hour, self.military_minute):
-                    widget.configure(font=('Arial', 48))
-            else: # "Both"
-                self.ampm_container.pack(side=tk.LEFT, padx=10)
-                # Add separator label
-                sep = ttk.Label(self.time_input_container, text="=", font=('Arial', 48))
-                sep.pack(side=tk.LEFT, padx=10)
-                self.mil_label.config(text="", font=('Arial', 1)) # Hide label effectively
-                self.mil_container.pack(side=tk.LEFT, padx=10)
-                for widget in (self.military_hour, self.military_minute):
-                    widget.configure(font=('Arial', 48))
-
-        messagebox.showinfo("Info", f"Time format changed to {new_format}. Some changes may require tab refresh.")
+        # The Alarms tab is always built, so the change is visible immediately
+        self._apply_time_layout(new_format)
+
+    def _apply_time_layout(self, fmt):
+        """Show the 12h/24h time inputs for `fmt` from the _time_layouts manifest."""
+        layout = self._time_layouts.get(fmt, self._time_layouts["12h"])
+        # One Tcl call unmaps every piece; then pack only what this format shows
+        self.tk.call("pack", "forget", *self._time_layout_widgets)
+        for widget, padx in layout:
+            widget.pack(side=tk.LEFT, padx=padx)
 
     def open_settings_file(self):
         """Open settings.json in default editor."""
-        import webbrowser
-        from core.config import get_app_data_dir
         settings_path = os.path.join(get_app_data_dir(), "settings.json")
         if os.path.exists(settings_path):
             webbrowser.open(settings_path)
@@ -542,10 +822,8 @@ class VideoAlarmMainWindow(tk.Tk):
     def toggle_file_logging(self):
         """Toggle file logging on/off."""
         try:
-            from core.config import get_config
-            from core.logging_utils import setup_file_logging, remove_file_logging
             
-            config = get_config()
+            config = self._config
             enabled = self.file_logging_var.get()
             
             # Update config
@@ -578,7 +856,6 @@ class VideoAlarmMainWindow(tk.Tk):
     def update_log_path_display(self):
         """Update the log file path label."""
         try:
-            from core.logging_utils import get_log_file_path, is_file_logging_enabled
             
             if is_file_logging_enabled():
                 log_path = get_log_file_path()
@@ -592,10 +869,8 @@ class VideoAlarmMainWindow(tk.Tk):
     def open_logs_folder(self):
         """Open the logs folder in file explorer."""
         try:
-            from core.config import get_config
-            import platform
             
-            config = get_config()
+            config = self._config
             log_dir = config.get("logging", "log_directory") or "logs"
             
             # Ensure directory exists
@@ -678,73 +953,8 @@ class VideoAlarmMainWindow(tk.Tk):
                 "You can manually pin the executable to your Start Menu by right-clicking it."
             )
 
-    def init_help_tab(self):
-        """Initialize the Help tab with usage instructions and debug info."""
-        from .components import ScrollableFrame
-        
-        # Main Container
-        self.help_scroll = ScrollableFrame(self.help_frame)
-        self.help_scroll.pack(fill=tk.BOTH, expand=True)
-        
-        main_layout = self.help_scroll.scrollable_frame
-
-        # Help Text Container
-        help_container = ttk.Frame(main_layout)
-        help_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        instructions = """
-Juke32 - PyCron Video Alarm Manager
-Info: juke32/PyCronVideoAlarm
-
-1. Setting Alarms
-   - Go to the 'Alarms' tab.
-   - Enter time in 12-hour or 24-hour format.
-   - Use 'Sleep Cycles' to calculate optimal wake times.
-   - Click 'SET ALARM' to schedule.
-
-2. Creating Sequences
-   - Go to the 'Sequences' tab.
-   - Click 'New' to start fresh.
-   - Add actions like 'play_video', 'open_url', etc.
-   - Click 'Save' to store your sequence.
-   - Click 'Test' to try it immediately.
-
-3. Features
-   - Keep Awake: Prevent computer from sleeping.
-   - Black Screen / Dim Display: Manage screen during sleep.
-   - Party Mode: Instant random video playback!
-
-Support the project: https://ko-fi.com/juke32
-
-Enjoy your wake-up experience!
-        """
-        num_lines = len(instructions.strip().split('\n'))
-        help_text = tk.Text(help_container, wrap=tk.WORD, font=('Arial', 11), height=num_lines, relief="flat", borderwidth=0)
-        help_text.pack(fill=tk.BOTH, expand=True)
-        
-        help_text.insert(tk.END, instructions.strip())
-        help_text.configure(state='disabled') # Read-only
-        
-        # Debug Footer
-        debug_frame = ttk.LabelFrame(main_layout, text="Debug Information", padding=10)
-        debug_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        import platform
-        debug_info = [
-            f"OS: {platform.system()} {platform.release()}",
-            f"Python: {sys.version.split()[0]}",
-            f"Directory: {os.getcwd()}",
-            f"User: {os.getlogin()}"
-        ]
-        
-        for info in debug_info:
-            ttk.Label(debug_frame, text=info, font=("Consolas", 8)).pack(anchor=tk.W)
-            
-        ttk.Button(debug_frame, text="Show Scheduler Debug Info", command=self._show_scheduler_debug).pack(anchor=tk.W, pady=5)
-
     def init_main_tab(self):
         """Initialize the main tab with modern accordion layout."""
-        from .components import ScrollableFrame, ActionCard
         
         # Top Control Bar (Name, Save, Load)
         control_bar = ttk.Frame(self.main_frame, style='Card.TFrame', padding=10)
@@ -772,12 +982,8 @@ Enjoy your wake-up experience!
         ttk.Label(add_frame, text="Add Action:", style='Card.TLabel').pack(side=tk.LEFT)
         
         self.action_type = ttk.Combobox(add_frame, state="readonly", width=20)
-        try:
-            from logic.actions import ACTION_TYPES
-            self.action_type['values'] = ACTION_TYPES
-            self.action_type.set(ACTION_TYPES[0] if ACTION_TYPES else "")
-        except ImportError:
-            self.action_type['values'] = ["play_video", "open_url"]
+        self.action_type['values'] = _ACTION_TYPES
+        self.action_type.set(_ACTION_TYPES[0] if _ACTION_TYPES else "")
             
         self.action_type.pack(side=tk.LEFT, padx=5)
         ttk.Button(add_frame, text="+ Add to End", command=self.add_action).pack(side=tk.LEFT)
@@ -793,19 +999,18 @@ Enjoy your wake-up experience!
         self.action_scroll = ScrollableFrame(list_container)
         self.action_scroll.pack(fill=tk.BOTH, expand=True)
 
+        # Initialize empty sequence
+        try:
+            self.current_sequence = AlarmSequence("New Sequence")
+            self.new_sequence() 
+        except Exception as e:
+            logging.error(f"Failed to init sequence: {e}")
+
     def render_action_list(self):
         """Re-render the list of ActionCards based on current_sequence."""
-        from .components import ActionCard
         
-        # Temporarily hide the scrollable area to reduce flickering
-        self.action_scroll.canvas.pack_forget()
-        
-        # Clear existing
-        for widget in self.action_scroll.scrollable_frame.winfo_children():
-            widget.destroy()
-            
         if not self.current_sequence:
-            self.action_scroll.canvas.pack(side="left", fill="both", expand=True)
+            self.action_scroll.set_items([], None)
             return
 
         callbacks = {
@@ -819,30 +1024,25 @@ Enjoy your wake-up experience!
             'play_from': self.play_sequence_from_index
         }
         
-        for i, action in enumerate(self.current_sequence.actions):
-            card = ActionCard(
-                self.action_scroll.scrollable_frame,
-                action_index=i,
-                action_data={'type': action.action_type, 'config': action.config},
-                callbacks=callbacks
-            )
-            card.pack(fill=tk.X, pady=2)
-        
-        # Update layout and show the canvas again
-        self.action_scroll.scrollable_frame.update_idletasks()
-        self.action_scroll.canvas.pack(side="left", fill="both", expand=True)
+        # Cards are only built for the rows in view (and recycled on scroll),
+        # so long sequences don't create hundreds of widgets up front.
+        # Rows are matched to the previous render by their config object, so
+        # a move/remove/duplicate leaves untouched actions' cards as they were.
+        items = [{'type': action.action_type, 'config': action.config}
+                 for action in self.current_sequence.actions]
+        parent = self.action_scroll.scrollable_frame
+        self.action_scroll.set_items(
+            items,
+            lambda i, data: ActionCard(parent, action_index=i, action_data=data, callbacks=callbacks),
+            key=lambda data: (data['type'], id(data['config']))
+        )
 
     # --- Accordion Callbacks ---
     def play_action_by_index(self, index):
         """Play a single action by index."""
         if 0 <= index < len(self.current_sequence.actions):
             action = self.current_sequence.actions[index]
-            import threading
-            from logic.actions import execute_action
-            threading.Thread(
-                target=lambda: execute_action(action.action_type, action.config),
-                daemon=True
-            ).start()
+            self._action_runner.submit(execute_action, action.action_type, action.config)
     
     def update_action_from_card(self, index, new_config):
         if 0 <= index < len(self.current_sequence.actions):
@@ -852,40 +1052,37 @@ Enjoy your wake-up experience!
             # ideally updates summary label.
             # For now, let's just log and maybe update title if possible, or just leave it.
             logging.info(f"Updated action {index}")
-            self.refresh_action_list() # This WILL close the accordion... trade-off.
+            self._schedule_render() # This WILL close the accordion... trade-off.
             
     def remove_action_by_index(self, index):
         self.current_sequence.remove_action(index)
-        self.refresh_action_list()
+        self._render_now()
         
     def move_action_up_by_index(self, index):
         if index > 0:
             self.current_sequence.move_action(index, index - 1)
-            self.refresh_action_list()
+            self._render_now()
             
     def move_action_down_by_index(self, index):
         if index < len(self.current_sequence.actions) - 1:
             self.current_sequence.move_action(index, index + 1)
-            self.refresh_action_list()
+            self._render_now()
 
     def move_action_to_index(self, from_index, to_index):
         """Move an action from one index to another."""
         if 0 <= from_index < len(self.current_sequence.actions) and \
            0 <= to_index < len(self.current_sequence.actions):
             self.current_sequence.move_action(from_index, to_index)
-            self.refresh_action_list()
-
-            self.refresh_action_list()
+            self._render_now()
 
     def duplicate_action_by_index(self, index):
         """Duplicate an action and insert it after the original."""
         if 0 <= index < len(self.current_sequence.actions):
             original = self.current_sequence.actions[index]
             # Deep copy config to avoid reference issues
-            import copy
-            new_config = copy.deepcopy(original.config)
+            new_config = _clone_config(original.config)
             self.current_sequence.insert_action(index + 1, original.action_type, new_config)
-            self.refresh_action_list()
+            self._render_now()
 
     def play_sequence_from_index(self, index):
         """Play sequence starting from the given index."""
@@ -893,27 +1090,41 @@ Enjoy your wake-up experience!
             return
             
         logging.info(f"Playing sequence from index {index}")
-        import threading
         def run_partial():
-            from logic.actions import execute_action
-            # Slice the actions list from index to end
-            actions_to_run = self.current_sequence.actions[index:]
-            for action in actions_to_run:
+            # Iterate a copy: playback outlives the click, and the editor may
+            # move/remove actions on the UI thread meanwhile. A live islice
+            # would then skip or repeat actions.
+            for action in self.current_sequence.actions[index:]:
                 execute_action(action.action_type, action.config)
         
-        threading.Thread(target=run_partial, daemon=True).start()
+        self._action_runner.submit(run_partial)
 
     # --- Legacy Adaptors ---
     def refresh_action_list(self):
         """Legacy name, forwards to render_action_list"""
         self.render_action_list()
 
+    def _schedule_render(self):
+        """Re-render the action list once, 50ms after the last of a burst of edits."""
+        if self._render_after_id is not None: return
+        self._render_after_id = self.after(50, self._flush_render)
+
+    def _flush_render(self):
+        self._render_after_id = None
+        self.render_action_list()
+
+    def _render_now(self):
+        """Re-render straight away (structural edits: cards' indexes just shifted)."""
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        self.render_action_list()
+
     def add_action(self):
         """Add action from the footer combo."""
         action_type = self.action_type.get()
         if not action_type or not self.current_sequence: return
         
-        from logic.actions import get_action_template
         config = get_action_template(action_type)
         
         self.current_sequence.add_action(action_type, config)
@@ -940,14 +1151,7 @@ Enjoy your wake-up experience!
         self.sleep_cycle_info_label.grid(row=0, column=0, columnspan=7, padx=5, pady=5, sticky="ew")
         
         self.sleep_cycle_buttons = []
-        # Cycle hours are exactly 1.5, 3.0, 4.5, 6.0, 7.5, 9.0, 10.5
-        # The offset is added on top of that logic
-        base_cycles = [
-            (1, 1.5), (2, 3.0), (3, 4.5), (4, 6.0),
-            (5, 7.5), (6, 9.0), (7, 10.5)
-        ]
-        
-        for i, (cycle_num, cycle_hours) in enumerate(base_cycles):
+        for i, (cycle_num, cycle_hours) in enumerate(_BASE_CYCLES):
             btn = ttk.Button(sleep_frame, text="", command=lambda h=cycle_hours: self.set_sleep_cycle(h))
             btn.grid(row=1, column=i, padx=1, pady=1, sticky="ew")
             sleep_frame.grid_columnconfigure(i, weight=1)
@@ -960,8 +1164,7 @@ Enjoy your wake-up experience!
         input_row.grid(row=1, column=0, columnspan=4, padx=5, pady=5, sticky="ew")
         input_row.grid_columnconfigure(0, weight=1)
         
-        from core.config import get_config
-        config = get_config()
+        config = self._config
         format = config.get("ui", "time_format") or "12h"
         
         # Time Frame (No Box)
@@ -977,8 +1180,6 @@ Enjoy your wake-up experience!
         
         # 12-hour
         self.ampm_container = ttk.Frame(self.time_input_container)
-        if format in ("12h", "Both"):
-            self.ampm_container.pack(side=tk.LEFT, padx=10)
         
         self.ampm_hour = ttk.Entry(self.ampm_container, width=3, font=big_font)
         self.ampm_hour.pack(side=tk.LEFT)
@@ -992,15 +1193,12 @@ Enjoy your wake-up experience!
         ttk.Radiobutton(ampm_radio_frame, text="AM", variable=self.time_format, value="AM", command=self.handle_ampm_change).pack(side=tk.TOP)
         ttk.Radiobutton(ampm_radio_frame, text="PM", variable=self.time_format, value="PM", command=self.handle_ampm_change).pack(side=tk.BOTTOM)
         
-        if format == "Both":
-            ttk.Label(self.time_input_container, text="=", font=big_font).pack(side=tk.LEFT, padx=15)
+        time_sep = ttk.Label(self.time_input_container, text="=", font=big_font)
 
         # 24-hour
         self.mil_container = ttk.Frame(self.time_input_container)
-        if format in ("24h", "Both"):
-            self.mil_container.pack(side=tk.LEFT, padx=10)
         
-        self.mil_label = ttk.Label(self.mil_container, text="24-Hour:" if format in ("24h", "Both") else "", font=('Arial', 12) if format in ("24h", "Both") else None)
+        self.mil_label = ttk.Label(self.mil_container, text="24-Hour:", font=('Arial', 12))
         self.mil_label.pack(side=tk.LEFT)
         
         self.military_hour = ttk.Entry(self.mil_container, width=3, font=big_font)
@@ -1009,6 +1207,15 @@ Enjoy your wake-up experience!
         self.military_minute = ttk.Entry(self.mil_container, width=3, font=big_font)
         self.military_minute.pack(side=tk.LEFT, padx=2)
         
+        # Time format -> (widget, padx) packed left to right; change_time_format reuses these
+        self._time_layouts = {
+            "12h": ((self.ampm_container, 10),),
+            "24h": ((self.mil_container, 10),),
+            "Both": ((self.ampm_container, 10), (time_sep, 15), (self.mil_container, 10)),
+        }
+        self._time_layout_widgets = (self.ampm_container, time_sep, self.mil_container)
+        self._apply_time_layout(format)
+        
         # --- Row 2: Sequence (One Line) ---
         seq_frame = ttk.Frame(control_frame)
         seq_frame.grid(row=2, column=0, columnspan=4, padx=5, pady=(0, 5), sticky="ew")
@@ -1030,13 +1237,8 @@ Enjoy your wake-up experience!
         # Putting it in the title achieves this with the box.
 
         self.day_vars = {}
-        days_list = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
         
-        # Configure style for larger checkboxes
-        s = ttk.Style()
-        s.configure("Big.TCheckbutton", font=("Segoe UI", 11, "bold"))
-        
-        for i, day in enumerate(days_list):
+        for i, day in enumerate(_DAYS_LIST):
             var = tk.BooleanVar(value=False)
             self.day_vars[day] = var
             # Use the custom style
@@ -1077,9 +1279,13 @@ Enjoy your wake-up experience!
         self.bind_time_entry_events(self.ampm_hour, 12, is_hour=True)
         self.bind_time_entry_events(self.ampm_minute, 59)
         
+        # One class binding shared by all four entries. The tag goes after the
+        # widget's own so validate_and_adjust still normalizes the field first.
+        self.bind_class('TimeEntry', '<FocusOut>', self._on_time_entry_commit)
+        self.bind_class('TimeEntry', '<Return>', self._on_time_entry_commit)
         for widget in (self.ampm_hour, self.ampm_minute, self.military_hour, self.military_minute):
-            widget.bind('<FocusOut>', self.sync_time_formats)
-            widget.bind('<Return>', self.sync_time_formats)
+            tags = widget.bindtags()
+            widget.bindtags(tags[:1] + ('TimeEntry',) + tags[1:])
 
         # Alarm List
         list_frame = ttk.Frame(self.alarms_frame)
@@ -1097,7 +1303,7 @@ Enjoy your wake-up experience!
         ttk.Label(list_frame, textvariable=self.next_alarm_var, font=("Segoe UI", 10, "bold"), foreground="#007ACC").pack(anchor=tk.W, pady=5)
         
         # Initial load
-        self.refresh_alarm_list()
+        self.schedule_alarm_refresh()
         
         # Bind single-click to edit (User Request: "click any alarm and it pulls up")
         self.alarm_list.bind("<<TreeviewSelect>>", self.edit_selected_alarm)
@@ -1109,29 +1315,27 @@ Enjoy your wake-up experience!
         help_notebook = ttk.Notebook(self.help_frame)
         help_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # 1. Overview Tab
-        overview_frame = ttk.Frame(help_notebook)
-        help_notebook.add(overview_frame, text="Overview")
-        self.init_help_overview(overview_frame)
-        
-        # 2. System Info Tab
-        sysbox_frame = ttk.Frame(help_notebook)
-        help_notebook.add(sysbox_frame, text="System Info")
-        self.init_help_system_info(sysbox_frame)
-        
-        # 3. Troubleshooting Tab
-        trouble_frame = ttk.Frame(help_notebook)
-        help_notebook.add(trouble_frame, text="Troubleshooting")
-        self.init_help_troubleshooting(trouble_frame)
-
-        # 4. License Tab
-        license_frame = ttk.Frame(help_notebook)
-        help_notebook.add(license_frame, text="License")
-        self.init_help_license(license_frame)
+        # Subtabs start empty and are built the first time they are selected
+        self._help_tab_builders = {}
+        self._help_tabs_built = set()
+        for text, builder in (("Overview", self.init_help_overview),
+                              ("System Info", self.init_help_system_info),
+                              ("Troubleshooting", self.init_help_troubleshooting),
+                              ("License", self.init_help_license)):
+            frame = ttk.Frame(help_notebook)
+            help_notebook.add(frame, text=text)
+            self._help_tab_builders[str(frame)] = (frame, builder)
+        help_notebook.bind("<<NotebookTabChanged>>", self._on_help_tab_changed)
+
+    def _on_help_tab_changed(self, event):
+        tab_id = event.widget.select()
+        if tab_id in self._help_tabs_built: return
+        frame, builder = self._help_tab_builders[tab_id]
+        self._help_tabs_built.add(tab_id)
+        builder(frame)
 
     def init_help_overview(self, parent):
-        from .theme import COLORS
-        import tkinter.scrolledtext as scrolledtext
+        COLORS = theme.COLORS
         
         container = ttk.Frame(parent)
         container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -1146,54 +1350,22 @@ Enjoy your wake-up experience!
         )
         help_text.pack(fill=tk.BOTH, expand=True)
         
-        instructions = """
-Quickstart Guide
-
-1. Create a Sequence  (SEQUENCES tab)
-   - Click 'New' to start a fresh sequence.
-   - Select an action from the dropdown (e.g. 'play_video') and click '+ Add to End'.
-   - Configure the action — choose a video file, URL, etc.
-   - Click 'Save', then '▶ Test' to verify it works.
-
-2. Set Your Alarm  (ALARMS tab)
-   - Select your saved sequence from the dropdown.
-   - Enter your wake-up time (12h or 24h — set your preference in Settings).
-   - Choose recurring days, or leave blank for a one-time alarm.
-   - Click 'SET ALARM'. The alarm is now registered with your OS scheduler.
-
-3. Important: Power & Session
-   - Your computer must be ON and logged in for alarms to fire.
-   - Linux: keep the app open to prevent the computer from sleeping (Sleep Mode).
-   - Windows: may run a missed alarm at next boot if the PC was off at alarm time.
-
-4. First Time Setup
-   - MPV (Linux) or VLC (Windows) will automatically prompt for installation if not found.
-   - Go to Settings → Install → 'Add to Applications' (Linux) or 'Add to Start Menu' (Windows)
-     to register the app with your launcher and give it the correct icon.
-   - Your build version is shown at the top of the Settings tab.
-        """
-        help_text.insert(tk.END, instructions.strip())
+        help_text.insert(tk.END, _OVERVIEW_INSTRUCTIONS)
         help_text.configure(state='disabled')
 
     def init_help_system_info(self, parent):
         container = ttk.Frame(parent)
         container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        import platform, sys
-        try:
-            from core.version import get_build_version
-            app_version = get_build_version()
-        except Exception:
-            app_version = "Unknown"
-
+        sys_info = _system_info()
         info = [
-            ("App Version", app_version),
-            ("OS Platform", platform.platform()),
-            ("OS Release", platform.release()),
-            ("Python Version", sys.version.split()[0]),
-            ("Processor", platform.processor()),
-            ("Machine", platform.machine()),
-            ("App Location", os.getcwd())
+            ("App Version", sys_info["app_version"]),
+            ("OS Platform", sys_info["platform"]),
+            ("OS Release", sys_info["release"]),
+            ("Python Version", sys_info["python"]),
+            ("Processor", sys_info["processor"]),
+            ("Machine", sys_info["machine"]),
+            ("App Location", sys_info["cwd"])
         ]
         
         ttk.Label(container, text="System Information", font=("Segoe UI", 16, "bold")).pack(anchor=tk.W, pady=(0, 20))
@@ -1207,11 +1379,7 @@ Quickstart Guide
             val.pack(side=tk.LEFT)
 
         # Archive Name — pre-baked at build time, click to copy
-        try:
-            from core.version import get_archive_name
-            dated_name = get_archive_name() or "N/A (dev build)"
-        except Exception:
-            dated_name = "N/A (dev build)"
+        dated_name = sys_info["archive"] or "N/A (dev build)"
 
         archive_row = ttk.Frame(container)
         archive_row.pack(fill=tk.X, pady=5)
@@ -1228,17 +1396,19 @@ Quickstart Guide
 
         copy_lbl.bind("<Button-1>", _copy_archive)
 
+        ttk.Button(container, text="Show Scheduler Debug Info", command=self._show_scheduler_debug).pack(anchor=tk.W, pady=5)
+
         # Directories Section
         ttk.Label(container, text="System Directories", font=("Segoe UI", 14, "bold")).pack(anchor=tk.W, pady=(20, 10))
-        from core.config import get_app_data_dir
         
+        app_dirs = get_app_dirs()
         dirs = [
-             ("App Root", os.getcwd()),
-             ("Videos", os.path.join(os.getcwd(), "video")),
-             ("Sequences", os.path.join(get_app_data_dir(), "sequences")),
-             ("Journals", os.path.join(os.getcwd(), "journals")),
-             ("Captures", os.path.join(os.getcwd(), "captures")),
-             ("Audio/Notes", os.path.join(os.getcwd(), "audio")) # Assuming audio dir exists or is desired
+             ("App Root", app_dirs["root"]),
+             ("Videos", app_dirs["videos"]),
+             ("Sequences", app_dirs["sequences"]),
+             ("Journals", app_dirs["journals"]),
+             ("Captures", app_dirs["captures"]),
+             ("Audio/Notes", app_dirs["audio"]) # Assuming audio dir exists or is desired
         ]
         
         for label, path in dirs:
@@ -1251,14 +1421,11 @@ Quickstart Guide
             path_lbl.pack(side=tk.LEFT)
             
             def open_dir(p=path):
-                import webbrowser
-                if os.path.exists(p):
+                try:
+                    os.makedirs(p, exist_ok=True)
                     webbrowser.open(p)
-                else:
-                    try:
-                        os.makedirs(p)
-                        webbrowser.open(p)
-                    except: pass
+                except OSError:
+                    pass
                     
             path_lbl.bind("<Button-1>", lambda e, p=path: open_dir(p))
             
@@ -1272,12 +1439,11 @@ Quickstart Guide
             font=("Consolas", 9), state="normal"
         )
         license_text.pack(fill=tk.BOTH, expand=True)
-        license_text.insert(tk.END, self._read_license())
+        license_text.insert(tk.END, _read_license())
         license_text.configure(state="disabled")
 
     def init_help_troubleshooting(self, parent):
-        from .theme import COLORS
-        import webbrowser
+        COLORS = theme.COLORS
         
         container = ttk.Frame(parent)
         container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -1347,8 +1513,7 @@ Quickstart Guide
         if not temp_name:
             temp_name = "New Sequence"
             
-        from core.config import get_app_data_dir
-        temp_dir = os.path.join(get_app_data_dir(), "sequences", "temp")
+        temp_dir = self._temp_seq_dir
         
         try:
             os.makedirs(temp_dir, exist_ok=True)
@@ -1363,26 +1528,17 @@ Quickstart Guide
                             "This test is running from a temporary file to prevent overwriting your existing sequence.\n\n"
                             "Don't forget to click 'Save' if this works exactly how you would like!")
 
-        # Run in a separate thread to spawn the subprocess
-        import threading
-        def run_test():
-            try:
-                from core.config import get_app_data_dir
-                temp_file_path = os.path.join(get_app_data_dir(), "sequences", "temp", f"{temp_name}")
-                
-                cmd = [sys.executable, "src/main.py", "--execute-sequence", temp_file_path]
-                if getattr(sys, 'frozen', False):
-                    cmd = [sys.executable, "--execute-sequence", temp_file_path]
-                
-                # Use subprocess.Popen so we don't block the UI while testing
-                subprocess.Popen(cmd)
-                logging.info(f"Spawned test subprocess for temp sequence {temp_name}")
-            except Exception as e:
-                # Catch unexpected top-level errors
-                logging.error(f"Test sequence failed: {e}")
-                self.after(0, lambda: messagebox.showerror("Test Error", f"Unexpected error:\n{str(e)}"))
+        temp_file_path = os.path.join(temp_dir, temp_name)
+        
+        cmd = [*_TEST_CMD_PREFIX, "--execute-sequence", temp_file_path]
         
-        threading.Thread(target=run_test, daemon=True).start()
+        # Popen returns as soon as the child is started, so the UI isn't blocked
+        try:
+            subprocess.Popen(cmd)
+            logging.info(f"Spawned test subprocess for temp sequence {temp_name}")
+        except Exception as e:
+            logging.error(f"Test sequence failed: {e}")
+            messagebox.showerror("Test Error", f"Unexpected error:\n{str(e)}")
 
     def set_alarm(self):
         """Set an alarm for the current time and selected sequence."""
@@ -1401,8 +1557,9 @@ Quickstart Guide
             # If Recurring: Just use the time + days.
             
             # Logic:
-            alarm_time = datetime.now().replace(hour=h, minute=m, second=0, microsecond=0)
-            if alarm_time < datetime.now() and not self.editing_alarm:
+            now = datetime.now()
+            alarm_time = now.replace(hour=h, minute=m, second=0, microsecond=0)
+            if alarm_time < now and not self.editing_alarm:
                 # Only Auto-increment day if NOT editing (or maybe if editing and time is past?)
                 # If editing, user might mean "change time to 8am" (which is tomorrow).
                 # Let's keep "Next valid time" logic.
@@ -1410,28 +1567,34 @@ Quickstart Guide
                 
             # Get selected days
             selected_days = [day for day, var in self.day_vars.items() if var.get()]
-            one_time = len(selected_days) == 0
-            
-            from logic.scheduler import AlarmScheduler
-            scheduler = AlarmScheduler()
+            one_time = not selected_days
             
             # If editing, remove old one first -> REMOVED as per request to simplify
             # if self.editing_alarm: ...
             
             logging.info(f"Attempting to set alarm for {alarm_time.strftime('%Y-%m-%d %H:%M')} using sequence '{sequence_name}'")
             
-            success, msg = scheduler.add_alarm(alarm_time, sequence_name, days=selected_days, one_time=one_time)
-            if success:
-                messagebox.showinfo("Success", msg)
-                logging.info(f"Alarm successfully set via scheduler")
-                self.after(500, self.refresh_alarm_list)
-            else:
-                messagebox.showerror("Error", f"Failed to set alarm:\n{msg}")
-                logging.error(f"Scheduler failed to add alarm: {msg}")
+            self._run_scheduler(
+                lambda scheduler: scheduler.add_alarm(alarm_time, sequence_name, days=selected_days, one_time=one_time),
+                self._on_alarm_added)
                 
         except ValueError:
             messagebox.showerror("Error", "Invalid time")
 
+    def _on_alarm_added(self, future):
+        try:
+            success, msg = future.result()
+        except Exception as e:
+            logging.exception(f"Scheduler raised while adding alarm: {e}")
+            success, msg = False, str(e)
+        if success:
+            messagebox.showinfo("Success", msg)
+            logging.info(f"Alarm successfully set via scheduler")
+            self.after(500, self.schedule_alarm_refresh)
+        else:
+            messagebox.showerror("Error", f"Failed to set alarm:\n{msg}")
+            logging.error(f"Scheduler failed to add alarm: {msg}")
+
     def edit_selected_alarm(self, event=None):
         """Populate inputs from selected alarm for editing."""
         selected = self.alarm_list.selection()
@@ -1444,18 +1607,14 @@ Quickstart Guide
         
         time_str, seq_name, days_str, _ = values
         
-        from core.config import get_app_data_dir
-        # Validate Sequence Existence
-        seq_path = os.path.join(get_app_data_dir(), "sequences", f"{seq_name}.json")
-        if not os.path.exists(seq_path):
+        # Validate Sequence Existence (against the last folder scan)
+        if str(seq_name) not in self._valid_sequences:
              messagebox.showwarning("Missing Sequence", f"The sequence '{seq_name}' was not found!\n\nYou can delete this alarm or select a valid sequence.")
         
         # 1. Set Time
         try:
             h, m = map(int, time_str.split(':'))
-            self.military_hour.delete(0, tk.END); self.military_hour.insert(0, f"{h:02d}")
-            self.military_minute.delete(0, tk.END); self.military_minute.insert(0, f"{m:02d}")
-            self.sync_time_formats() # Update 12h view
+            self._apply_time(h, m)
         except ValueError:
             pass
             
@@ -1463,20 +1622,17 @@ Quickstart Guide
         self.sequence_var.set(seq_name)
         
         # 3. Set Days
-        # Reset all first
-        for var in self.day_vars.values(): var.set(False)
-        
         if "Daily" in days_str:
-            for var in self.day_vars.values(): var.set(True)
+            wanted = self.day_vars.keys()
         elif "Once" in days_str or not days_str:
             # No days checked
-            pass 
+            wanted = ()
         else:
             # Parse commas "MON, WED"
-            for d in days_str.split(','):
-                d = d.strip().upper()
-                if d in self.day_vars:
-                    self.day_vars[d].set(True)
+            wanted = {d.strip().upper() for d in days_str.split(',')}
+        # One write per checkbox
+        for day, var in self.day_vars.items():
+            var.set(day in wanted)
                     
         # 4. Just Pre-fill (No Editing State)
         self.set_alarm_btn.config(text="SET ALARM")
@@ -1493,22 +1649,32 @@ Quickstart Guide
         self.cancel_edit_btn.pack_forget()
         
         # Reset to defaults
-        self.military_hour.delete(0, tk.END); self.military_hour.insert(0, "07")
-        self.military_minute.delete(0, tk.END); self.military_minute.insert(0, "30")
-        self.sync_time_formats()
+        self._apply_time(7, 30)
         self.sequence_combo.current(0) if self.sequence_combo['values'] else None
         for var in self.day_vars.values(): var.set(False)
 
 
 
     def refresh_sequence_list(self):
-        """Populate the sequence combobox with available sequences."""
-        from core.config import get_app_data_dir
-        seq_dir = os.path.join(get_app_data_dir(), "sequences")
-        if not os.path.exists(seq_dir): os.makedirs(seq_dir)
-        
-        sequences = [f[:-5] for f in os.listdir(seq_dir) if f.endswith(".json")]
-        self.sequence_combo['values'] = sequences
+        """Populate the sequence combobox with available sequences.
+
+        The folder is only rescanned when its mtime moves (a file was added,
+        removed or renamed), so a tab switch normally costs one stat().
+        """
+        try:
+            mtime = os.stat(self._seq_dir).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if self._seq_list_cache is None or self._seq_list_cache[0] != mtime:
+            sequences = []
+            if mtime is not None:
+                with os.scandir(self._seq_dir) as it:
+                    sequences = [e.name[:-5] for e in it
+                                 if e.name.endswith(".json") and e.is_file()]
+            self._seq_list_cache = (mtime, sequences)
+            self._valid_sequences = frozenset(sequences)
+            self.sequence_combo['values'] = sequences
+        sequences = self._seq_list_cache[1]
         if sequences and not self.sequence_var.get():
             self.sequence_combo.current(0)
 
@@ -1518,54 +1684,122 @@ Quickstart Guide
         for var in self.day_vars.values():
             var.set(not all_checked)
 
+    def schedule_alarm_refresh(self):
+        """Refresh the alarm list once at idle, however often this is called before then."""
+        if not self._alarm_refresh_pending:
+            self._alarm_refresh_pending = True
+            self.after_idle(self._flush_alarm_refresh)
+
+    def _flush_alarm_refresh(self):
+        self._alarm_refresh_pending = False
+        self.refresh_alarm_list()
+
     def refresh_alarm_list(self):
-        """Refresh the Treeview with alarms from the scheduler."""
-        for item in self.alarm_list.get_children():
-            self.alarm_list.delete(item)
-            
-        from logic.scheduler import AlarmScheduler
-        scheduler = AlarmScheduler()
+        """Refresh the Treeview with alarms from the scheduler (queried off the Tk thread)."""
+        self._run_scheduler(lambda scheduler: scheduler.list_alarms(), self._apply_alarm_list)
+
+    def _apply_alarm_list(self, future):
         try:
-            alarms = scheduler.list_alarms()
+            alarms = future.result()
+            rows = []
             for alarm in alarms:
                 days_str = ", ".join(alarm['days']) if isinstance(alarm['days'], list) else alarm['days']
-                enabled_str = "Enabled" if alarm.get('enabled', True) else "Disabled"
-                self.alarm_list.insert("", tk.END, values=(alarm['time'], alarm['sequence'], days_str, enabled_str))
+                enabled_str = _STATUS_TEXT[bool(alarm.get('enabled', True))]
+                rows.append((alarm['time'], alarm['sequence'], days_str, enabled_str))
+            self._apply_alarm_rows(rows)
             
             # Update Next Alarm Ticker
             if alarms:
-                # Sort alarms by time for a rough "next" estimate
-                sorted_alarms = sorted(alarms, key=lambda x: x['time'])
-                self.next_alarm_var.set(f"Next Alarm: {sorted_alarms[0]['time']} ({sorted_alarms[0]['sequence']})")
+                # Earliest time of day for a rough "next" estimate. Linux lists
+                # "7:30" unpadded, so pad before comparing against "10:00".
+                first = min(alarms, key=lambda x: x['time'].zfill(5))
+                self.next_alarm_var.set(f"Next Alarm: {first['time']} ({first['sequence']})")
             else:
                 self.next_alarm_var.set("Next Alarm: None")
         except Exception as e:
             logging.error(f"Failed to refresh alarm list: {e}")
 
+    def _apply_alarm_rows(self, rows):
+        """Bring the Treeview in line with rows, only touching the rows that changed.
+
+        Rows are matched on (time, sequence, days); unchanged alarms keep their
+        item (and selection) and cost no Tk calls.
+        """
+        tree = self.alarm_list
+        old = {}
+        for iid, values in self._alarm_rows.items():
+            old.setdefault(values[:3], []).append(iid)
+        
+        new_rows = {}
+        order = []
+        added = []
+        for values in rows:
+            bucket = old.get(values[:3])
+            if bucket:
+                iid = bucket.pop()
+                if self._alarm_rows[iid] != values:
+                    tree.item(iid, values=values)
+            else:
+                iid = tree.insert("", tk.END, values=values)
+                added.append(iid)
+            new_rows[iid] = values
+            order.append(iid)
+        
+        stale = [iid for bucket in old.values() for iid in bucket]
+        if stale:
+            tree.delete(*stale)
+        if [iid for iid in self._alarm_rows if iid in new_rows] + added != order:
+            # Keep the scheduler's order; one Tk call for the whole list
+            tree.set_children("", *order)
+        self._alarm_rows = new_rows
+
     def on_tab_changed(self, event=None):
         """Handle notebook tab switches."""
+        self._ensure_tab_built(self.notebook.select())
         current_tab = self.notebook.tab(self.notebook.select(), "text")
         if current_tab == "ALARMS":
             self.refresh_sequence_list()
-            self.refresh_alarm_list()
+            self.schedule_alarm_refresh()
         elif current_tab == "SEQUENCES":
             self.refresh_action_list()
         elif current_tab == "SETTINGS":
             self.update_log_path_display()
+        self._set_settings_wheel(current_tab == "SETTINGS")
+
+    def _ensure_tab_built(self, tab_id):
+        """Build a lazily-initialized tab's content the first time it is needed."""
+        entry = self._tab_builders.get(str(tab_id))
+        if entry is None:
+            return
+        key, builder = entry
+        if not self._tab_initialized[key]:
+            self._tab_initialized[key] = True
+            builder()
 
     def _show_scheduler_debug(self):
         """Show detailed debug info from the scheduler."""
-        from logic.scheduler import AlarmScheduler
-        scheduler = AlarmScheduler()
-        info = scheduler.get_debug_info()
-        
-        # Create a popup window
+        # Create a popup window straight away; the info is filled in when ready
         top = tk.Toplevel(self)
         top.title("Scheduler Debug Info")
         top.geometry("600x400")
         
         text_area = scrolledtext.ScrolledText(top, wrap=tk.WORD, font=('Consolas', 10))
         text_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        text_area.insert(tk.END, "Loading...")
+        text_area.configure(state='disabled')
+        
+        self._run_scheduler(lambda scheduler: scheduler.get_debug_info(),
+                            lambda future: self._fill_scheduler_debug(text_area, future))
+
+    def _fill_scheduler_debug(self, text_area, future):
+        try:
+            info = future.result()
+        except Exception as e:
+            info = f"Failed to get scheduler debug info: {e}"
+        if not text_area.winfo_exists():
+            return  # Popup closed before the info arrived
+        text_area.configure(state='normal')
+        text_area.delete("1.0", tk.END)
         text_area.insert(tk.END, info)
         text_area.configure(state='disabled')
 
@@ -1590,8 +1824,7 @@ Quickstart Guide
             messagebox.showwarning("Warning", "Please select an alarm to delete")
             return
             
-        from logic.scheduler import AlarmScheduler
-        scheduler = AlarmScheduler()
+        targets = []
         for item in selected:
             try:
                 values = self.alarm_list.item(item, 'values')
@@ -1599,27 +1832,42 @@ Quickstart Guide
                 
                 # Treeview columns: time, sequence, days, enabled (4 columns!)
                 # NEVER use tuple unpacking here — use index access!
-                time_str = values[0]
-                sequence = values[1]
-                days_str = values[2] if len(values) > 2 else ""
-                
+                # str(): Treeview hands numeric-looking cells back as ints
+                time_str = str(values[0])
+                sequence = str(values[1])
+                days_str = str(values[2]) if len(values) > 2 else ""
+                targets.append((sequence, time_str, days_str))
+            except Exception as e:
+                logging.exception(f"Error in delete_selected_alarm for item {item}: {e}")
+                messagebox.showerror("Error", f"Unexpected error deleting alarm:\n{str(e)}")
+        
+        def remove_all(scheduler):
+            # Runs on the alarm-io worker; one backend call (one crontab write on Linux)
+            for sequence, time_str, days_str in targets:
                 logging.info(f"Attempting to remove alarm: sequence='{sequence}', time='{time_str}', days='{days_str}'")
-                
-                success, msg = scheduler.remove_alarm(sequence, time_str, days_str=days_str)
+            errors = []
+            for (sequence, time_str, _), (success, msg) in zip(targets, scheduler.remove_alarms(targets)):
                 if success:
                      logging.info(f"Removed alarm: {sequence} at {time_str} - {msg}")
                 else:
                      logging.error(f"Failed to remove alarm: {msg}")
-                     messagebox.showerror("Error", f"Failed to remove alarm:\n{msg}")
-            except Exception as e:
-                logging.exception(f"Error in delete_selected_alarm for item {item}: {e}")
-                messagebox.showerror("Error", f"Unexpected error deleting alarm:\n{str(e)}")
+                     errors.append(msg)
+            return errors
         
-        self.refresh_alarm_list()
+        self._run_scheduler(remove_all, self._on_alarms_removed)
+
+    def _on_alarms_removed(self, future):
+        try:
+            errors = future.result()
+        except Exception as e:
+            logging.exception(f"Error in delete_selected_alarm: {e}")
+            errors = [f"Unexpected error: {str(e)}"]
+        if errors:
+            messagebox.showerror("Error", "Failed to remove alarm:\n" + "\n".join(errors))
+        self.schedule_alarm_refresh()
 
 
     def new_sequence(self):
-        from logic.sequence import AlarmSequence
         self.current_sequence = AlarmSequence("New Sequence")
         self.sequence_name.delete(0, tk.END)
         self.sequence_name.insert(0, "New Sequence")
@@ -1630,15 +1878,9 @@ Quickstart Guide
         self.refresh_action_list()
 
     def load_sequence(self):
-        # TODO: Define sequence directory
-        from core.config import get_app_data_dir
-        seq_dir = os.path.join(get_app_data_dir(), "sequences")
-        if not os.path.exists(seq_dir): os.makedirs(seq_dir)
-        
-        file_path = filedialog.askopenfilename(initialdir=seq_dir, filetypes=[("JSON files", "*.json")])
+        file_path = filedialog.askopenfilename(initialdir=self._seq_dir, filetypes=[("JSON files", "*.json")])
         if file_path:
             try:
-                from logic.sequence import AlarmSequence
                 self.current_sequence = AlarmSequence.load(file_path)
                 self.sequence_name.delete(0, tk.END)
                 self.sequence_name.insert(0, self.current_sequence.name)
@@ -1663,9 +1905,9 @@ Quickstart Guide
                 return
             self.current_sequence.name = name
             
-            from core.config import get_app_data_dir
-            seq_dir = os.path.join(get_app_data_dir(), "sequences")
-            self.current_sequence.save(seq_dir)
+            self.current_sequence.save(self._seq_dir)
+            # Coarse-mtime filesystems can miss an add right after a scan
+            self._seq_list_cache = None
             messagebox.showinfo("Success", "Sequence saved")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save: {e}")
@@ -1675,7 +1917,6 @@ Quickstart Guide
         action_type = self.action_type.get()
         if not action_type or not self.current_sequence: return
         
-        from logic.actions import get_action_template
         config = get_action_template(action_type)
         
         self.current_sequence.add_action(action_type, config)
@@ -1705,22 +1946,6 @@ Quickstart Guide
                 event.widget.select_range(0, tk.END)
             return "break"
             
-        def on_key_press(event):
-            if event.keysym in ('BackSpace', 'Delete', 'Left', 'Right'):
-                return
-            if not event.char.isdigit():
-                return "break"
-            
-            current = event.widget.get()
-            cursor_pos = event.widget.index(tk.INSERT)
-            
-            if cursor_pos == 0 and current:
-                event.widget.icursor(len(current))
-                return "break"
-                
-            if len(current) >= 2 and not event.widget.selection_present():
-                return "break"
-        
         def validate_and_adjust(event=None):
             try:
                 value = event.widget.get() if event and event.widget else entry.get()
@@ -1735,36 +1960,56 @@ Quickstart Guide
                 
                 if is_hour:
                     if is_24hour:
-                        while num >= 24: num -= 24
+                        num %= 24
                     else:
-                        while num > 12: num -= 12
-                        if num == 0: num = 12
+                        num = num % 12 or 12
                 else:
-                    extra_hours = 0
-                    while num >= 60:
-                        num -= 60
-                        extra_hours += 1
-                    
-                    if extra_hours > 0:
-                        try:
-                            # Simple increment for now, full sync handles the rest
-                            pass 
-                        except ValueError:
-                            pass
+                    num %= 60
                 
-                entry.delete(0, tk.END)
-                entry.insert(0, f"{num:02d}")
+                self._set_entry(entry, f"{num:02d}")
                 
             except ValueError:
                 if event and event.type == '10':
                     entry.delete(0, tk.END)
                     entry.insert(0, "00")
         
+        # Keystrokes are filtered by Tk's own validation (at most two digits);
+        # the Tcl command is registered once and shared by all time entries
+        if self._time_vcmd is None:
+            self._time_vcmd = (self.register(_is_time_fragment), '%P')
+        entry.configure(validate='key', validatecommand=self._time_vcmd)
+        
         entry.bind('<FocusIn>', on_focus_in)
-        entry.bind('<KeyPress>', on_key_press)
         entry.bind('<FocusOut>', validate_and_adjust)
         entry.bind('<Return>', validate_and_adjust)
-        entry.bind('<Tab>', validate_and_adjust)
+
+    @staticmethod
+    def _set_entry(entry, text):
+        """Replace an Entry's text, skipping the Tcl round-trips when it already matches."""
+        if entry.get() != text:
+            entry.delete(0, tk.END)
+            entry.insert(0, text)
+
+    def _on_time_entry_commit(self, event):
+        """Queue one sync for a Return/FocusOut burst from the time entries."""
+        if self._time_sync_pending:
+            return
+        self._time_sync_pending = True
+        
+        def run():
+            self._time_sync_pending = False
+            self.sync_time_formats(event)
+        self.after_idle(run)
+
+    def _apply_time(self, h24, m):
+        """Show a 24h time in both the 24h and 12h entries in one pass."""
+        h24 %= 24
+        m = min(m, 59)
+        self._set_entry(self.military_hour, f"{h24:02d}")
+        self._set_entry(self.military_minute, f"{m:02d}")
+        self._set_entry(self.ampm_hour, f"{(h24 % 12) or 12:02d}")
+        self._set_entry(self.ampm_minute, f"{m:02d}")
+        self.time_format.set("PM" if h24 >= 12 else "AM")
 
     def sync_time_formats(self, event=None):
         try:
@@ -1779,16 +2024,16 @@ Quickstart Guide
                 if h == 0: h = 12
                 if m > 59: m = 59
                 
-                self.ampm_hour.delete(0, tk.END); self.ampm_hour.insert(0, f"{h:02d}")
-                self.ampm_minute.delete(0, tk.END); self.ampm_minute.insert(0, f"{m:02d}")
+                self._set_entry(self.ampm_hour, f"{h:02d}")
+                self._set_entry(self.ampm_minute, f"{m:02d}")
                 
                 # Convert
                 h24 = h
                 if self.time_format.get() == "PM" and h < 12: h24 += 12
                 elif self.time_format.get() == "AM" and h == 12: h24 = 0
                 
-                self.military_hour.delete(0, tk.END); self.military_hour.insert(0, f"{h24:02d}")
-                self.military_minute.delete(0, tk.END); self.military_minute.insert(0, f"{m:02d}")
+                self._set_entry(self.military_hour, f"{h24:02d}")
+                self._set_entry(self.military_minute, f"{m:02d}")
             else:
                 # 24h -> 12h
                 h = int(self.military_hour.get() or 0)
@@ -1797,8 +2042,8 @@ Quickstart Guide
                 if h > 23: h %= 24
                 if m > 59: m = 59
                 
-                self.military_hour.delete(0, tk.END); self.military_hour.insert(0, f"{h:02d}")
-                self.military_minute.delete(0, tk.END); self.military_minute.insert(0, f"{m:02d}")
+                self._set_entry(self.military_hour, f"{h:02d}")
+                self._set_entry(self.military_minute, f"{m:02d}")
                 
                 if h >= 12:
                     self.time_format.set("PM")
@@ -1807,8 +2052,8 @@ Quickstart Guide
                     self.time_format.set("AM")
                     if h == 0: h = 12
                 
-                self.ampm_hour.delete(0, tk.END); self.ampm_hour.insert(0, f"{h:02d}")
-                self.ampm_minute.delete(0, tk.END); self.ampm_minute.insert(0, f"{m:02d}")
+                self._set_entry(self.ampm_hour, f"{h:02d}")
+                self._set_entry(self.ampm_minute, f"{m:02d}")
                 
         except ValueError:
             pass
@@ -1820,20 +2065,19 @@ Quickstart Guide
             elif h > 12: h %= 12
             if h == 0: h = 12
             
-            self.ampm_hour.delete(0, tk.END); self.ampm_hour.insert(0, f"{h:02d}")
+            self._set_entry(self.ampm_hour, f"{h:02d}")
             
             h24 = h
             if self.time_format.get() == "PM" and h < 12: h24 += 12
             elif self.time_format.get() == "AM" and h == 12: h24 = 0
             
-            self.military_hour.delete(0, tk.END); self.military_hour.insert(0, f"{h24:02d}")
+            self._set_entry(self.military_hour, f"{h24:02d}")
         except ValueError:
             pass
 
     def _sleep_cycle_info_text(self):
         """Return the info string for the Sleep Cycles section, using the configured offset."""
-        from core.config import get_config
-        offset = get_config().get("alarms", "sleep_offset_minutes")
+        offset = self._config.get("alarms", "sleep_offset_minutes")
         if offset is None:
             offset = 15
         
@@ -1843,30 +2087,38 @@ Quickstart Guide
             return f"SleepCalculator inspired — subtracts {abs(offset)}m, then calculates full 90m cycles."
 
     def update_sleep_cycle_buttons(self):
-        """Update the button text to show the correct total hours including the offset."""
-        if not hasattr(self, 'sleep_cycle_buttons'):
+        """Update the button text to show the correct total hours including the offset.
+
+        The relabel runs once at idle however many times this is called before then.
+        """
+        if not hasattr(self, 'sleep_cycle_buttons') or self._cycle_labels_pending:
             return
-            
-        from core.config import get_config
-        offset = get_config().get("alarms", "sleep_offset_minutes")
+        self._cycle_labels_pending = True
+        self.after_idle(self._apply_sleep_cycle_labels)
+
+    def _apply_sleep_cycle_labels(self):
+        self._cycle_labels_pending = False
+        offset = self._config.get("alarms", "sleep_offset_minutes")
         if offset is None:
             offset = 15
+        offset_hours = offset / 60.0
             
         for data in self.sleep_cycle_buttons:
             cycle_num = data["cycle_num"]
-            cycle_hours = data["cycle_hours"]
             # Add offset (in hours)
-            total_time = cycle_hours + (offset / 60.0)
+            total_time = data["cycle_hours"] + offset_hours
             
             cycle_text = "Cycle" if cycle_num == 1 else "Cycles"
             btn_text = f"{cycle_num} {cycle_text}\n({total_time:.2f} hours)"
-            data["btn"].config(text=btn_text)
+            # Only touch Tk for labels that actually changed
+            if data.get("text") != btn_text:
+                data["text"] = btn_text
+                data["btn"].config(text=btn_text)
 
     def set_sleep_cycle(self, hours):
         """Calculate alarm time based on current time + sleep cycle offset + cycle hours."""
         try:
-            from core.config import get_config
-            offset = get_config().get("alarms", "sleep_offset_minutes")
+            offset = self._config.get("alarms", "sleep_offset_minutes")
             if offset is None:
                 offset = 15
             offset = int(offset)
@@ -1877,11 +2129,7 @@ Quickstart Guide
             h = wake_time.hour
             m = wake_time.minute
 
-            self.military_hour.delete(0, tk.END); self.military_hour.insert(0, f"{h:02d}")
-            self.military_minute.delete(0, tk.END); self.military_minute.insert(0, f"{m:02d}")
-
-            # Sync to update 12h display
-            self.sync_time_formats()
+            self._apply_time(h, m)
 
             logging.info(f"Sleep Cycle Set: Alarm set for {wake_time.strftime('%I:%M %p')} (in {hours}h + {offset}m)")
         except Exception as e:
@@ -2004,7 +2252,7 @@ Quickstart Guide
         # Only toggle if we think it's still enabled
         if self.sleep_mode_enabled:
             # This will set sleep_mode_enabled to False and run cleanup (undim, uninhibit, update UI)
-            # The 'hide_overlay' call inside it will be safe because OverlayController clears self.overlay first.
+            # The 'hide_overlay' call inside it just withdraws the overlay, which closing does anyway.
             self.toggle_sleep_mode()
 
     def set_brightness(self, level):
@@ -2035,19 +2283,14 @@ Quickstart Guide
     def party_mode(self):
         """Play a random video from the video directory!"""
         try:
-            video_dir = os.path.join(os.getcwd(), "video")
+            video_dir = _PARTY_CONFIG["directory"]
             if not os.path.exists(video_dir):
                 os.makedirs(video_dir)
                 messagebox.showinfo("Party Mode", "Video directory created! Add some videos to 'video' folder to party!")
                 return
             
-            # Simple random video playback
-            from logic.actions import execute_action
-            config = {"directory": "video", "file_types": ["mp4", "mkv", "webm", "avi"]}
-            
             # Run in thread
-            import threading
-            threading.Thread(target=lambda: execute_action("play_random_video", config), daemon=True).start()
+            self._action_runner.submit(execute_action, "play_random_video", _PARTY_CONFIG)
             
         except Exception as e:
             logging.error(f"Party Mode failed: {e}")
@@ -3,156 +3,385 @@ from tkinter import ttk
 import logging
 import sys
 import os
+import functools
+
+IS_WIN32 = sys.platform == 'win32'
+
+# Kill-signal polling without a file watcher: back off while the overlay is idle,
+# but only a little, since an idle overlay is exactly when the alarm's kill
+# signal is expected
+POLL_MIN_MS = 500
+POLL_MAX_MS = 1000
+
+# Keys that close the overlay (Emergency Exit)
+CLOSE_KEYSYMS = frozenset(("Escape", "Shift_L", "Shift_R"))
+
+# Optional: get told about the kill signal file instead of polling for it
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
+# Without watchdog, Linux can still push signal-file events through raw inotify
+HAS_INOTIFY = False
+if not HAS_WATCHDOG and sys.platform.startswith('linux'):
+    try:
+        import ctypes
+        import select
+        import struct
+        import threading
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.inotify_init1.argtypes = [ctypes.c_int]
+        _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        HAS_INOTIFY = True
+    except (ImportError, OSError, AttributeError):
+        pass
+
+
+if HAS_WATCHDOG:
+    class _SignalFileHandler(FileSystemEventHandler):
+        """Calls back (on the observer thread) when the signal file appears or is written."""
+        def __init__(self, signal_file, callback):
+            super().__init__()
+            self.signal_file = os.path.normcase(os.path.abspath(signal_file))
+            self.callback = callback
+
+        def _check(self, path):
+            if os.path.normcase(os.path.abspath(path)) == self.signal_file:
+                self.callback()
+
+        def on_created(self, event):
+            self._check(event.src_path)
+
+        def on_modified(self, event):
+            self._check(event.src_path)
+
+        def on_moved(self, event):
+            self._check(event.dest_path)
+
+
+if HAS_INOTIFY:
+    _IN_MODIFY = 0x002
+    _IN_MOVED_TO = 0x080
+    _IN_CREATE = 0x100
+    _IN_NONBLOCK = os.O_NONBLOCK
+    _IN_CLOEXEC = os.O_CLOEXEC
+    _EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len (then the name)
+
+    class _InotifyWatcher:
+        """Minimal inotify stand-in for watchdog's Observer: start()/stop() and a callback."""
+        def __init__(self, signal_file, callback):
+            self.name = os.fsencode(os.path.basename(signal_file))
+            self.callback = callback
+            fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            folder = os.fsencode(os.path.dirname(signal_file))
+            if _libc.inotify_add_watch(fd, folder, _IN_CREATE | _IN_MODIFY | _IN_MOVED_TO) < 0:
+                err = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(err, "inotify_add_watch failed")
+            self._fd = fd
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="overlay-inotify", daemon=True)
+
+        def start(self):
+            self._thread.start()
+
+        def stop(self):
+            # The thread notices within a second and closes the fd itself
+            self._stopped.set()
+
+        def _matches(self, data):
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                if data[offset:offset + length].rstrip(b"\0") == self.name:
+                    return True
+                offset += length
+            return False
+
+        def _run(self):
+            fd = self._fd
+            try:
+                while not self._stopped.is_set():
+                    ready, _, _ = select.select([fd], [], [], 1.0)
+                    if not ready:
+                        continue
+                    try:
+                        data = os.read(fd, 4096)
+                    except BlockingIOError:
+                        continue
+                    if self._matches(data) and not self._stopped.is_set():
+                        self.callback()
+            except Exception as e:
+                logging.warning("inotify watcher stopped: %s", e)
+            finally:
+                os.close(fd)
+
+
+@functools.cache
+def _signal_file_path():
+    """Path of the kill signal file (fixed for the process), or None if unavailable."""
+    try:
+        from core.utils import get_signal_file_path
+    except ImportError:
+        logging.error("Could not import get_signal_file_path")
+        return None
+    return get_signal_file_path()
+
 
 class BlackBoxOverlay(tk.Toplevel):
     def __init__(self, master, on_close=None, opacity=1.0):
         super().__init__(master)
         self.on_close_callback = on_close
+        self.active = True  # False while withdrawn by hide()
         self.attributes('-fullscreen', True)
         self.attributes('-topmost', True)
         self.config(bg='black', cursor='none')
         
         # Windows specific fix for fullscreen coverage
-        if hasattr(sys, 'platform') and sys.platform == 'win32':
+        if IS_WIN32:
              self.state('zoomed')
              self.geometry(f"{self.winfo_screenwidth()}x{self.winfo_screenheight()}+0+0")
              self.overrideredirect(True)
+        # Fullscreen/topmost only need re-applying once the window was unmapped
+        self._fullscreen_applied = True
+        self.bind('<Unmap>', self._on_unmap)
         
-        # Opacity handling (Windows/Linux support varies)
+        # Opacity handling (Windows/Linux support varies); straight to Tk, skipping the wm wrapper
+        self._set_alpha = functools.partial(self.tk.call, 'wm', 'attributes', self._w, '-alpha')
         try:
-            self.attributes('-alpha', opacity)
+            self._set_alpha(opacity)
         except Exception:
             logging.warning("Opacity adjustment not supported on this platform/configuration")
 
-        # Bindings to close (Emergency Exit)
-        self.bind('<Escape>', self.close_overlay)
+        # Bindings to close (Emergency Exit): Escape/Shift keys or a click
+        self.bind('<Key>', self._on_key)
         self.bind('<Button-1>', self.close_overlay) # Click to exit
-        self.bind('<Shift_L>', self.close_overlay) # Shift key to exit
-        self.bind('<Shift_R>', self.close_overlay) # Right Shift too
         
         # Prevent closing via Alt+F4 easily
         self.protocol("WM_DELETE_WINDOW", lambda: None)
         
         # Start checking for kill signal
+        self._observer = None
+        self._signal_file = _signal_file_path()
+        if self._signal_file:
+            logging.info("BlackBoxOverlay watching for signal at: %s", self._signal_file)
+            self._start_observer(self._signal_file)
+
+        # The first check is armed by show()
+        self._poll_interval = POLL_MIN_MS
+        self._signal_after_id = None
+        if self._observer is None:
+            self.bind('<Motion>', self._on_activity)
+
+    def _start_observer(self, signal_file):
+        """Watch the signal file's folder so the overlay closes as soon as it is written."""
+        if not (HAS_WATCHDOG or HAS_INOTIFY):
+            return
         try:
-            from core.utils import get_signal_file_path
-            logging.info(f"BlackBoxOverlay watching for signal at: {get_signal_file_path()}")
-        except ImportError:
-            logging.error("Could not import get_signal_file_path")
+            if HAS_WATCHDOG:
+                observer = Observer()
+                handler = _SignalFileHandler(signal_file, self._on_signal_event)
+                observer.schedule(handler, os.path.dirname(signal_file), recursive=False)
+                observer.daemon = True
+            else:
+                observer = _InotifyWatcher(signal_file, self._on_signal_event)
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            logging.warning("File watcher unavailable, polling for kill signal instead: %s", e)
 
-        # Give it a moment before checking (avoid race conditions with cleanup)
-        self.after(2000, self.check_kill_signal)
+    def _on_signal_event(self):
+        # Observer thread: hand the check over to the Tk thread
+        try:
+            self.after(0, self.check_kill_signal)
+        except (RuntimeError, tk.TclError):
+            pass  # Overlay already gone
 
     def show(self):
         """Show the overlay and ensure it is visible."""
+        if not self.active:
+            # Coming back from hide()
+            self.active = True
+            self._poll_interval = POLL_MIN_MS
+        if self._signal_after_id is None:
+            # Give it a moment before checking (avoid race conditions with cleanup).
+            # With a file watcher this is a one-off catch-up check; otherwise it
+            # starts the poll, which backs off until there is input on the overlay.
+            self._signal_after_id = self.after(2000, self.check_kill_signal)
         try:
             self.deiconify()
             self.lift()
             self.focus_force()
             self.update_idletasks()
             
-            # Re-apply fullscreen to ensure it sticks
-            self.attributes('-fullscreen', True)
-            self.attributes('-topmost', True)
-            
-            # Windows specific re-application
-            if hasattr(sys, 'platform') and sys.platform == 'win32':
-                 self.state('zoomed')
-                 self.overrideredirect(True)
+            if not self._fullscreen_applied:
+                # Re-apply fullscreen to ensure it sticks
+                self.attributes('-fullscreen', True)
+                self.attributes('-topmost', True)
+                
+                # Windows specific re-application
+                if IS_WIN32:
+                     self.state('zoomed')
+                     self.overrideredirect(True)
+                self._fullscreen_applied = True
                  
         except Exception as e:
-            logging.error(f"Error showing overlay: {e}")
+            logging.error("Error showing overlay: %s", e)
+
+    def hide(self):
+        """Withdraw the overlay but keep it around for the next show()."""
+        if not self.active:
+            return
+        self.active = False
+        if self._signal_after_id is not None:
+            self.after_cancel(self._signal_after_id)
+            self._signal_after_id = None
+        self.withdraw()
+
+    def _on_unmap(self, event):
+        if event.widget is self:
+            self._fullscreen_applied = False
 
     def check_kill_signal(self):
         """Check for a signal file to close the overlay."""
+        signal_file = self._signal_file
+        if not signal_file or not self.active or not self.winfo_exists():
+            return  # Hidden overlays leave the signal for the next launch to clear
+        # Consuming the file is the check: one unlink() whether or not it's there
         try:
-            from core.utils import get_signal_file_path
-            signal_file = get_signal_file_path()
-            if os.path.exists(signal_file):
-                logging.info(f"Kill signal detected at {signal_file}")
-                
-                # Try to remove or consume the file
-                try:
-                    os.remove(signal_file)
-                except Exception as e:
-                    logging.error(f"Failed to remove signal file: {e}")
-                    # Try to empty it at least, so we don't loop forever on next run
-                    try:
-                        with open(signal_file, 'w') as f: f.write("")
-                    except: pass
-                
-                # Always close if signal found
-                logging.info("Closing overlay due to signal.")
-                self.close_overlay()
-                return
-                
-        except Exception as e:
-            logging.error(f"Error checking kill signal: {e}")
+            os.unlink(signal_file)
+            found = True
+        except FileNotFoundError:
+            found = False
+        except OSError as e:
+            # It exists but can't be removed (e.g. still open by the writer on
+            # Windows); the next overlay launch clears stale signal files
+            logging.error("Failed to remove signal file: %s", e)
+            found = True
         
-        # Check again in 500ms
-        self.after(500, self.check_kill_signal)
+        if found:
+            # Always close if signal found
+            logging.info("Kill signal detected at %s", signal_file)
+            logging.info("Closing overlay due to signal.")
+            self.close_overlay()
+            return
+        
+        # No file watcher: check again, less often the longer nothing happens
+        if self._observer is None:
+            self._signal_after_id = self.after(self._poll_interval, self.check_kill_signal)
+            self._poll_interval = min(self._poll_interval * 2, POLL_MAX_MS)
+
+    def _on_key(self, event):
+        if event.keysym in CLOSE_KEYSYMS:
+            self.close_overlay(event)
+        elif self._observer is None:
+            self._on_activity(event)
+
+    def _on_activity(self, event=None):
+        """Input on the overlay: go back to polling quickly."""
+        if self._poll_interval == POLL_MIN_MS:
+            return  # Already polling fast (or still in the startup delay)
+        self._poll_interval = POLL_MIN_MS
+        if self._signal_after_id is not None:
+            self.after_cancel(self._signal_after_id)
+        self._signal_after_id = self.after(POLL_MIN_MS, self.check_kill_signal)
 
     def set_opacity(self, value):
         try:
-            self.attributes('-alpha', float(value))
-        except:
+            self._set_alpha(float(value))
+        except Exception:
             pass
 
+    def destroy(self):
+        # Reached via OverlayController.shutdown or when the app window goes away
+        self.active = False
+        if self._signal_after_id is not None:
+            # Cancelling an id that already fired is a no-op
+            self.after_cancel(self._signal_after_id)
+            self._signal_after_id = None
+        if self._observer is not None:
+            # No join: the observer may be waiting on this (Tk) thread in after()
+            self._observer.stop()
+            self._observer = None
+        super().destroy()
+
     def close_overlay(self, event=None):
         if self.on_close_callback:
             try:
                 self.on_close_callback()
             except Exception as e:
-                logging.error(f"Error in on_close_callback: {e}")
-        self.destroy()
+                logging.error("Error in on_close_callback: %s", e)
+        self.hide()
 
 class OverlayController:
     def __init__(self, root, on_close=None):
         self.root = root
         self.overlay = None
         self.on_close = on_close
+        # Clear anything left over from a previous run right away
+        self._clear_stale_signal()
+
+    @staticmethod
+    def _clear_stale_signal():
+        """Remove a stale signal file to prevent "Suicide on Launch"."""
+        signal_file = _signal_file_path()
+        if not signal_file:
+            return
+        try:
+            os.unlink(signal_file)
+            logging.info("OverlayController: Removed stale signal file before launch.")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning("OverlayController: Failed to clean signal file: %s", e)
 
     def show_overlay(self):
         if not self.overlay or not self.overlay.winfo_exists():
-            # --- FIX: AGGRESSIVE CLEANUP ---
-            # Remove any stale signal file from previous runs to prevent "Suicide on Launch"
-            try:
-                from core.utils import get_signal_file_path
-                signal_file = get_signal_file_path()
-                if os.path.exists(signal_file):
-                    os.remove(signal_file)
-                    logging.info("OverlayController: Removed stale signal file before launch.")
-            except Exception as e:
-                logging.warning(f"OverlayController: Failed to clean signal file: {e}")
-                
+            # A kill command that ran while no overlay was up leaves the file behind
+            self._clear_stale_signal()
             self.overlay = BlackBoxOverlay(self.root, on_close=self._handle_overlay_closing)
             try:
                 # Force overlay to top and give focus
                 self.overlay.show()
-                self.overlay.update()
             except Exception as e:
-                logging.warning(f"Overlay mapping warning: {e}")
+                logging.warning("Overlay mapping warning: %s", e)
             logging.info("Black Box Overlay activated")
         else:
-             # Already exists, just make sure it's shown
+             # Reuse the existing window; make sure it's shown
+             if not self.overlay.active:
+                 self._clear_stale_signal()
              self.overlay.show()
              logging.info("Black Box Overlay reactivated")
 
     def _handle_overlay_closing(self):
         """Called when BlackBoxOverlay is closing (e.g. signal or Escape)."""
         logging.info("OverlayController received closing notification.")
-        self.overlay = None
         if self.on_close:
             self.on_close()
 
+    def is_shown(self):
+        return bool(self.overlay and self.overlay.active and self.overlay.winfo_exists())
+
     def hide_overlay(self):
-        if self.overlay and self.overlay.winfo_exists():
-            self.overlay.destroy()
-            self.overlay = None
+        if self.is_shown():
+            self.overlay.hide()
             logging.info("Black Box Overlay deactivated")
 
+    def shutdown(self):
+        """Destroy the overlay for good (called when the main window closes)."""
+        if self.overlay is not None:
+            if self.overlay.winfo_exists():
+                self.overlay.destroy()
+            self.overlay = None
+
     def toggle(self):
-        if self.overlay and self.overlay.winfo_exists():
+        if self.is_shown():
             self.hide_overlay()
         else:
             self.show_overlay()
@@ -1,6 +1,7 @@
 
 import tkinter as tk
 from tkinter import ttk
+from types import MappingProxyType
 
 
 THEMES = {
@@ -121,158 +122,186 @@ FONTS = {
     "mono": ("Consolas", 10)
 }
 
-def apply_theme(root, theme_name="Twilight"):
-    """Apply the selected theme to the global ttk style."""
-    global COLORS
-    
-    # Fallback if theme_name is invalid or None
-    if theme_name not in THEMES:
-        # Use the first available theme as fallback
-        theme_name = "Twilight"
-        
-    COLORS = THEMES[theme_name]
-        
-    style = ttk.Style(root)
-    style.theme_use('clam') 
+def _theme_specs(c):
+    """Build the (configure, map, option_add) argument lists for one palette."""
+    bg_dark, bg_card, bg_light = c['bg_dark'], c['bg_card'], c['bg_light']
+    primary, primary_var, secondary = c['primary'], c['primary_var'], c['secondary']
+    text_main, text_dim, border = c['text_main'], c['text_dim'], c['border']
+    accent_audio = c.get('accent_audio', bg_card)
+    accent_video = c.get('accent_video', bg_card)
+    accent_wait = c.get('accent_wait', bg_card)
+    font_body, font_h1, font_h2 = FONTS['body'], FONTS['h1'], FONTS['h2']
 
-    # General Frame/Label
-    style.configure('.', background=COLORS['bg_dark'], foreground=COLORS['text_main'], font=FONTS['body'])
-    style.configure('TFrame', background=COLORS['bg_dark'])
-    style.configure('Card.TFrame', background=COLORS['bg_card'], relief="flat")
-    style.configure('AudioCard.TFrame', background=COLORS.get('accent_audio', COLORS['bg_card']), relief="flat")
-    style.configure('VideoCard.TFrame', background=COLORS.get('accent_video', COLORS['bg_card']), relief="flat")
-    style.configure('WaitCard.TFrame', background=COLORS.get('accent_wait', COLORS['bg_card']), relief="flat")
-    
-    # Labels
-    style.configure('TLabel', background=COLORS['bg_dark'], foreground=COLORS['text_main'])
-    style.configure('Card.TLabel', background=COLORS['bg_card'], foreground=COLORS['text_main'])
-    style.configure('AudioCard.TLabel', background=COLORS.get('accent_audio', COLORS['bg_card']), foreground=COLORS['text_main'])
-    style.configure('VideoCard.TLabel', background=COLORS.get('accent_video', COLORS['bg_card']), foreground=COLORS['text_main'])
-    style.configure('WaitCard.TLabel', background=COLORS.get('accent_wait', COLORS['bg_card']), foreground=COLORS['text_main'])
-    style.configure('Header.TLabel', font=FONTS['h1'], foreground=COLORS['primary'])
-    style.configure('Subheader.TLabel', font=FONTS['h2'], foreground=COLORS['secondary'])
-    
-    # Buttons
-    style.configure('TButton', 
-        background=COLORS['primary'], 
-        foreground=COLORS['bg_dark'], 
-        borderwidth=0, 
-        font=("Segoe UI", 10, "bold"),
-        padding=(10, 5)
-    )
-    style.map('TButton', 
-        background=[('active', COLORS['bg_light']), ('pressed', COLORS['primary_var'])],
-        foreground=[('active', COLORS['text_main'])]
-    )
-    
-    # Action/Icon Buttons (smaller, darker)
-    style.configure('Icon.TButton', 
-        background=COLORS['bg_light'], 
-        foreground=COLORS['text_main'],
-        padding=(4, 2)
+    scrollbar = dict(
+        background=bg_card, 
+        troughcolor=bg_dark, 
+        bordercolor=bg_dark, 
+        arrowcolor=text_main,
+        arrowsize=18
     )
-    style.map('Icon.TButton', background=[('active', COLORS['border'])])
-
-    # Inputs
-    style.configure('TEntry', 
-        fieldbackground=COLORS['bg_light'], 
-        foreground=COLORS['text_main'], 
-        insertcolor=COLORS['text_main'],
-        borderwidth=1,
-        relief="flat"
+    configure = (
+        # General Frame/Label
+        ('.', dict(background=bg_dark, foreground=text_main, font=font_body)),
+        ('TFrame', dict(background=bg_dark)),
+        ('Card.TFrame', dict(background=bg_card, relief="flat")),
+        ('AudioCard.TFrame', dict(background=accent_audio, relief="flat")),
+        ('VideoCard.TFrame', dict(background=accent_video, relief="flat")),
+        ('WaitCard.TFrame', dict(background=accent_wait, relief="flat")),
+        # Labels
+        ('TLabel', dict(background=bg_dark, foreground=text_main)),
+        ('Card.TLabel', dict(background=bg_card, foreground=text_main)),
+        ('AudioCard.TLabel', dict(background=accent_audio, foreground=text_main)),
+        ('VideoCard.TLabel', dict(background=accent_video, foreground=text_main)),
+        ('WaitCard.TLabel', dict(background=accent_wait, foreground=text_main)),
+        ('Header.TLabel', dict(font=font_h1, foreground=primary)),
+        ('Subheader.TLabel', dict(font=font_h2, foreground=secondary)),
+        # Buttons
+        ('TButton', dict(
+            background=primary, 
+            foreground=bg_dark, 
+            borderwidth=0, 
+            font=("Segoe UI", 10, "bold"),
+            padding=(10, 5)
+        )),
+        # Action/Icon Buttons (smaller, darker)
+        ('Icon.TButton', dict(
+            background=bg_light, 
+            foreground=text_main,
+            padding=(4, 2)
+        )),
+        # Inputs
+        ('TEntry', dict(
+            fieldbackground=bg_light, 
+            foreground=text_main, 
+            insertcolor=text_main,
+            borderwidth=1,
+            relief="flat"
+        )),
+        # Notebook
+        ('TNotebook', dict(background=bg_dark, borderwidth=0)),
+        ('TNotebook.Tab', dict(
+            background=bg_card, 
+            foreground=text_dim,
+            padding=(15, 8), # Larger click area
+            font=font_h2
+        )),
+        # Treeview (Alarms List, File Lists)
+        ('Treeview', dict(
+            background=bg_light, 
+            foreground=text_main, 
+            fieldbackground=bg_light,
+            borderwidth=0,
+            font=font_body
+        )),
+        ('Treeview.Heading', dict(
+            background=bg_card, 
+            foreground=text_main, 
+            font=("Segoe UI", 10, "bold"),
+            relief="flat"
+        )),
+        # Combobox
+        ('TCombobox', dict(
+            fieldbackground=bg_light, 
+            background=bg_card, 
+            foreground=text_main,
+            arrowcolor=text_main,
+            borderwidth=1
+        )),
+        # Spinbox
+        ('TSpinbox', dict(
+            fieldbackground=bg_light, 
+            background=bg_card, 
+            foreground=text_main,
+            arrowcolor=text_main,
+            borderwidth=1
+        )),
+        # Scrollbars (Darker, bigger)
+        ("TScrollbar", scrollbar),
+        ("Vertical.TScrollbar", scrollbar),
     )
-    
-    # Notebook
-    style.configure('TNotebook', background=COLORS['bg_dark'], borderwidth=0)
-    style.configure('TNotebook.Tab', 
-        background=COLORS['bg_card'], 
-        foreground=COLORS['text_dim'],
-        padding=(15, 8), # Larger click area
-        font=FONTS['h2']
+    maps = (
+        ('TButton', dict(
+            background=(('active', bg_light), ('pressed', primary_var)),
+            foreground=(('active', text_main),)
+        )),
+        ('Icon.TButton', dict(background=(('active', border),))),
+        ('TNotebook.Tab', dict(
+            background=(('selected', primary), ('active', bg_light)),
+            foreground=(('selected', bg_dark), ('active', text_main))
+        )),
+        ('Treeview', dict(
+            background=(('selected', primary_var),), 
+            foreground=(('selected', text_main),)
+        )),
+        ('Treeview.Heading', dict(background=(('active', bg_light),))),
+        ('TCombobox', dict(
+            fieldbackground=(('readonly', bg_light),), 
+            selectbackground=(('readonly', primary),), 
+            selectforeground=(('readonly', bg_dark),)
+        )),
+        ('TSpinbox', dict(
+            fieldbackground=(('readonly', bg_light),), 
+            selectbackground=(('focus', primary),), 
+            selectforeground=(('focus', bg_dark),)
+        )),
     )
-    style.map('TNotebook.Tab', 
-        background=[('selected', COLORS['primary']), ('active', COLORS['bg_light'])],
-        foreground=[('selected', COLORS['bg_dark']), ('active', COLORS['text_main'])]
+    # Global Tkinter defaults
+    options = (
+        ('*background', bg_dark),
+        ('*foreground', text_main),
+        ('*Entry.background', bg_light),
+        ('*Entry.foreground', text_main),
+        ('*Entry.insertBackground', text_main), # Cursor color
+        ('*Text.background', bg_light),
+        ('*Text.foreground', text_main),
+        ('*Text.insertBackground', text_main), # Cursor color
+        ('*Listbox.background', bg_light),
+        ('*Listbox.foreground', text_main),
+        ('*Listbox.selectBackground', primary_var),
+        ('*Listbox.selectForeground', text_main),
+        ('*Spinbox.background', bg_light),
+        ('*Spinbox.foreground', text_main),
+        ('*Spinbox.buttonBackground', bg_card),
     )
+    return configure, maps, options
 
-    # Treeview (Alarms List, File Lists)
-    style.configure('Treeview', 
-        background=COLORS['bg_light'], 
-        foreground=COLORS['text_main'], 
-        fieldbackground=COLORS['bg_light'],
-        borderwidth=0,
-        font=FONTS['body']
-    )
-    style.map('Treeview', 
-        background=[('selected', COLORS['primary_var'])], 
-        foreground=[('selected', COLORS['text_main'])]
-    )
-    style.configure('Treeview.Heading', 
-        background=COLORS['bg_card'], 
-        foreground=COLORS['text_main'], 
-        font=("Segoe UI", 10, "bold"),
-        relief="flat"
-    )
-    style.map('Treeview.Heading', background=[('active', COLORS['bg_light'])])
 
-    # Combobox
-    style.configure('TCombobox', 
-        fieldbackground=COLORS['bg_light'], 
-        background=COLORS['bg_card'], 
-        foreground=COLORS['text_main'],
-        arrowcolor=COLORS['text_main'],
-        borderwidth=1
-    )
-    style.map('TCombobox', 
-        fieldbackground=[('readonly', COLORS['bg_light'])], 
-        selectbackground=[('readonly', COLORS['primary'])], 
-        selectforeground=[('readonly', COLORS['bg_dark'])]
-    )
+def _option_script(options):
+    """One Tcl script that adds all option database entries in a single eval."""
+    return "\n".join(f"option add {{{pattern}}} {{{value}}}" for pattern, value in options)
 
-    # Spinbox
-    style.configure('TSpinbox', 
-        fieldbackground=COLORS['bg_light'], 
-        background=COLORS['bg_card'], 
-        foreground=COLORS['text_main'],
-        arrowcolor=COLORS['text_main'],
-        borderwidth=1
-    )
-    style.map('TSpinbox', 
-        fieldbackground=[('readonly', COLORS['bg_light'])], 
-        selectbackground=[('focus', COLORS['primary'])], 
-        selectforeground=[('focus', COLORS['bg_dark'])]
-    )
 
-    # Scrollbars (Darker, bigger)
-    style.configure("TScrollbar", 
-        background=COLORS['bg_card'], 
-        troughcolor=COLORS['bg_dark'], 
-        bordercolor=COLORS['bg_dark'], 
-        arrowcolor=COLORS['text_main'],
-        arrowsize=18
-    )
-    style.configure("Vertical.TScrollbar", 
-        background=COLORS['bg_card'], 
-        troughcolor=COLORS['bg_dark'], 
-        bordercolor=COLORS['bg_dark'], 
-        arrowcolor=COLORS['text_main'],
-        arrowsize=18
-    )
+# Palettes are read-only from here on; their style calls are built once at import
+THEMES = {name: MappingProxyType(colors) for name, colors in THEMES.items()}
+COLORS = THEMES["Twilight"]
+_THEME_SPECS = {name: _theme_specs(colors) for name, colors in THEMES.items()}
+_OPTION_SCRIPTS = {name: _option_script(specs[2]) for name, specs in _THEME_SPECS.items()}
+
+
+def apply_theme(root, theme_name="Twilight"):
+    """Apply the selected theme to the global ttk style."""
+    global COLORS
+    
+    COLORS = THEMES.get(theme_name)
+    if COLORS is None:
+        # Fallback if theme_name is invalid or None
+        theme_name = "Twilight"
+        COLORS = THEMES[theme_name]
+    configure, maps, options = _THEME_SPECS[theme_name]
+        
+    style = ttk.Style(root)
+    style.theme_use('clam') 
+
+    for name, kw in configure:
+        style.configure(name, **kw)
+    for name, kw in maps:
+        style.map(name, **kw)
     
-    # Global Tkinter defaults
     root.configure(bg=COLORS['bg_dark'])
-    root.option_add('*background', COLORS['bg_dark'])
-    root.option_add('*foreground', COLORS['text_main'])
-    root.option_add('*Entry.background', COLORS['bg_light'])
-    root.option_add('*Entry.foreground', COLORS['text_main'])
-    root.option_add('*Entry.insertBackground', COLORS['text_main']) # Cursor color
-    root.option_add('*Text.background', COLORS['bg_light'])
-    root.option_add('*Text.foreground', COLORS['text_main'])
-    root.option_add('*Text.insertBackground', COLORS['text_main']) # Cursor color
-    root.option_add('*Listbox.background', COLORS['bg_light'])
-    root.option_add('*Listbox.foreground', COLORS['text_main'])
-    root.option_add('*Spinbox.background', COLORS['bg_light'])
-    root.option_add('*Spinbox.foreground', COLORS['text_main'])
-    root.option_add('*Spinbox.buttonBackground', COLORS['bg_card'])
+    try:
+        root.tk.eval(_OPTION_SCRIPTS[theme_name])
+    except tk.TclError:
+        for pattern, value in options:
+            root.option_add(pattern, value)
     
     return style